@@ -0,0 +1,120 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from django.utils.decorators import classonlymethod
+from django.views.decorators.csrf import csrf_exempt
+from django.views import View
+from rest_framework.response import Response
+
+from .models import Task
+from .views import TaskViewSet
+
+
+class AsyncTaskView(View):
+  """
+  ``list`` y ``retrieve`` de tareas con el ORM asíncrono, para servirlos con
+  la aplicación ASGI sin ocupar un hilo mientras se espera a la base de datos.
+
+  Usa una instancia de ``TaskViewSet`` para todo lo que no es E/S (filtros,
+  orden, cursor, serializador, validadores HTTP, negociación y errores), así
+  que las respuestas son las mismas que las de la vista síncrona; solo las
+  consultas se hacen con ``aaggregate``, ``aiterator``, ``afirst`` y ``aget``.
+  La autenticación pasa por ``sync_to_async`` (normalmente es un acierto de
+  la caché de tokens). El resto de métodos se delega en ``TaskViewSet``.
+
+  No pasa por la caché de listados de ``CachedListMixin``: aquí esperar a la
+  base de datos no bloquea un hilo, que es lo que esa caché compensa.
+  """
+
+  viewset_class = TaskViewSet
+  detail = False
+  # Vista síncrona de ``viewset_class`` para los métodos de escritura.
+  sync_view = None
+  not_found_message = "No Task matches the given query."
+
+  @classonlymethod
+  def as_view(cls, **initkwargs):
+    if initkwargs.get("detail", cls.detail):
+      actions = {
+        "get": "retrieve",
+        "put": "update",
+        "patch": "partial_update",
+        "delete": "destroy",
+      }
+    else:
+      actions = {"get": "list", "post": "create"}
+    sync_view = cls.viewset_class.as_view(actions)
+    # Como las vistas de DRF: la autenticación por token no usa cookies.
+    return csrf_exempt(super().as_view(sync_view=sync_view, **initkwargs))
+
+  async def get(self, request, *args, **kwargs):
+    action = "retrieve" if self.detail else "list"
+    viewset = self.viewset_class(action_map={"get": action}, format_kwarg=None)
+    viewset.setup(request, *args, **kwargs)
+    viewset.action = action
+    drf_request = viewset.initialize_request(request, *args, **kwargs)
+    viewset.request = drf_request
+    viewset.headers = viewset.default_response_headers
+    try:
+      await sync_to_async(viewset.initial)(drf_request, *args, **kwargs)
+      if self.detail:
+        response = await self.retrieve(viewset, drf_request, **kwargs)
+      else:
+        response = await self.list(viewset, drf_request)
+    except Exception as exc:
+      response = viewset.handle_exception(exc)
+    response = viewset.finalize_response(drf_request, response, *args, **kwargs)
+    if isinstance(response, Response):
+      response.render()
+    return response
+
+  async def list(self, viewset, request):
+    queryset = viewset.filter_queryset(viewset.get_queryset())
+    state = await queryset.order_by().aaggregate(**viewset.list_state)
+    etag = viewset.make_list_etag(request, state)
+    not_modified = viewset.get_not_modified(request, etag)
+    if not_modified is not None:
+      return not_modified
+
+    paginator = viewset.paginator
+    page_queryset = paginator.get_page_queryset(queryset, request, viewset)
+    encoder = viewset.get_row_encoder()
+    if encoder is not None:
+      page_queryset = viewset.get_encoded_page_queryset(page_queryset, encoder)
+    rows = [row async for row in page_queryset.aiterator()]
+    page = paginator.paginate_rows(rows, request)
+    if encoder is not None:
+      data = encoder.encode_many(page)
+    else:
+      data = viewset.get_serializer(page, many=True).data
+    return viewset.set_validators(viewset.get_paginated_response(data), etag)
+
+  async def retrieve(self, viewset, request, **kwargs):
+    lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+    queryset = viewset.filter_queryset(viewset.get_queryset())
+    # Mismos 404 que ``get_object_or_404`` de DRF en la vista síncrona.
+    try:
+      queryset = queryset.filter(**{viewset.lookup_field: kwargs[lookup_url_kwarg]})
+      updated_at = await queryset.values_list("updated_at", flat=True).afirst()
+    except (TypeError, ValueError, ValidationError):
+      raise Http404
+    if updated_at is None:
+      raise Http404(self.not_found_message)
+
+    etag, last_modified = viewset.get_object_validators(request, updated_at, **kwargs)
+    not_modified = viewset.get_not_modified(request, etag, last_modified)
+    if not_modified is not None:
+      return not_modified
+
+    try:
+      task = await queryset.aget()
+    except Task.DoesNotExist:
+      raise Http404(self.not_found_message)
+    viewset.check_object_permissions(request, task)
+    serializer = viewset.get_serializer(task)
+    return viewset.set_validators(Response(serializer.data), etag, last_modified)
+
+  async def delegate(self, request, *args, **kwargs):
+    return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+
+  post = put = patch = delete = delegate
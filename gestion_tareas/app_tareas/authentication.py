@@ -0,0 +1,77 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from . import routers
+
+
+def token_cache_key(key):
+  """
+  Clave de caché de un token. Se guarda el hash para no dejar los tokens en
+  claro en un backend compartido.
+  """
+  digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+  return f"auth-token:{digest}"
+
+
+def get_token_cache():
+  return caches[settings.AUTH_TOKEN_CACHE_ALIAS]
+
+
+def invalidate_tokens(*keys):
+  """
+  Elimina de la caché la resolución token→usuario de las claves dadas.
+
+  Como ``list_cache.invalidate``: al momento y otra vez al confirmar la
+  transacción, porque hasta el ``COMMIT`` otra petición todavía lee el token
+  o el usuario activo y podría volver a cachearlo.
+  """
+  if not keys:
+    return
+  cache_keys = [token_cache_key(key) for key in keys]
+  get_token_cache().delete_many(cache_keys)
+  transaction.on_commit(lambda: get_token_cache().delete_many(cache_keys))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+  """
+  ``TokenAuthentication`` que guarda en caché la resolución token→usuario.
+
+  Solo se cachean tokens válidos de usuarios activos, durante
+  ``AUTH_TOKEN_CACHE_TIMEOUT`` segundos. Las señales de ``signals.py`` borran
+  la entrada cuando el token se elimina o regenera y cuando el usuario cambia
+  (por ejemplo, al desactivarlo). Ese borrado solo llega a todos los procesos
+  con una caché compartida; con ``AUTH_TOKEN_CACHE`` desactivado (el valor
+  por defecto con LocMemCache y varios workers) se consulta siempre la base
+  de datos.
+  """
+
+  def authenticate_credentials(self, key):
+    if not settings.AUTH_TOKEN_CACHE:
+      return self.authenticate_token(key)
+
+    cache = get_token_cache()
+    cache_key = token_cache_key(key)
+    cached = cache.get(cache_key)
+    if cached is not None:
+      return cached
+
+    user, token = self.authenticate_token(key)
+    cache.set(
+      cache_key, (user, token), routers.cache_timeout(settings.AUTH_TOKEN_CACHE_TIMEOUT)
+    )
+    return user, token
+
+  def authenticate_token(self, key):
+    try:
+      return super().authenticate_credentials(key)
+    except AuthenticationFailed:
+      if not routers.reading_from_replica():
+        raise
+      # Un token recién creado puede no haber llegado todavía a la réplica.
+      with routers.use_primary():
+        return super().authenticate_credentials(key)
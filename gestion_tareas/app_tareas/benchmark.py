@@ -0,0 +1,126 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from django.db import transaction
+
+
+def percentile(values, pct):
+  """
+  Percentil ``pct`` (0-100) por el método del rango más cercano.
+  """
+  if not values:
+    return 0.0
+  ordered = sorted(values)
+  index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+  return ordered[index]
+
+
+def summarize(label, latencies, elapsed):
+  """
+  Resumen de una tanda: peticiones por segundo y latencias en milisegundos.
+  """
+  return {
+    "label": label,
+    "requests": len(latencies),
+    "rps": len(latencies) / elapsed if elapsed else 0.0,
+    "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+    "p50_ms": percentile(latencies, 50) * 1000,
+    "p99_ms": percentile(latencies, 99) * 1000,
+  }
+
+
+def format_summary(summary):
+  return (
+    f"{summary['label']:<24} {summary['requests']:>6} peticiones  "
+    f"{summary['rps']:>9.1f} req/s  media {summary['mean_ms']:>8.2f} ms  "
+    f"p50 {summary['p50_ms']:>8.2f} ms  p99 {summary['p99_ms']:>8.2f} ms"
+  )
+
+
+def run_threaded(call, total, concurrency):
+  """
+  Ejecuta ``call()`` ``total`` veces desde ``concurrency`` hilos (como un
+  servidor WSGI con ese número de hilos) y devuelve ``(latencias, segundos)``.
+  """
+
+  def timed(_):
+    start = time.perf_counter()
+    call()
+    return time.perf_counter() - start
+
+  start = time.perf_counter()
+  with ThreadPoolExecutor(max_workers=concurrency) as executor:
+    latencies = list(executor.map(timed, range(total)))
+  return latencies, time.perf_counter() - start
+
+
+def run_concurrent(call, total, concurrency):
+  """
+  Ejecuta la corrutina ``call()`` ``total`` veces con ``concurrency`` en curso
+  a la vez en un único bucle (como un worker ASGI) y devuelve
+  ``(latencias, segundos)``.
+  """
+
+  async def main():
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed():
+      async with semaphore:
+        start = time.perf_counter()
+        await call()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(timed() for _ in range(total)))
+    return list(latencies), time.perf_counter() - start
+
+  return asyncio.run(main())
+
+
+def median_ms(call, repeat):
+  """
+  Mediana en milisegundos de ``repeat`` ejecuciones de ``call()``.
+  """
+  timings = []
+  for _ in range(repeat):
+    start = time.perf_counter()
+    call()
+    timings.append(time.perf_counter() - start)
+  return statistics.median(timings) * 1000
+
+
+class MissingTasks(Exception):
+  pass
+
+
+@contextmanager
+def temporary_tasks(total, create=False):
+  """
+  Garantiza ``total`` tareas dentro de una transacción que se deshace al
+  salir: con ``create`` se crean las que falten; sin él, si faltan se lanza
+  ``MissingTasks`` con cuántas.
+  """
+  from .models import Task
+
+  with transaction.atomic():
+    missing = total - Task.objects.count()
+    if missing > 0:
+      if not create:
+        raise MissingTasks(missing)
+      start = date(2024, 1, 1)
+      Task.objects.bulk_create(
+        Task(
+          name=f"Tarea de prueba {i}",
+          description="Descripción de la tarea de prueba " * 4,
+          state=Task.StateChoices.get_workflow()[i % 5],
+          priority=Task.PriorityChoices.get_ordering()[i % 3],
+          due_date=start + timedelta(days=i % 365),
+        )
+        for i in range(missing)
+      )
+    yield
+    transaction.set_rollback(True)
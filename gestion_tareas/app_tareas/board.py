@@ -0,0 +1,59 @@
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+
+from .models import Task
+
+# Orden de las tarjetas dentro de cada columna (el del listado).
+CARD_ORDERING = ("due_date", "priority_rank", "id")
+
+
+def count_by_state(queryset):
+  """
+  Número de tareas por estado con un único ``GROUP BY``.
+  """
+  rows = queryset.order_by().values_list("state").annotate(total=Count("id"))
+  return dict(rows)
+
+
+def top_cards(queryset, limit, encoder=None):
+  """
+  Las ``limit`` primeras tareas de cada estado, con ``ROW_NUMBER()`` por
+  estado en una sola consulta, agrupadas por estado. Con ``encoder`` son
+  filas de sus columnas en lugar de instancias.
+  """
+  ranked = (
+    queryset.order_by()
+    .annotate(
+      board_position=Window(
+        RowNumber(),
+        partition_by=[F("state")],
+        order_by=[F(name).asc() for name in CARD_ORDERING],
+      )
+    )
+    .filter(board_position__lte=limit)
+    .order_by("state", "board_position")
+  )
+  if encoder is not None:
+    ranked = encoder.values(ranked, "state")
+  cards = {}
+  for task in ranked:
+    cards.setdefault(task.state, []).append(task)
+  return cards
+
+
+def build_board(queryset, limit, encoder=None):
+  """
+  Columnas del tablero en el orden del flujo: estado, etiqueta, total y las
+  primeras ``limit`` tarjetas.
+  """
+  counts = count_by_state(queryset)
+  cards = top_cards(queryset, limit, encoder)
+  return [
+    {
+      "state": state.value,
+      "label": state.label,
+      "count": counts.get(state.value, 0),
+      "cards": cards.get(state.value, []),
+    }
+    for state in Task.StateChoices.get_workflow()
+  ]
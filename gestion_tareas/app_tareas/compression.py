@@ -0,0 +1,159 @@
+import zlib
+
+from django.conf import settings
+
+try:
+  import brotli
+except ImportError:  # Opcional: solo se ofrece si está instalado.
+  brotli = None
+
+try:
+  import zstandard
+except ImportError:  # Opcional: solo se ofrece si está instalado.
+  zstandard = None
+
+
+class GzipCompressor:
+  def __init__(self, level):
+    # wbits 31: formato gzip (cabecera y CRC), no zlib.
+    self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+  def compress(self, data):
+    return self.compressor.compress(data)
+
+  def finish(self):
+    return self.compressor.flush()
+
+
+class BrotliCompressor:
+  def __init__(self, level):
+    self.compressor = brotli.Compressor(quality=level)
+
+  def compress(self, data):
+    return self.compressor.process(data)
+
+  def finish(self):
+    return self.compressor.finish()
+
+
+class ZstdCompressor:
+  def __init__(self, level):
+    # Con el tamaño desconocido (respuestas en streaming) el marco no lo
+    # lleva en la cabecera; los clientes lo aceptan igual.
+    self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+  def compress(self, data):
+    return self.compressor.compress(data)
+
+  def finish(self):
+    return self.compressor.flush()
+
+
+# Bytes de una respuesta en streaming que se agrupan antes de comprimirlos.
+STREAM_BUFFER_SIZE = 16 * 1024
+
+# Codificaciones en orden de preferencia del servidor ante empates de ``q``.
+COMPRESSORS = {
+  "zstd": ZstdCompressor if zstandard is not None else None,
+  "br": BrotliCompressor if brotli is not None else None,
+  "gzip": GzipCompressor,
+}
+
+
+def available_encodings():
+  """
+  Codificaciones de ``COMPRESSION_ENCODINGS`` cuya biblioteca está instalada.
+  """
+  return [
+    name for name in settings.COMPRESSION_ENCODINGS if COMPRESSORS.get(name) is not None
+  ]
+
+
+def parse_accept_encoding(header):
+  """
+  ``{codificación: q}`` de una cabecera ``Accept-Encoding``.
+  """
+  accepted = {}
+  for item in header.split(","):
+    name, _, params = item.strip().partition(";")
+    name = name.strip().lower()
+    if not name:
+      continue
+    quality = 1.0
+    for param in params.split(";"):
+      key, _, value = param.strip().partition("=")
+      if key.strip().lower() == "q":
+        try:
+          quality = float(value)
+        except ValueError:
+          quality = 0.0
+    accepted[name] = quality
+  return accepted
+
+
+def choose_encoding(header, encodings=None):
+  """
+  La codificación que se usará para una petición con ``Accept-Encoding:
+  header``: la de mayor ``q`` entre las disponibles y, a igualdad, la primera
+  de ``encodings``. ``None`` si el cliente no acepta ninguna.
+  """
+  accepted = parse_accept_encoding(header or "")
+  best, best_quality = None, 0.0
+  for name in available_encodings() if encodings is None else encodings:
+    quality = accepted.get(name, accepted.get("*", 0.0))
+    if quality > best_quality:
+      best, best_quality = name, quality
+  return best
+
+
+def get_compressor(encoding, level=None):
+  if level is None:
+    level = settings.COMPRESSION_LEVELS[encoding]
+  return COMPRESSORS[encoding](level)
+
+
+def compress(data, encoding, level=None):
+  compressor = get_compressor(encoding, level)
+  return compressor.compress(data) + compressor.finish()
+
+
+def compress_stream(chunks, encoding, level=None, buffer_size=None):
+  """
+  Comprime una respuesta en streaming sin acumularla entera. Las líneas de
+  una exportación son pequeñas: se agrupan en bloques de ``buffer_size``
+  bytes antes de pasarlas al compresor (brotli en los niveles bajos emite un
+  bloque por llamada, y con una línea por llamada apenas comprime).
+  """
+  compressor = get_compressor(encoding, level)
+  for block in _blocks(chunks, buffer_size or STREAM_BUFFER_SIZE):
+    data = compressor.compress(block)
+    if data:
+      yield data
+  yield compressor.finish()
+
+
+async def acompress_stream(chunks, encoding, level=None, buffer_size=None):
+  compressor = get_compressor(encoding, level)
+  buffer_size = buffer_size or STREAM_BUFFER_SIZE
+  buffer, size = [], 0
+  async for chunk in chunks:
+    buffer.append(chunk)
+    size += len(chunk)
+    if size >= buffer_size:
+      data = compressor.compress(b"".join(buffer))
+      buffer, size = [], 0
+      if data:
+        yield data
+  yield compressor.compress(b"".join(buffer)) + compressor.finish()
+
+
+def _blocks(chunks, buffer_size):
+  buffer, size = [], 0
+  for chunk in chunks:
+    buffer.append(chunk)
+    size += len(chunk)
+    if size >= buffer_size:
+      yield b"".join(buffer)
+      buffer, size = [], 0
+  if buffer:
+    yield b"".join(buffer)
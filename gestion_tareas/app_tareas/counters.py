@@ -0,0 +1,104 @@
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models import Count, F
+
+from .models import Task, TaskCounter
+from .routers import use_primary
+
+
+def diff(before=(), after=()):
+  """
+  Variación de los contadores por una escritura: ``-1`` por cada par
+  ``(state, assigned_user_id)`` de ``before`` y ``+1`` por cada uno de
+  ``after``. Los pares que no cambian se anulan.
+  """
+  deltas = Counter(after)
+  deltas.subtract(before)
+  return deltas
+
+
+def apply(deltas):
+  """
+  Suma ``deltas`` (``{(state, user_id): variación}``) a ``TaskCounter`` con un
+  ``UPDATE count = count + n`` por par, dentro de la transacción en curso.
+
+  Los pares se recorren siempre en el mismo orden para que dos escrituras
+  concurrentes no se bloqueen mutuamente; los contadores que aún no existen
+  se crean a cero (``ignore_conflicts``, por si otro proceso se adelanta).
+  """
+  keys = sorted(
+    (key for key, delta in deltas.items() if delta),
+    key=lambda key: (key[0], key[1] or 0),
+  )
+  missing = [key for key in keys if not _add(key, deltas[key])]
+  if missing:
+    TaskCounter.objects.bulk_create(
+      [TaskCounter(state=state, user_id=user_id) for state, user_id in missing],
+      ignore_conflicts=True,
+    )
+    for key in missing:
+      _add(key, deltas[key])
+
+
+def _add(key, delta):
+  state, user_id = key
+  return TaskCounter.objects.filter(state=state, user_id=user_id).update(
+    count=F("count") + delta
+  )
+
+
+def count_tasks(queryset=None):
+  """
+  Tareas por ``(state, assigned_user_id)`` contadas en la base de datos
+  principal, con un ``GROUP BY``.
+  """
+  if queryset is None:
+    queryset = Task.objects.all()
+  with use_primary():
+    rows = (
+      queryset.order_by()
+      .values_list("state", "assigned_user_id")
+      .annotate(total=Count("id"))
+    )
+    return {(state, user_id): total for state, user_id, total in rows}
+
+
+def reconcile(dry_run=False):
+  """
+  Recalcula ``TaskCounter`` desde las tareas y devuelve las diferencias
+  encontradas como ``[(state, user_id, guardado, real)]``.
+
+  En PostgreSQL bloquea la tabla de contadores frente a escrituras mientras
+  cuenta: una escritura de tareas en curso espera y suma su variación sobre
+  el valor ya corregido, así que no se pierde ninguna.
+
+  Todo se lee del primario, donde se bloquea y se escribe: una réplica con
+  retraso daría diferencias falsas.
+  """
+  with use_primary(), transaction.atomic():
+    if connection.vendor == "postgresql" and not dry_run:
+      with connection.cursor() as cursor:
+        cursor.execute(
+          f"LOCK TABLE {connection.ops.quote_name(TaskCounter._meta.db_table)} "
+          "IN EXCLUSIVE MODE"
+        )
+    actual = count_tasks()
+    stored = {
+      (counter.state, counter.user_id): counter
+      for counter in TaskCounter.objects.all()
+    }
+    differences = []
+    for key in sorted(set(actual) | set(stored), key=lambda key: (key[1] or 0, key[0])):
+      counter = stored.get(key)
+      current = counter.count if counter is not None else 0
+      if current != actual.get(key, 0):
+        differences.append((key[0], key[1], current, actual.get(key, 0)))
+    if not dry_run:
+      for state, user_id, current, total in differences:
+        counter = stored.get((state, user_id))
+        if counter is None:
+          TaskCounter.objects.create(state=state, user_id=user_id, count=total)
+        else:
+          TaskCounter.objects.filter(pk=counter.pk).update(count=total)
+  return differences
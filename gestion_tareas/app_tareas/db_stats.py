@@ -0,0 +1,48 @@
+import threading
+import time
+
+from django.db import DatabaseError, connections
+
+_lock = threading.Lock()
+_connects = {}
+
+
+def record_connect(alias):
+  with _lock:
+    _connects[alias] = _connects.get(alias, 0) + 1
+
+
+def database_stats():
+  """
+  Estado de las conexiones de este proceso a cada base de datos.
+
+  ``connects`` cuenta las conexiones que ha abierto Django (con pool, las que
+  ha tomado del pool): si crece con cada petición las conexiones no se están
+  reutilizando. Con pool se añaden las estadísticas de ``psycopg_pool``
+  (``pool_size``, ``pool_available``, ``requests_waiting``,
+  ``requests_wait_ms``...). ``ping_ms`` es lo que tarda un ``SELECT 1``,
+  incluida la conexión si hay que abrirla.
+  """
+  stats = {}
+  for alias in connections:
+    connection = connections[alias]
+    start = time.perf_counter()
+    try:
+      with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+      healthy = True
+    except DatabaseError:
+      healthy = False
+    ping_ms = (time.perf_counter() - start) * 1000
+
+    pool = getattr(connection, "pool", None)
+    stats[alias] = {
+      "vendor": connection.vendor,
+      "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+      "health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+      "connects": _connects.get(alias, 0),
+      "healthy": healthy,
+      "ping_ms": round(ping_ms, 3),
+      "pool": pool.get_stats() if pool is not None else None,
+    }
+  return stats
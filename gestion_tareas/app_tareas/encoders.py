@@ -0,0 +1,148 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils import timezone
+from rest_framework import ISO_8601, relations, serializers
+from rest_framework.settings import api_settings
+
+
+class UnsupportedField(Exception):
+  """
+  El serializador tiene un campo que no se puede leer de una columna: la
+  vista usa el serializador en lugar del codificador.
+  """
+
+
+def iso_datetime(field, tz):
+  """
+  ``DateTimeField.to_representation`` con formato ISO 8601 para fechas con
+  zona horaria: se pasa a ``tz`` y ``+00:00`` se escribe ``Z``. Las fechas
+  sin zona (``USE_TZ = False``) pasan por el propio campo.
+  """
+
+  def convert(value):
+    if value.utcoffset() is None:
+      return field.to_representation(value)
+    value = value.astimezone(tz).isoformat()
+    if value.endswith("+00:00"):
+      value = value[:-6] + "Z"
+    return value
+
+  return convert
+
+
+def column_converter(field, model):
+  """
+  ``(columna, conversión)`` de un campo del serializador: la columna que se
+  lee con ``values_list`` y la función que da el mismo valor que
+  ``field.to_representation`` (``None`` si el valor de la columna ya lo es).
+  """
+  source = field.source
+  try:
+    model_field = model._meta.get_field(source)
+  except FieldDoesNotExist:
+    raise UnsupportedField(source)
+  if not model_field.concrete or (model_field.is_relation and not model_field.many_to_one):
+    raise UnsupportedField(source)
+
+  if isinstance(field, relations.PrimaryKeyRelatedField):
+    if field.pk_field is not None or not model_field.many_to_one:
+      raise UnsupportedField(source)
+    # La columna de la clave ajena ya es el ``pk`` que devuelve el campo.
+    return source, None
+  if model_field.is_relation:
+    raise UnsupportedField(source)
+  if isinstance(field, serializers.ChoiceField):
+    mapping = field.choice_strings_to_values
+    if not all(isinstance(key, str) and key == value for key, value in mapping.items()):
+      raise UnsupportedField(source)
+    return source, None
+  if isinstance(field, serializers.CharField):
+    return source, str
+  if isinstance(field, serializers.IntegerField):
+    return source, int
+  if isinstance(field, serializers.DateTimeField):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if output_format is None or output_format.lower() != ISO_8601 or tz is None:
+      raise UnsupportedField(source)
+    return source, iso_datetime(field, tz)
+  if isinstance(field, serializers.DateField):
+    output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+      raise UnsupportedField(source)
+    if isinstance(model_field, models.DateTimeField):
+      raise UnsupportedField(source)
+    return source, _isoformat
+  raise UnsupportedField(source)
+
+
+def _isoformat(value):
+  return value.isoformat()
+
+
+class RowEncoder:
+  """
+  Convierte filas de ``values_list(*encoder.columns)`` en la representación
+  de un serializador sin instanciar modelos ni recorrer sus campos: la
+  función de cada combinación de campos se genera una vez, como un literal de
+  diccionario con las conversiones de cada columna.
+
+  La salida es la misma que la del serializador (mismas claves, en el mismo
+  orden, y mismos valores); ``tests/test_encoders.py`` lo comprueba.
+  """
+
+  def __init__(self, serializer):
+    model = serializer.Meta.model
+    names, self.columns, items = [], [], []
+    namespace = {}
+    for name, field in serializer.fields.items():
+      if field.write_only:
+        continue
+      column, convert = column_converter(field, model)
+      index = len(self.columns)
+      names.append(name)
+      self.columns.append(column)
+      value = f"row[{index}]"
+      if convert is not None:
+        namespace[f"convert_{index}"] = convert
+        value = f"(None if {value} is None else convert_{index}({value}))"
+      items.append(f"{name!r}: {value}")
+    self.fields = tuple(names)
+    source = "def encode(row):\n  return {" + ", ".join(items) + "}\n"
+    exec(compile(source, f"<RowEncoder {type(serializer).__name__}>", "exec"), namespace)
+    self.encode = namespace["encode"]
+
+  def encode_many(self, rows):
+    encode = self.encode
+    return [encode(row) for row in rows]
+
+  def values(self, queryset, *extra):
+    """
+    ``queryset`` como filas con nombre (las columnas del codificador y las
+    de ``extra``, p. ej. las del cursor de la paginación).
+    """
+    columns = self.columns + [name for name in extra if name not in self.columns]
+    return queryset.values_list(*columns, named=True)
+
+
+_encoders = {}
+
+
+def get_encoder(serializer_class, fields=None):
+  """
+  Codificador (cacheado por proceso) de ``serializer_class`` con los campos
+  ``fields`` (``None``: todos) en la zona horaria activa, o ``None`` si algún
+  campo no se puede leer de una columna.
+  """
+  key = (
+    serializer_class,
+    None if fields is None else tuple(fields),
+    str(timezone.get_current_timezone()),
+  )
+  if key not in _encoders:
+    kwargs = {} if fields is None else {"fields": fields}
+    try:
+      _encoders[key] = RowEncoder(serializer_class(**kwargs))
+    except UnsupportedField:
+      _encoders[key] = None
+  return _encoders[key]
@@ -0,0 +1,300 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+# Marca que recibe un suscriptor al que se le han descartado eventos.
+OVERFLOW = object()
+
+
+def task_event(kind, task, previous=None):
+  """
+  Evento de una tarea: ``kind`` es ``created``, ``updated`` o ``deleted``.
+  ``previous`` lleva el estado y usuario anteriores si han cambiado, para que
+  los suscriptores filtrados sepan que la tarea ha salido de su vista.
+  """
+  event = {
+    "event": f"task.{kind}",
+    "id": task.pk,
+    "state": task.state,
+    "assigned_user": task.assigned_user_id,
+  }
+  if previous:
+    event["previous"] = previous
+  return event
+
+
+def moved_event(state, user_id, previous_state):
+  """
+  Evento de un cambio de estado en lote (``transition``): no lleva ids, solo
+  qué columna y usuario se ven afectados; el cliente trae las tareas con
+  ``/tasks/changes/``.
+  """
+  return {
+    "event": "tasks.moved",
+    "state": state,
+    "assigned_user": user_id,
+    "previous": {"state": previous_state, "assigned_user": user_id},
+  }
+
+
+def deleted_event(state, user_id):
+  """
+  Evento de un borrado en lote (``bulk_destroy``): como ``moved_event``, sin
+  ids; el cliente trae los borrados con ``/tasks/changes/``.
+  """
+  return {"event": "tasks.deleted", "state": state, "assigned_user": user_id}
+
+
+class Subscription:
+  """
+  Cola acotada de eventos de un cliente, consumida desde su bucle asyncio.
+
+  Si el cliente no consume al ritmo al que llegan los eventos la cola se
+  vacía y se sustituye por ``OVERFLOW``: el cliente debe resincronizar (con
+  ``/tasks/changes/``) en lugar de recibir una secuencia incompleta, y el
+  resto de suscriptores no se ve frenado por él.
+  """
+
+  def __init__(self, states=None, user_id=None, maxsize=None):
+    self.loop = asyncio.get_running_loop()
+    self.queue = asyncio.Queue(maxsize or settings.TASK_EVENTS_QUEUE_SIZE)
+    self.states = set(states) if states else None
+    self.user_id = user_id
+    self.overflowed = False
+
+  def matches(self, event):
+    previous = event.get("previous", {})
+    if self.states is not None and not (
+      {event["state"], previous.get("state")} & self.states
+    ):
+      return False
+    if self.user_id is not None and self.user_id not in (
+      event["assigned_user"],
+      previous.get("assigned_user"),
+    ):
+      return False
+    return True
+
+  def offer(self, events):
+    # Se ejecuta en el bucle del suscriptor (call_soon_threadsafe).
+    for event in events:
+      if self.overflowed:
+        return
+      try:
+        self.queue.put_nowait(event)
+      except asyncio.QueueFull:
+        self.overflowed = True
+        while not self.queue.empty():
+          self.queue.get_nowait()
+        self.queue.put_nowait(OVERFLOW)
+
+  async def get(self, timeout=None):
+    """
+    Siguiente evento, ``OVERFLOW`` o ``None`` si vence ``timeout``.
+    """
+    try:
+      return await asyncio.wait_for(self.queue.get(), timeout)
+    except asyncio.TimeoutError:
+      return None
+
+
+class TaskEventBroker:
+  """
+  Reparto en el proceso de los eventos de tareas a los suscriptores SSE.
+
+  ``publish`` puede llamarse desde cualquier hilo (las escrituras ocurren en
+  hilos síncronos); cada evento se entrega en el bucle de cada suscriptor
+  cuyo filtro lo admite.
+  """
+
+  def __init__(self):
+    self.lock = threading.Lock()
+    self.subscriptions = set()
+
+  def subscribe(self, **filters):
+    subscription = Subscription(**filters)
+    with self.lock:
+      self.subscriptions.add(subscription)
+    return subscription
+
+  def unsubscribe(self, subscription):
+    with self.lock:
+      self.subscriptions.discard(subscription)
+
+  def publish(self, events):
+    with self.lock:
+      subscriptions = list(self.subscriptions)
+    for subscription in subscriptions:
+      matching = [event for event in events if subscription.matches(event)]
+      if not matching:
+        continue
+      try:
+        subscription.loop.call_soon_threadsafe(subscription.offer, matching)
+      except RuntimeError:
+        # El bucle del suscriptor ya se ha cerrado.
+        self.unsubscribe(subscription)
+
+
+broker = TaskEventBroker()
+
+
+class PostgresBridge:
+  """
+  Reparte los eventos entre procesos con ``LISTEN``/``NOTIFY`` de PostgreSQL.
+
+  Cada proceso publica con ``pg_notify`` y un hilo con una conexión propia
+  escucha el canal y entrega lo recibido al ``broker`` local, de modo que
+  todos los procesos (incluido el que escribe) ven los mismos eventos.
+  """
+
+  # Límite de PostgreSQL para la carga de un NOTIFY (8000 bytes), con margen.
+  max_payload = 7900
+
+  def __init__(self, channel):
+    self.channel = channel
+    self.thread = None
+    self.lock = threading.Lock()
+
+  def publish(self, events):
+    # PostgreSQL entrega los NOTIFY al confirmar la transacción (y los
+    # descarta si se deshace), así que se envían en el momento.
+    with connection.cursor() as cursor:
+      for payload in self.payloads(events):
+        cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, payload])
+
+  def payloads(self, events):
+    """
+    Agrupa los eventos en listas JSON que quepan en un ``NOTIFY``.
+    """
+    batch, size = [], 2
+    for event in events:
+      encoded = json.dumps(event, separators=(",", ":"))
+      if batch and size + len(encoded) + 1 > self.max_payload:
+        yield f"[{','.join(batch)}]"
+        batch, size = [], 2
+      batch.append(encoded)
+      size += len(encoded) + 1
+    if batch:
+      yield f"[{','.join(batch)}]"
+
+  def ensure_listening(self):
+    with self.lock:
+      if self.thread is None or not self.thread.is_alive():
+        self.thread = threading.Thread(
+          target=self.listen, name="task-events-listener", daemon=True
+        )
+        self.thread.start()
+
+  def listen(self):
+    while True:
+      try:
+        self.listen_once()
+      except Exception:
+        logger.exception("Se ha perdido la escucha de %s; reintentando.", self.channel)
+        threading.Event().wait(1)
+
+  def listen_once(self):
+    wrapper = connections.create_connection("default")
+    try:
+      wrapper.ensure_connection()
+      raw = wrapper.connection
+      raw.autocommit = True
+      with raw.cursor() as cursor:
+        cursor.execute(f'LISTEN "{self.channel}"')
+      while True:
+        for notify in self.wait_notifies(raw):
+          broker.publish(json.loads(notify.payload))
+    finally:
+      wrapper.close()
+
+  def wait_notifies(self, raw, timeout=30):
+    """
+    Notificaciones recibidas en ``timeout`` segundos, con psycopg2 o con
+    psycopg 3 (el que usa Django con ``DB_POOL``; entonces la escucha ocupa
+    una conexión del pool).
+    """
+    if not hasattr(raw, "poll"):
+      return list(raw.notifies(timeout=timeout))
+    if select.select([raw], [], [], timeout) == ([], [], []):
+      return []
+    raw.poll()
+    notifies, raw.notifies[:] = list(raw.notifies), []
+    return notifies
+
+
+class EventStream:
+  """
+  Contenido de la respuesta SSE: los eventos de la suscripción en formato
+  Server-Sent Events, con un comentario cada ``heartbeat`` segundos para
+  mantener viva la conexión a través de proxies. Al desbordarse la cola envía
+  ``resync`` y termina.
+
+  ``close()`` (que Django llama al cerrar la respuesta, también si el cliente
+  se desconecta) da de baja la suscripción.
+  """
+
+  def __init__(self, subscription, heartbeat=None):
+    self.subscription = subscription
+    self.heartbeat = heartbeat or settings.TASK_EVENTS_HEARTBEAT
+
+  def __aiter__(self):
+    return self.stream()
+
+  async def stream(self):
+    try:
+      yield "retry: 5000\n\n"
+      while True:
+        event = await self.subscription.get(timeout=self.heartbeat)
+        if event is None:
+          yield ": keepalive\n\n"
+        elif event is OVERFLOW:
+          yield "event: resync\ndata: {}\n\n"
+          return
+        else:
+          data = json.dumps(event, separators=(",", ":"))
+          yield f"event: {event['event']}\ndata: {data}\n\n"
+    finally:
+      self.close()
+
+  def close(self):
+    broker.unsubscribe(self.subscription)
+
+
+bridge = None
+
+
+def get_bridge():
+  global bridge
+  if settings.TASK_EVENTS_BRIDGE != "postgres":
+    return None
+  if bridge is None:
+    bridge = PostgresBridge(settings.TASK_EVENTS_CHANNEL)
+  return bridge
+
+
+def subscribe(**filters):
+  postgres = get_bridge()
+  if postgres is not None:
+    postgres.ensure_listening()
+  return broker.subscribe(**filters)
+
+
+def publish(events):
+  """
+  Publica los eventos cuando se confirme la transacción en curso.
+  """
+  events = list(events)
+  if not events:
+    return
+  postgres = get_bridge()
+  if postgres is not None:
+    postgres.publish(events)
+  else:
+    transaction.on_commit(lambda: broker.publish(events))
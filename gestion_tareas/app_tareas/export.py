@@ -0,0 +1,72 @@
+import csv
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class Echo:
+  """
+  Objeto tipo fichero que devuelve lo que se escribe en él, para que
+  ``csv.writer`` produzca cada línea sin acumularla en un buffer.
+  """
+
+  def write(self, value):
+    return value
+
+
+def stream_ndjson(rows):
+  """
+  Genera una línea JSON por fila.
+  """
+  encoder = JSONEncoder(ensure_ascii=False)
+  for row in rows:
+    yield encoder.encode(row) + "\n"
+
+
+def stream_csv(rows, fields):
+  """
+  Genera la cabecera y una línea CSV por fila.
+  """
+  writer = csv.writer(Echo())
+  yield writer.writerow(fields)
+  for row in rows:
+    yield writer.writerow([
+      "" if row.get(field) is None else row.get(field) for field in fields
+    ])
+
+
+def serialize_rows(serializer, queryset, chunk_size):
+  """
+  Recorre la consulta con un cursor del servidor (``iterator``) y serializa
+  cada tarea con el mismo serializador del listado, sin materializar la
+  consulta ni la respuesta completa.
+  """
+  for instance in queryset.iterator(chunk_size=chunk_size):
+    yield serializer.to_representation(instance)
+
+
+def encode_rows(encoder, queryset, chunk_size):
+  """
+  Como ``serialize_rows``, leyendo solo las columnas del codificador
+  (``encoders.RowEncoder``) en lugar de instancias.
+  """
+  encode = encoder.encode
+  for row in queryset.values_list(*encoder.columns).iterator(chunk_size=chunk_size):
+    yield encode(row)
+
+
+async def aiter_chunks(lines, size):
+  """
+  Versión asíncrona de un generador síncrono de líneas, para servirlo bajo
+  ASGI: Django consumiría un iterador síncrono entero (``sync_to_async(list)``)
+  antes de enviar nada. Cada bloque de ``size`` líneas se genera con
+  ``sync_to_async`` (en el mismo hilo durante toda la petición, así que el
+  cursor del servidor sigue siendo válido) y se envía en cuanto está listo.
+  """
+  next_chunk = sync_to_async(lambda: "".join(islice(lines, size)))
+  try:
+    while chunk := await next_chunk():
+      yield chunk
+  finally:
+    await sync_to_async(lines.close)()
@@ -0,0 +1,60 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F
+from rest_framework import filters
+
+
+class TaskSearchFilter(filters.SearchFilter):
+  """
+  Búsqueda de texto completo sobre ``Task.search_vector`` en PostgreSQL.
+
+  La consulta usa el índice GIN del documento y anota ``search_rank`` con la
+  relevancia de cada tarea. En otros motores (SQLite en los tests) se usa el
+  ``SearchFilter`` de siempre sobre ``search_fields``.
+  """
+
+  search_config = "spanish"
+
+  def filter_queryset(self, request, queryset, view):
+    if connections[queryset.db].vendor != "postgresql":
+      return super().filter_queryset(request, queryset, view)
+
+    search = request.query_params.get(self.search_param, "")
+    search = search.replace("\x00", "").strip()
+    if not search:
+      return queryset
+
+    query = SearchQuery(search, search_type="websearch", config=self.search_config)
+    return queryset.filter(search_vector=query).annotate(
+      search_rank=SearchRank(F("search_vector"), query)
+    )
+
+
+class TaskOrderingFilter(filters.OrderingFilter):
+  """
+  ``OrderingFilter`` que traduce los campos expuestos en la API a las
+  columnas reales por las que se ordena.
+
+  ``?ordering=priority`` ordena por ``priority_rank`` (urgencia real) en lugar
+  del orden alfabético de las etiquetas ``ALTA``/``BAJA``/``MEDIA``. Si hay una
+  búsqueda de texto completo y no se pide otro orden, se ordena por relevancia.
+  """
+
+  ordering_aliases = {"priority": "priority_rank"}
+
+  def get_ordering(self, request, queryset, view):
+    if (
+      self.ordering_param not in request.query_params
+      and "search_rank" in queryset.query.annotations
+    ):
+      return ["-search_rank"] + list(self.get_default_ordering(view) or [])
+
+    ordering = super().get_ordering(request, queryset, view)
+    if not ordering:
+      return ordering
+    return [self.resolve_alias(term) for term in ordering]
+
+  def resolve_alias(self, term):
+    prefix = "-" if term.startswith("-") else ""
+    name = term.lstrip("-")
+    return prefix + self.ordering_aliases.get(name, name)
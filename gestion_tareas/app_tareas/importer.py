@@ -0,0 +1,220 @@
+import csv
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from .models import Task
+from .counters import diff
+from .events import task_event
+from .serializers import TaskSerializer
+from .signals import tasks_changed
+
+IMPORT_FORMATS = {
+  ".csv": "csv",
+  ".ndjson": "ndjson",
+  ".jsonl": "ndjson",
+}
+
+
+def detect_format(filename, default="ndjson"):
+  """
+  Formato de importación según la extensión del fichero.
+  """
+  for extension, file_format in IMPORT_FORMATS.items():
+    if filename and filename.lower().endswith(extension):
+      return file_format
+  return default
+
+
+class InvalidRow:
+  """
+  Fila que no se ha podido leer (codificación o CSV mal formado); el
+  importador la reporta con ``message`` y sigue con las demás.
+  """
+
+  def __init__(self, message):
+    self.message = message
+
+
+class ImportFileError(ValueError):
+  """
+  El fichero no se puede importar en absoluto (p. ej., la cabecera CSV no se
+  puede leer). Se lanza antes de insertar ninguna fila.
+  """
+
+
+NOT_UTF8 = "La fila no está codificada en UTF-8."
+NOT_JSON = "La fila no es un objeto JSON válido."
+
+
+def decode_lines(stream):
+  """
+  Decodifica el fichero línea a línea. Los bytes que no son UTF-8 se conservan
+  con ``surrogateescape`` para que ``read_rows`` reporte la fila que los
+  contiene en lugar de abortar la importación.
+  """
+  for index, line in enumerate(stream):
+    text = line.decode("utf-8", "surrogateescape")
+    yield text.removeprefix("\ufeff") if index == 0 else text
+
+
+def is_utf8(*values):
+  for value in values:
+    for item in value if isinstance(value, list) else [value]:
+      if isinstance(item, str):
+        try:
+          item.encode("utf-8")
+        except UnicodeEncodeError:
+          return False
+  return True
+
+
+def read_rows(stream, file_format):
+  """
+  Lee un fichero binario fila a fila y genera ``(número, fila)``.
+
+  Las filas que no se pueden leer (no son UTF-8, CSV mal formado o NDJSON que
+  no es un objeto JSON) se generan como ``InvalidRow`` para que el importador
+  las reporte como error sin detener la importación. Si no se puede leer la
+  cabecera CSV se lanza ``ImportFileError``.
+  """
+  lines = decode_lines(stream)
+  if file_format == "csv":
+    yield from read_csv_rows(lines)
+    return
+
+  number = 0
+  for line in lines:
+    if not line.strip():
+      continue
+    number += 1
+    if not is_utf8(line):
+      yield number, InvalidRow(NOT_UTF8)
+      continue
+    try:
+      row = json.loads(line)
+    except ValueError:
+      row = None
+    yield number, row if isinstance(row, dict) else InvalidRow(NOT_JSON)
+
+
+def read_csv_rows(lines):
+  reader = csv.DictReader(lines)
+  try:
+    fieldnames = reader.fieldnames
+  except csv.Error as exc:
+    raise ImportFileError(f"No se puede leer la cabecera CSV: {exc}.")
+  if fieldnames and not is_utf8(*fieldnames):
+    raise ImportFileError("La cabecera CSV no está codificada en UTF-8.")
+
+  number = 0
+  while True:
+    number += 1
+    try:
+      row = next(reader)
+    except StopIteration:
+      return
+    except csv.Error as exc:
+      yield number, InvalidRow(f"CSV mal formado: {exc}.")
+      continue
+    yield number, row if is_utf8(*row.values()) else InvalidRow(NOT_UTF8)
+
+
+class TaskImporter:
+  """
+  Importa tareas desde un iterable de filas sin cargarlo entero en memoria.
+
+  Las filas se procesan por bloques de ``chunk_size``: los usuarios asignados
+  (por ``username``) se resuelven con una consulta por bloque, cada fila se
+  valida con las reglas de ``TaskSerializer`` y las válidas se insertan con
+  ``bulk_create``. Las filas con errores se reportan y se omiten.
+  """
+
+  def __init__(
+    self,
+    chunk_size=None,
+    batch_size=None,
+    max_errors=None,
+    on_progress=None,
+    on_error=None,
+  ):
+    self.chunk_size = chunk_size or settings.API_IMPORT_CHUNK_SIZE
+    self.batch_size = batch_size or settings.API_BULK_BATCH_SIZE
+    self.max_errors = settings.API_IMPORT_MAX_ERRORS if max_errors is None else max_errors
+    self.on_progress = on_progress
+    self.on_error = on_error
+    self.report = {"processed": 0, "created": 0, "failed": 0, "errors": []}
+
+  def run(self, rows):
+    rows = iter(rows)
+    while True:
+      chunk = list(islice(rows, self.chunk_size))
+      if not chunk:
+        break
+      self.import_chunk(chunk)
+      if self.on_progress is not None:
+        self.on_progress(self.report)
+    return self.report
+
+  def import_chunk(self, chunk):
+    users = self.resolve_users(chunk)
+    context = {"assigned_users": {user.pk: user for user in users.values()}}
+
+    tasks = []
+    for number, row in chunk:
+      self.report["processed"] += 1
+      data, errors = self.prepare_row(row, users)
+      if errors is None:
+        serializer = TaskSerializer(data=data, context=context)
+        if serializer.is_valid():
+          tasks.append(Task(**serializer.validated_data))
+          continue
+        errors = serializer.errors
+      self.add_error(number, errors)
+
+    with transaction.atomic():
+      created = Task.objects.bulk_create(tasks, batch_size=self.batch_size)
+      pairs = [(task.state, task.assigned_user_id) for task in created]
+      tasks_changed.send(
+        sender=Task,
+        changes=set(pairs),
+        events=[task_event("created", task) for task in created],
+        deltas=diff(after=pairs),
+      )
+    self.report["created"] += len(created)
+
+  def resolve_users(self, chunk):
+    usernames = {
+      str(row["assigned_user"])
+      for _, row in chunk
+      if isinstance(row, dict) and row.get("assigned_user") not in (None, "")
+    }
+    if not usernames:
+      return {}
+    return User.objects.filter(username__in=usernames).in_bulk(field_name="username")
+
+  def prepare_row(self, row, users):
+    if isinstance(row, InvalidRow):
+      return None, {"non_field_errors": [row.message]}
+
+    data = dict(row)
+    username = data.get("assigned_user")
+    if username in (None, ""):
+      data["assigned_user"] = None
+    elif str(username) in users:
+      data["assigned_user"] = users[str(username)].pk
+    else:
+      return None, {"assigned_user": [f'No existe el usuario "{username}".']}
+    return data, None
+
+  def add_error(self, number, errors):
+    self.report["failed"] += 1
+    if self.on_error is not None:
+      self.on_error(number, errors)
+    if len(self.report["errors"]) < self.max_errors:
+      self.report["errors"].append({"row": number, "errors": errors})
+    else:
+      self.report["errors_truncated"] = True
@@ -0,0 +1,169 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import transaction
+
+from .models import Task
+
+# Comodín de un filtro ausente en la etiqueta de una entrada.
+ANY = "*"
+
+HITS_KEY = "task-list-cache:hits"
+MISSES_KEY = "task-list-cache:misses"
+
+
+def get_cache():
+  return caches[settings.TASK_LIST_CACHE_ALIAS]
+
+
+def _hash(value):
+  return hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]
+
+
+def _tag_key(state, user):
+  return f"task-list-cache:tag:{_hash(f'{state}|{user}')}"
+
+
+def _user_key(username):
+  return f"task-list-cache:user:{_hash(username)}"
+
+
+def _user_id(username):
+  """
+  Id del usuario con ese ``username`` (0 si no existe), cacheado para que los
+  listados filtrados por usuario no tengan que consultarlo en cada acierto.
+  """
+  cache = get_cache()
+  key = _user_key(username)
+  user_id = cache.get(key)
+  if user_id is None:
+    user_id = (
+      User.objects.filter(username=username).values_list("pk", flat=True).first()
+      or 0
+    )
+    cache.set(key, user_id, timeout=None)
+  return user_id
+
+
+def entry_tag(params):
+  """
+  Etiqueta de una entrada según los filtros que determinan qué tareas puede
+  contener: ``(state, usuario asignado)``, con ``ANY`` si no se filtra.
+  """
+  username = params.get("assigned_user__username")
+  return (params.get("state") or ANY, _user_id(username) if username else ANY)
+
+
+def affected_tags(state, user_id):
+  """
+  Etiquetas de las entradas que pueden contener una tarea con ese estado y
+  usuario asignado: las que filtran por ese valor o no filtran.
+  """
+  users = [ANY] if user_id is None else [user_id, ANY]
+  return {(s, u) for s in (state, ANY) for u in users}
+
+
+def entry_key(request, user_id):
+  """
+  Clave de una entrada: usuario, filtros normalizados y tipo de respuesta,
+  más la versión vigente de su etiqueta (al invalidar cambia la versión y las
+  entradas antiguas quedan huérfanas hasta que expiran).
+  """
+  params = request.query_params
+  normalized = "&".join(
+    f"{name}={value}"
+    for name in sorted(params)
+    for value in sorted(params.getlist(name))
+  )
+  version = _get_version(_tag_key(*entry_tag(params)))
+  raw = "|".join(
+    [
+      str(user_id),
+      request.get_host(),
+      request.path,
+      normalized,
+      request.accepted_media_type,
+      version,
+    ]
+  )
+  return f"task-list-cache:entry:{_hash(raw)}"
+
+
+def _get_version(key):
+  cache = get_cache()
+  version = cache.get(key)
+  if version is None:
+    # Versión aleatoria y no un contador: si la etiqueta se desaloja no
+    # pueden "resucitar" entradas guardadas con una versión anterior.
+    version = uuid.uuid4().hex
+    if not cache.add(key, version, timeout=None):
+      version = cache.get(key) or version
+  return version
+
+
+def _bump(tags):
+  cache = get_cache()
+  cache.set_many({_tag_key(*tag): uuid.uuid4().hex for tag in tags}, timeout=None)
+
+
+def invalidate(changes):
+  """
+  Invalida las entradas afectadas por tareas con los ``(state, user_id)``
+  dados (``user_id`` ``None`` si la tarea no tiene usuario asignado).
+
+  Se invalida al momento y otra vez al confirmar la transacción, para
+  descartar también lo que otra petición haya cacheado entre la escritura y
+  el ``COMMIT``.
+  """
+  if not settings.TASK_LIST_CACHE:
+    return
+  tags = set()
+  for state, user_id in changes:
+    tags |= affected_tags(state, user_id)
+  if not tags:
+    return
+  _bump(tags)
+  transaction.on_commit(lambda: _bump(tags))
+
+
+def invalidate_user(user):
+  """
+  Invalida las entradas que pueden contener tareas del usuario y olvida su
+  ``username`` (por si lo ha cambiado o alguien nuevo lo ha tomado).
+  """
+  if not settings.TASK_LIST_CACHE:
+    return
+  get_cache().delete(_user_key(user.username))
+  invalidate((state, user.pk) for state in Task.StateChoices.values)
+
+
+def record(hit):
+  cache = get_cache()
+  key = HITS_KEY if hit else MISSES_KEY
+  try:
+    cache.incr(key)
+  except ValueError:
+    cache.add(key, 0, timeout=None)
+    try:
+      cache.incr(key)
+    except ValueError:
+      pass
+
+
+def stats():
+  values = get_cache().get_many([HITS_KEY, MISSES_KEY])
+  hits = values.get(HITS_KEY, 0)
+  misses = values.get(MISSES_KEY, 0)
+  total = hits + misses
+  return {
+    "hits": hits,
+    "misses": misses,
+    "hit_ratio": hits / total if total else 0.0,
+  }
+
+
+def reset_stats():
+  get_cache().delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,94 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app_tareas import compression
+from app_tareas.benchmark import MissingTasks, median_ms, temporary_tasks
+from app_tareas.encoders import get_encoder
+from app_tareas.export import stream_csv, stream_ndjson
+from app_tareas.models import Task
+from app_tareas.renderers import FastJSONRenderer
+from app_tareas.serializers import TaskSerializer
+
+LEVELS = {
+  "gzip": [1, 6, 9],
+  "br": [1, 4, 9],
+  "zstd": [1, 3, 9],
+}
+
+
+class Command(BaseCommand):
+  help = (
+    "Compara, para un listado JSON y las exportaciones NDJSON y CSV de un "
+    "volumen grande de tareas, el tamaño comprimido con gzip, brotli y zstd "
+    "(los instalados) en varios niveles frente al coste de CPU, y estima el "
+    "tiempo total (comprimir más transferir) con el ancho de banda indicado."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+      "--mbps",
+      type=float,
+      default=50.0,
+      help="Ancho de banda del cliente en Mbit/s para estimar la transferencia.",
+    )
+    parser.add_argument(
+      "--create",
+      action="store_true",
+      help="Crea las tareas que falten dentro de una transacción que se deshace.",
+    )
+
+  def handle(self, *args, **options):
+    try:
+      with temporary_tasks(options["tasks"], options["create"]):
+        encoder = get_encoder(TaskSerializer)
+        queryset = Task.objects.order_by("id")[: options["tasks"]]
+        rows = encoder.encode_many(encoder.values(queryset))
+    except MissingTasks as exc:
+      raise CommandError(f"Faltan {exc} tareas; cárguelas o use --create.")
+
+    # El listado se comprime de una vez; las exportaciones, como en la
+    # respuesta en streaming, línea a línea.
+    payloads = [
+      ("json", [FastJSONRenderer().render({"next": None, "previous": None, "results": rows})]),
+      ("ndjson", [line.encode() for line in stream_ndjson(rows)]),
+      ("csv", [line.encode() for line in stream_csv(rows, list(encoder.fields))]),
+    ]
+    encodings = [name for name in LEVELS if compression.COMPRESSORS[name] is not None]
+    self.stdout.write(
+      f"{len(rows)} tareas, {options['mbps']:g} Mbit/s; * = nivel configurado"
+    )
+    missing = [name for name in LEVELS if name not in encodings]
+    if missing:
+      self.stdout.write(f"Sin instalar (no se miden): {', '.join(missing)}")
+    for label, chunks in payloads:
+      size = sum(len(chunk) for chunk in chunks)
+      self.stdout.write(
+        f"{label:<7} {'identidad':<9} {size / 1e6:>7.3f} MB"
+        f"{'':>44}total {self.transfer_ms(size, options['mbps']):>8.1f} ms"
+      )
+      for encoding in encodings:
+        for level in LEVELS[encoding]:
+          self.report(label, chunks, size, encoding, level, options)
+
+  def report(self, label, chunks, size, encoding, level, options):
+    def run():
+      if len(chunks) == 1:
+        return compression.compress(chunks[0], encoding, level)
+      return b"".join(compression.compress_stream(chunks, encoding, level))
+
+    compressed = len(run())
+    elapsed = median_ms(run, options["repeat"])
+    total = elapsed + self.transfer_ms(compressed, options["mbps"])
+    marker = "*" if settings.COMPRESSION_LEVELS.get(encoding) == level else " "
+    name = f"{encoding}-{level}{marker}"
+    self.stdout.write(
+      f"{label:<7} {name:<9} {compressed / 1e6:>7.3f} MB  "
+      f"ratio {size / compressed:>5.1f}  "
+      f"comprimir {elapsed:>8.1f} ms ({size / 1e6 / elapsed * 1000:>7.1f} MB/s)  "
+      f"total {total:>8.1f} ms"
+    )
+
+  def transfer_ms(self, size, mbps):
+    return size * 8 / (mbps * 1e6) * 1000
@@ -0,0 +1,108 @@
+import statistics
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.handlers.base import BaseHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.authtoken.models import Token
+
+from app_tareas.benchmark import median_ms
+
+
+def middleware_profiles():
+  """
+  ``(clásico, api)``: ``MIDDLEWARE`` con el middleware original de
+  ``SITE_MIDDLEWARE`` y con sus subclases que dejan pasar la API, sea cual
+  sea el configurado.
+  """
+  original = {site: path for path, site in settings.SITE_MIDDLEWARE.items()}
+  classic = [original.get(path, path) for path in settings.MIDDLEWARE]
+  return classic, [settings.SITE_MIDDLEWARE.get(path, path) for path in classic]
+
+
+@csrf_exempt
+def empty_view(request):
+  # Como las vistas de DRF: exenta de CSRF y sin tocar la sesión.
+  return HttpResponse()
+
+
+class MiddlewareOnlyHandler(BaseHandler):
+  """
+  Manejador sin resolución de URL ni vista real: la misma cadena de
+  middleware (con sus ``process_view``) delante de ``empty_view``, para medir
+  solo lo que cuesta el middleware.
+  """
+
+  def _get_response(self, request):
+    for process_view in self._view_middleware:
+      response = process_view(request, empty_view, (), {})
+      if response is not None:
+        return response
+    return empty_view(request)
+
+
+class Command(BaseCommand):
+  help = (
+    "Mide el coste por petición de la cadena de middleware completa frente a "
+    "la de SITE_MIDDLEWARE (sin sesiones, CSRF, usuario ni mensajes en /api/), "
+    "pasando peticiones por el manejador de Django en el propio proceso."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--username", help="Usuario cuyo token se usa.")
+
+  def handle(self, *args, **options):
+    user = (
+      User.objects.filter(username=options["username"]).first()
+      if options["username"]
+      else User.objects.order_by("pk").first()
+    )
+    if user is None:
+      raise CommandError("No hay ningún usuario con el que autenticarse.")
+    token, _ = Token.objects.get_or_create(user=user)
+
+    factory = RequestFactory()
+    headers = {"Authorization": f"Token {token.key}"}
+    runs = [
+      ("solo middleware /api/", MiddlewareOnlyHandler, "/api/tasks/", {}, 200),
+      ("api sin token (401)", BaseHandler, "/api/tasks/", {}, 401),
+      ("api tasks/counts/", BaseHandler, "/api/tasks/counts/", headers, 200),
+      ("solo middleware admin", MiddlewareOnlyHandler, "/admin/", {}, 200),
+    ]
+    profiles = middleware_profiles()
+    total, repeat = options["requests"], options["repeat"]
+    self.stdout.write(f"{total} peticiones x {repeat}; µs por petición (mediana)")
+    with override_settings(ALLOWED_HOSTS=["testserver"]):
+      for label, handler_class, path, request_headers, expected in runs:
+        handlers = [self.load(handler_class, profile) for profile in profiles]
+        timings = [[], []]
+        # Se alternan los perfiles en cada vuelta para repartir el ruido.
+        for _ in range(repeat):
+          for handler, results in zip(handlers, timings):
+            batch = [factory.get(path, headers=request_headers) for _ in range(total)]
+            results.append(median_ms(lambda: self.run(handler, batch, expected), 1))
+        classic, lean = (statistics.median(results) / total * 1000 for results in timings)
+        saved = classic - lean
+        self.stdout.write(
+          f"{label:<22} clásico {classic:>8.1f}  api {lean:>8.1f}  "
+          f"ahorro {saved:>7.1f} ({saved / classic:>6.1%})"
+        )
+
+  def load(self, handler_class, middleware):
+    with override_settings(MIDDLEWARE=middleware):
+      handler = handler_class()
+      handler.load_middleware()
+    return handler
+
+  def run(self, handler, batch, expected):
+    for request in batch:
+      response = handler.get_response(request)
+      if response.status_code != expected:
+        raise CommandError(
+          f"{request.path} devolvió {response.status_code} (se esperaba {expected})."
+        )
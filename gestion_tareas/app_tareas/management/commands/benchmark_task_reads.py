@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncRequestFactory, RequestFactory, override_settings
+from rest_framework.authtoken.models import Token
+
+from app_tareas.async_views import AsyncTaskView
+from app_tareas.benchmark import (
+  format_summary,
+  run_concurrent,
+  run_threaded,
+  summarize,
+)
+from app_tareas.models import Task
+from app_tareas.views import TaskViewSet
+
+
+class Command(BaseCommand):
+  help = (
+    "Compara en el propio proceso el listado y el detalle de tareas de "
+    "TaskViewSet (hilos, como WSGI) con AsyncTaskView (un bucle, como ASGI): "
+    "peticiones por segundo y latencia p50/p99."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--username", help="Usuario cuyo token se usa.")
+    parser.add_argument(
+      "--query", default="", help="Parámetros del listado, p. ej. 'state=DOING'."
+    )
+    parser.add_argument(
+      "--with-list-cache",
+      action="store_true",
+      help="Deja activa la caché de listados (solo la usa la vista síncrona).",
+    )
+
+  def handle(self, *args, **options):
+    user = (
+      User.objects.filter(username=options["username"]).first()
+      if options["username"]
+      else User.objects.order_by("pk").first()
+    )
+    if user is None:
+      raise CommandError("No hay ningún usuario con el que autenticarse.")
+    token, _ = Token.objects.get_or_create(user=user)
+    task = Task.objects.order_by("pk").first()
+    if task is None:
+      raise CommandError("No hay tareas; cargue datos antes de medir.")
+
+    headers = {"Authorization": f"Token {token.key}"}
+    list_path = f"/api/tasks/?{options['query']}"
+    detail_path = f"/api/tasks/{task.pk}/"
+    sync_list = TaskViewSet.as_view({"get": "list"})
+    sync_detail = TaskViewSet.as_view({"get": "retrieve"})
+    async_list = AsyncTaskView.as_view()
+    async_detail = AsyncTaskView.as_view(detail=True)
+    factory = RequestFactory()
+    async_factory = AsyncRequestFactory()
+
+    def sync_call(view, path, **kwargs):
+      def call():
+        response = view(factory.get(path, headers=headers), **kwargs)
+        response.render()
+        self.expect_ok(response)
+
+      return call
+
+    def async_call(view, path, **kwargs):
+      async def call():
+        self.expect_ok(await view(async_factory.get(path, headers=headers), **kwargs))
+
+      return call
+
+    total, concurrency = options["requests"], options["concurrency"]
+    runs = [
+      ("list sync", run_threaded, sync_call(sync_list, list_path)),
+      ("list async", run_concurrent, async_call(async_list, list_path)),
+      ("detail sync", run_threaded, sync_call(sync_detail, detail_path, pk=task.pk)),
+      (
+        "detail async",
+        run_concurrent,
+        async_call(async_detail, detail_path, pk=task.pk),
+      ),
+    ]
+    caches = dict(settings.CACHES)
+    if not options["with_list_cache"]:
+      caches[settings.TASK_LIST_CACHE_ALIAS] = {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+      }
+    with override_settings(ALLOWED_HOSTS=["testserver"], CACHES=caches):
+      for label, runner, call in runs:
+        latencies, elapsed = runner(call, total, concurrency)
+        self.stdout.write(format_summary(summarize(label, latencies, elapsed)))
+
+  def expect_ok(self, response):
+    if response.status_code != 200:
+      raise CommandError(f"Respuesta inesperada: {response.status_code}")
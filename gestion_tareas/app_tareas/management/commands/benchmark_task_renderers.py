@@ -0,0 +1,60 @@
+import io
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from app_tareas.benchmark import MissingTasks, median_ms, temporary_tasks
+from app_tareas.encoders import get_encoder
+from app_tareas.models import Task
+from app_tareas.parsers import FastJSONParser, MessagePackParser
+from app_tareas.renderers import FastJSONRenderer, MessagePackRenderer, msgpack
+from app_tareas.serializers import TaskSerializer
+
+
+class Command(BaseCommand):
+  help = (
+    "Mide cuánto se tarda en generar y en leer un listado grande de tareas "
+    "con el JSON de DRF, con FastJSONRenderer/FastJSONParser (orjson) y con "
+    "MessagePack (si está instalado): milisegundos, MB/s y tamaño."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+      "--create",
+      action="store_true",
+      help="Crea las tareas que falten dentro de una transacción que se deshace.",
+    )
+
+  def handle(self, *args, **options):
+    try:
+      with temporary_tasks(options["tasks"], options["create"]):
+        encoder = get_encoder(TaskSerializer)
+        queryset = Task.objects.order_by("id")[: options["tasks"]]
+        data = {"next": None, "previous": None, "results": encoder.encode_many(encoder.values(queryset))}
+    except MissingTasks as exc:
+      raise CommandError(f"Faltan {exc} tareas; cárguelas o use --create.")
+
+    formats = [
+      ("json (DRF)", JSONRenderer(), JSONParser()),
+      ("json (orjson)", FastJSONRenderer(), FastJSONParser()),
+    ]
+    if msgpack is not None:
+      formats.append(("msgpack", MessagePackRenderer(), MessagePackParser()))
+
+    repeat = options["repeat"]
+    self.stdout.write(f"{len(data['results'])} tareas")
+    for label, renderer, parser in formats:
+      content = renderer.render(data, renderer.media_type)
+      if parser.parse(io.BytesIO(content)) != data:
+        raise CommandError(f"{label}: el contenido leído no coincide con el original.")
+      render_ms = median_ms(lambda: renderer.render(data, renderer.media_type), repeat)
+      parse_ms = median_ms(lambda: parser.parse(io.BytesIO(content)), repeat)
+      megabytes = len(content) / 1e6
+      self.stdout.write(
+        f"{label:<14} {megabytes:>6.2f} MB  "
+        f"generar {render_ms:>8.1f} ms ({megabytes / render_ms * 1000:>7.1f} MB/s)  "
+        f"leer {parse_ms:>8.1f} ms ({megabytes / parse_ms * 1000:>7.1f} MB/s)"
+      )
@@ -0,0 +1,79 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app_tareas.benchmark import MissingTasks, median_ms, temporary_tasks
+from app_tareas.encoders import get_encoder
+from app_tareas.models import Task
+from app_tareas.serializers import TaskSerializer
+
+
+class Command(BaseCommand):
+  help = (
+    "Mide el tiempo de convertir tareas a su representación de la API con "
+    "TaskSerializer y con el codificador de filas (encoders.RowEncoder), "
+    "solo la conversión y con la consulta, en milisegundos por 10.000 tareas."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+      "--fields",
+      default="__all__",
+      help="Campos separados por comas (por defecto, todos).",
+    )
+    parser.add_argument(
+      "--create",
+      action="store_true",
+      help="Crea las tareas que falten dentro de una transacción que se deshace.",
+    )
+
+  def handle(self, *args, **options):
+    fields = None
+    if options["fields"] != "__all__":
+      fields = ["id", *(name for name in options["fields"].split(",") if name != "id")]
+    encoder = get_encoder(TaskSerializer, fields)
+    if encoder is None:
+      raise CommandError("Algún campo no se puede leer de una columna.")
+
+    try:
+      with temporary_tasks(options["tasks"], options["create"]):
+        self.measure(encoder, fields, options["tasks"], options["repeat"])
+    except MissingTasks as exc:
+      raise CommandError(f"Faltan {exc} tareas; cárguelas o use --create.")
+
+  def measure(self, encoder, fields, total, repeat):
+    queryset = Task.objects.order_by("id")[:total]
+    kwargs = {} if fields is None else {"fields": fields}
+
+    def serializer_only(tasks):
+      return TaskSerializer(tasks, many=True, **kwargs).data
+
+    # ``.all()``: cada medida lanza la consulta (la caché de resultados del
+    # ``QuerySet`` la ocultaría).
+    def serializer_query():
+      return serializer_only(list(queryset.all()))
+
+    def encoder_query():
+      return encoder.encode_many(list(encoder.values(queryset)))
+
+    tasks = list(queryset)
+    rows = list(encoder.values(queryset))
+    if serializer_only(tasks) != encoder.encode_many(rows):
+      raise CommandError("El codificador no da la misma salida que el serializador.")
+
+    scale = 10000 / len(tasks) if tasks else 0
+    runs = [
+      ("serializador", lambda: serializer_only(tasks)),
+      ("codificador", lambda: encoder.encode_many(rows)),
+      ("consulta + serializador", serializer_query),
+      ("consulta + codificador", encoder_query),
+    ]
+    results = {}
+    for label, call in runs:
+      results[label] = median_ms(call, repeat) * scale
+      self.stdout.write(f"{label:<26} {results[label]:>9.1f} ms / 10k tareas")
+
+    for label, kind in (("solo conversión", ""), ("con la consulta", "consulta + ")):
+      before, after = results[f"{kind}serializador"], results[f"{kind}codificador"]
+      if after:
+        self.stdout.write(f"mejora ({label}): x{before / after:.1f}")
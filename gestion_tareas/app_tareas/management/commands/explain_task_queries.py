@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.test import APIRequestFactory
+
+from app_tareas.models import Task
+from app_tareas.views import TaskViewSet
+
+
+class Command(BaseCommand):
+  help = (
+    "Muestra el plan de ejecución (EXPLAIN ANALYZE en PostgreSQL) de cada "
+    "combinación de filtros y orden que sirve el listado de tareas."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument("--state", default=Task.StateChoices.DOING)
+    parser.add_argument("--username", help="Valor para assigned_user__username.")
+    parser.add_argument("--due-date", help="Valor para due_date (AAAA-MM-DD).")
+    parser.add_argument(
+      "--no-analyze",
+      action="store_true",
+      help="Solo EXPLAIN, sin ejecutar las consultas.",
+    )
+
+  def handle(self, *args, **options):
+    sample = Task.objects.exclude(assigned_user=None).select_related(
+      "assigned_user"
+    ).first()
+    username = options["username"] or (
+      sample.assigned_user.username if sample else "admin"
+    )
+    due_date = options["due_date"] or (
+      sample.due_date.isoformat() if sample else "2025-01-01"
+    )
+    state = options["state"]
+
+    combinations = [
+      {},
+      {"state": state},
+      {"due_date": due_date},
+      {"assigned_user__username": username},
+      {"state": state, "assigned_user__username": username},
+      {"state": state, "due_date": due_date},
+      {"state": state, "ordering": "priority"},
+      {"ordering": "-due_date"},
+    ]
+    for params in combinations:
+      self.explain(params, self.list_queryset(params), options)
+
+  def list_queryset(self, params):
+    """
+    Construye la consulta exactamente como lo hace ``TaskViewSet.list``:
+    filtros, búsqueda, orden y la primera página del cursor.
+    """
+    view = TaskViewSet(action_map={"get": "list"}, format_kwarg=None)
+    django_request = APIRequestFactory().get("/api/tasks/", params)
+    view.setup(django_request)
+    request = view.initialize_request(django_request)
+    view.request = request
+    queryset = view.filter_queryset(view.get_queryset())
+    return view.paginator.get_page_queryset(queryset, request, view)
+
+  def explain(self, params, queryset, options):
+    label = "&".join(f"{key}={value}" for key, value in params.items())
+    self.stdout.write(self.style.MIGRATE_HEADING(f"GET /api/tasks/?{label}"))
+    if connection.vendor == "postgresql" and not options["no_analyze"]:
+      plan = queryset.explain(analyze=True, buffers=True)
+    else:
+      plan = queryset.explain()
+    self.stdout.write(plan)
+    self.stdout.write("")
@@ -0,0 +1,66 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app_tareas.importer import ImportFileError, TaskImporter, detect_format, read_rows
+
+
+class Command(BaseCommand):
+  help = (
+    "Importa tareas desde un fichero CSV o NDJSON (o '-' para la entrada "
+    "estándar) sin cargarlo entero en memoria."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument("path", help="Ruta del fichero, o '-' para stdin.")
+    parser.add_argument("--file-format", choices=["csv", "ndjson"])
+    parser.add_argument("--chunk-size", type=int, help="Filas por bloque.")
+    parser.add_argument("--batch-size", type=int, help="Filas por INSERT.")
+
+  def handle(self, *args, **options):
+    path = options["path"]
+    file_format = options["file_format"] or detect_format(
+      path, default="ndjson" if path == "-" else None
+    )
+    if file_format is None:
+      raise CommandError("No se reconoce el formato; indique --file-format.")
+
+    importer = TaskImporter(
+      chunk_size=options["chunk_size"],
+      batch_size=options["batch_size"],
+      max_errors=0,
+      on_progress=self.progress,
+      on_error=self.error,
+    )
+
+    try:
+      stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    except OSError as exc:
+      raise CommandError(str(exc))
+    with stream:
+      try:
+        report = importer.run(read_rows(stream, file_format))
+      except ImportFileError as exc:
+        raise CommandError(str(exc))
+
+    self.stdout.write(
+      self.style.SUCCESS(
+        f"{report['processed']} filas procesadas: "
+        f"{report['created']} creadas, {report['failed']} con errores."
+      )
+    )
+    if report["failed"]:
+      raise CommandError("Algunas filas no se importaron.", returncode=2)
+
+  def progress(self, report):
+    self.stdout.write(
+      f"{report['processed']} filas procesadas ({report['created']} creadas, "
+      f"{report['failed']} con errores)"
+    )
+
+  def error(self, number, errors):
+    details = "; ".join(
+      f"{field}: {' '.join(str(message) for message in messages)}"
+      for field, messages in errors.items()
+    )
+    self.stderr.write(f"Fila {number}: {details}")
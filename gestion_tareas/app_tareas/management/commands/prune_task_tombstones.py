@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from app_tareas.models import TaskTombstone
+
+
+class Command(BaseCommand):
+  help = (
+    "Elimina los registros de tareas borradas más antiguos que "
+    "API_SYNC_TOMBSTONE_DAYS (los cursores de sincronización anteriores "
+    "dejan de ser válidos)."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument(
+      "--days", type=int, help="Días a conservar (por defecto, el ajuste)."
+    )
+
+  def handle(self, *args, **options):
+    days = options["days"]
+    if days is None:
+      days = settings.API_SYNC_TOMBSTONE_DAYS
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = TaskTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    self.stdout.write(self.style.SUCCESS(f"{deleted} registros eliminados."))
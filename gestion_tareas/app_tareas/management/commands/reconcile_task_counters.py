@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from app_tareas.counters import reconcile
+
+
+class Command(BaseCommand):
+  help = (
+    "Recalcula los contadores de tareas por usuario y estado (TaskCounter) "
+    "desde las tareas y corrige los que no cuadran."
+  )
+
+  def add_arguments(self, parser):
+    parser.add_argument(
+      "--dry-run",
+      action="store_true",
+      help="Solo muestra las diferencias, sin corregirlas.",
+    )
+
+  def handle(self, *args, **options):
+    differences = reconcile(dry_run=options["dry_run"])
+    for state, user_id, stored, actual in differences:
+      user = user_id if user_id is not None else "sin asignar"
+      self.stdout.write(f"{user} / {state}: {stored} -> {actual}")
+    verb = "encontrados" if options["dry_run"] else "corregidos"
+    self.stdout.write(self.style.SUCCESS(f"{len(differences)} contadores {verb}."))
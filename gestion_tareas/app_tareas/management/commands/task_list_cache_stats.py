@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from app_tareas import list_cache
+
+
+class Command(BaseCommand):
+  help = "Muestra los aciertos y fallos de la caché de listados de tareas."
+
+  def add_arguments(self, parser):
+    parser.add_argument(
+      "--reset", action="store_true", help="Pone los contadores a cero."
+    )
+
+  def handle(self, *args, **options):
+    stats = list_cache.stats()
+    self.stdout.write(
+      f"aciertos={stats['hits']} fallos={stats['misses']} "
+      f"ratio={stats['hit_ratio']:.2%}"
+    )
+    if options["reset"]:
+      list_cache.reset_stats()
+      self.stdout.write(self.style.SUCCESS("Contadores reiniciados."))
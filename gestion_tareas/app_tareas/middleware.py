@@ -0,0 +1,175 @@
+from contextlib import nullcontext
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import caches
+from django.middleware.csrf import CsrfViewMiddleware
+from django.utils.cache import patch_vary_headers
+
+from . import compression, routers
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaStickinessMiddleware:
+  """
+  Lee del primario durante las peticiones de escritura y, tras una escritura
+  correcta, durante ``REPLICA_STICKY_SECONDS`` en las peticiones del mismo
+  cliente (identificado por su cabecera ``Authorization``), aunque la atienda
+  otro worker: la marca se guarda en ``REPLICA_STICKY_CACHE_ALIAS``, que debe
+  ser compartida. Sin réplicas configuradas no hace nada.
+  """
+
+  sync_capable = True
+  async_capable = True
+
+  def __init__(self, get_response):
+    self.get_response = get_response
+    self.is_async = iscoroutinefunction(get_response)
+    if self.is_async:
+      markcoroutinefunction(self)
+
+  def __call__(self, request):
+    if self.is_async:
+      return self.__acall__(request)
+    if not routers.get_replicas():
+      return self.get_response(request)
+    key = routers.sticky_key(request)
+    with self.reads(request, self.cache.get(key) if key else None):
+      response = self.get_response(request)
+    self.remember_write(request, response, key)
+    return response
+
+  async def __acall__(self, request):
+    if not routers.get_replicas():
+      return await self.get_response(request)
+    key = routers.sticky_key(request)
+    with self.reads(request, await self.cache.aget(key) if key else None):
+      response = await self.get_response(request)
+    self.remember_write(request, response, key)
+    return response
+
+  @property
+  def cache(self):
+    return caches[settings.REPLICA_STICKY_CACHE_ALIAS]
+
+  def reads(self, request, sticky):
+    if request.method not in SAFE_METHODS or sticky:
+      return routers.use_primary()
+    return nullcontext()
+
+  def remember_write(self, request, response, key):
+    if key and request.method not in SAFE_METHODS and response.status_code < 400:
+      self.cache.set(key, True, settings.REPLICA_STICKY_SECONDS)
+
+
+class CompressionMiddleware:
+  """
+  Comprime las respuestas con la codificación que prefiera el cliente entre
+  ``COMPRESSION_ENCODINGS`` (zstd, br, gzip), como ``GZipMiddleware`` de
+  Django pero con brotli y zstd y solo para los tipos de contenido de
+  ``COMPRESSION_CONTENT_TYPES``.
+
+  Las respuestas normales se comprimen a partir de ``COMPRESSION_MIN_SIZE``
+  bytes; las respuestas en streaming (exportaciones, síncronas o asíncronas)
+  se comprimen al vuelo, bloque a bloque, sin acumularlas. Como el cuerpo
+  cambia, la ``ETag`` pasa a ser débil (las comparaciones de
+  ``If-None-Match`` siguen funcionando).
+  """
+
+  sync_capable = True
+  async_capable = True
+
+  def __init__(self, get_response):
+    self.get_response = get_response
+    self.is_async = iscoroutinefunction(get_response)
+    if self.is_async:
+      markcoroutinefunction(self)
+
+  def __call__(self, request):
+    if self.is_async:
+      return self.__acall__(request)
+    return self.process_response(request, self.get_response(request))
+
+  async def __acall__(self, request):
+    return self.process_response(request, await self.get_response(request))
+
+  def is_compressible(self, response):
+    if response.has_header("Content-Encoding"):
+      return False
+    content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+    if content_type not in settings.COMPRESSION_CONTENT_TYPES:
+      return False
+    return response.streaming or len(response.content) >= settings.COMPRESSION_MIN_SIZE
+
+  def process_response(self, request, response):
+    if not self.is_compressible(response):
+      return response
+    patch_vary_headers(response, ("Accept-Encoding",))
+    encoding = compression.choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING"))
+    if encoding is None:
+      return response
+
+    if response.streaming:
+      if response.is_async:
+        stream = compression.acompress_stream
+      else:
+        stream = compression.compress_stream
+      response.streaming_content = stream(response.streaming_content, encoding)
+      # El tamaño comprimido no se conoce hasta terminar.
+      del response.headers["Content-Length"]
+    else:
+      compressed = compression.compress(response.content, encoding)
+      # Si no se gana nada se deja la respuesta como estaba.
+      if len(compressed) >= len(response.content):
+        return response
+      response.content = compressed
+      response.headers["Content-Length"] = str(len(compressed))
+
+    etag = response.get("ETag")
+    if etag and etag.startswith('"'):
+      response.headers["ETag"] = "W/" + etag
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def is_api(request):
+  return request.path_info.startswith(settings.API_PATH_PREFIX)
+
+
+class SiteOnlyMixin:
+  """
+  Para el middleware que solo necesita el admin (sesiones, CSRF, usuario y
+  mensajes): las peticiones bajo ``API_PATH_PREFIX``, que se autentican con
+  tokens y no usan cookies ni mensajes, pasan directamente a
+  ``get_response``. Cada subclase ocupa el sitio de su clase base en
+  ``MIDDLEWARE`` (el orden no cambia) y las comprobaciones del admin la
+  reconocen como tal.
+  """
+
+  def __call__(self, request):
+    if is_api(request):
+      return self.get_response(request)
+    return super().__call__(request)
+
+
+class SiteSessionMiddleware(SiteOnlyMixin, SessionMiddleware):
+  pass
+
+
+class SiteCsrfViewMiddleware(SiteOnlyMixin, CsrfViewMiddleware):
+  def process_view(self, request, view_func, view_args, view_kwargs):
+    if is_api(request):
+      return None
+    return super().process_view(request, view_func, view_args, view_kwargs)
+
+
+class SiteAuthenticationMiddleware(SiteOnlyMixin, AuthenticationMiddleware):
+  pass
+
+
+class SiteMessageMiddleware(SiteOnlyMixin, MessageMiddleware):
+  pass
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-18 13:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_tareas', '0002_auto_20250307_2245'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ['due_date', 'priority_rank'], 'verbose_name': 'Tarea', 'verbose_name_plural': 'Tareas'},
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='priority_rank',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(priority='ALTA', then=models.Value(1)), models.When(priority='MEDIA', then=models.Value(2)), models.When(priority='BAJA', then=models.Value(3)), default=models.Value(4)), output_field=models.PositiveSmallIntegerField(), verbose_name='Rango de prioridad'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['due_date', 'priority_rank', 'id'], name='task_due_priority_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-18 13:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_tareas', '0003_task_priority_rank'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['state', 'due_date', 'priority_rank'], name='task_state_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assigned_user', 'state', 'due_date'], name='task_user_state_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('state', 'DONE'), _negated=True), fields=['due_date', 'priority_rank', 'id'], name='task_open_due_idx'),
+        ),
+    ]
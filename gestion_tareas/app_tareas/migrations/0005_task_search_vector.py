@@ -0,0 +1,62 @@
+# Generated by Django 5.1.6 on 2026-10-18 13:27
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# El documento se recalcula en la base de datos para que también lo cubran
+# bulk_create(), update() y las escrituras que no pasan por Django.
+SEARCH_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION {table}_search_vector() RETURNS trigger AS $$
+BEGIN
+  NEW.search_vector :=
+    setweight(to_tsvector('spanish', coalesce(NEW.name, '')), 'A') ||
+    setweight(to_tsvector('spanish', coalesce(NEW.description, '')), 'B');
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER {table}_search_vector_trigger
+BEFORE INSERT OR UPDATE OF name, description, search_vector ON {table}
+FOR EACH ROW EXECUTE FUNCTION {table}_search_vector();
+
+CREATE INDEX task_search_vector_idx ON {table} USING gin (search_vector);
+
+UPDATE {table} SET name = name;
+"""
+
+DROP_SEARCH_TRIGGER_SQL = """
+DROP INDEX IF EXISTS task_search_vector_idx;
+DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table};
+DROP FUNCTION IF EXISTS {table}_search_vector();
+"""
+
+
+def add_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('app_tareas', 'Task')._meta.db_table
+    schema_editor.execute(SEARCH_TRIGGER_SQL.format(table=table), params=None)
+
+
+def remove_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('app_tareas', 'Task')._meta.db_table
+    schema_editor.execute(DROP_SEARCH_TRIGGER_SQL.format(table=table), params=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_tareas', '0004_task_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(add_search_trigger, remove_search_trigger),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.6 on 2026-10-18 13:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_tareas', '0005_task_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.BigIntegerField(verbose_name='Id de la tarea')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Fecha de eliminación')),
+            ],
+            options={
+                'verbose_name': 'Tarea eliminada',
+                'verbose_name_plural': 'Tareas eliminadas',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['updated_at', 'id'], name='task_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.1.6 on 2026-10-18 14:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def count_existing_tasks(apps, schema_editor):
+    Task = apps.get_model('app_tareas', 'Task')
+    TaskCounter = apps.get_model('app_tareas', 'TaskCounter')
+    rows = (
+        Task.objects.using(schema_editor.connection.alias)
+        .order_by()
+        .values_list('state', 'assigned_user_id')
+        .annotate(total=Count('id'))
+    )
+    TaskCounter.objects.using(schema_editor.connection.alias).bulk_create(
+        TaskCounter(state=state, user_id=user_id, count=total)
+        for state, user_id, total in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_tareas', '0006_task_changes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('state', models.CharField(choices=[('BACKLOG', 'Backlog'), ('TO DO', 'To Do'), ('DOING', 'Doing'), ('TEST', 'Test'), ('DONE', 'Done')], max_length=10, verbose_name='Estado')),
+                ('count', models.IntegerField(default=0, verbose_name='Número de tareas')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='task_counters', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Contador de tareas',
+                'verbose_name_plural': 'Contadores de tareas',
+                'ordering': ['user_id', 'state'],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('user__isnull', False)), fields=('user', 'state'), name='taskcounter_user_state_uniq'), models.UniqueConstraint(condition=models.Q(('user__isnull', True)), fields=('state',), name='taskcounter_unassigned_state_uniq')],
+            },
+        ),
+        migrations.RunPython(count_existing_tasks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,280 @@
+import hashlib
+from calendar import timegm
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from . import encoders, list_cache, routers
+
+
+def make_etag(*parts):
+  digest = hashlib.sha256(":".join(str(part) for part in parts).encode("utf-8"))
+  return quote_etag(digest.hexdigest()[:32])
+
+
+class ConditionalGetMixin:
+  """
+  ``list`` y ``retrieve`` con validadores HTTP para las peticiones de sondeo.
+
+  Los validadores se calculan con una consulta barata antes de serializar:
+  ``MAX(updated_at)`` y ``COUNT(*)`` del listado filtrado, o el
+  ``updated_at`` de la fila en el detalle. Si coinciden con ``If-None-Match`` /
+  ``If-Modified-Since`` se responde ``304`` sin serializar nada.
+
+  El listado solo lleva ``ETag``: el borrado de una fila antigua no cambia
+  ``MAX(updated_at)``, así que una fecha no bastaría para detectarlo.
+  """
+
+  def list(self, request, *args, **kwargs):
+    queryset = self.filter_queryset(self.get_queryset())
+    etag = self.get_list_etag(request, queryset)
+    not_modified = self.get_not_modified(request, etag)
+    if not_modified is not None:
+      return not_modified
+    return self.set_validators(self.list_response(queryset), etag)
+
+  def retrieve(self, request, *args, **kwargs):
+    updated_at = self.get_object_updated_at(**kwargs)
+    if updated_at is None:
+      # No existe (o el id no es válido): que get_object responda el 404.
+      return super().retrieve(request, *args, **kwargs)
+
+    etag, last_modified = self.get_object_validators(request, updated_at, **kwargs)
+    not_modified = self.get_not_modified(request, etag, last_modified)
+    if not_modified is not None:
+      return not_modified
+    response = super().retrieve(request, *args, **kwargs)
+    return self.set_validators(response, etag, last_modified)
+
+  def list_response(self, queryset):
+    page = self.paginate_queryset(queryset)
+    if page is not None:
+      serializer = self.get_serializer(page, many=True)
+      return self.get_paginated_response(serializer.data)
+    serializer = self.get_serializer(queryset, many=True)
+    return Response(serializer.data)
+
+  # Agregados de los que sale el ETag del listado.
+  list_state = {"last_updated": Max("updated_at"), "total": Count("pk")}
+
+  def get_list_etag(self, request, queryset):
+    state = queryset.order_by().aggregate(**self.list_state)
+    return self.make_list_etag(request, state)
+
+  def make_list_etag(self, request, state):
+    last_updated = state["last_updated"]
+    return make_etag(
+      state["total"],
+      last_updated.isoformat() if last_updated else "",
+      request.get_full_path(),
+      request.accepted_media_type,
+    )
+
+  def get_object_validators(self, request, updated_at, **kwargs):
+    lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+    # La ruta completa distingue las representaciones (``?fields=``...).
+    etag = make_etag(
+      kwargs[lookup_url_kwarg],
+      updated_at.isoformat(),
+      request.get_full_path(),
+      request.accepted_media_type,
+    )
+    return etag, timegm(updated_at.utctimetuple())
+
+  def get_object_updated_at(self, **kwargs):
+    lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+    queryset = self.filter_queryset(self.get_queryset())
+    try:
+      return (
+        queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+        .values_list("updated_at", flat=True)
+        .first()
+      )
+    except (TypeError, ValueError, ValidationError):
+      return None
+
+  def get_not_modified(self, request, etag, last_modified=None):
+    response = get_conditional_response(
+      request, etag=etag, last_modified=last_modified
+    )
+    if response is not None:
+      response["ETag"] = etag
+      patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+  def set_validators(self, response, etag, last_modified=None):
+    if response.status_code == 200:
+      response["ETag"] = etag
+      if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+      patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+class CachedListMixin:
+  """
+  Caché por usuario de ``list``, por delante de ``ConditionalGetMixin``.
+
+  La clave combina el usuario, los parámetros normalizados y la versión de la
+  etiqueta ``(state, assigned_user__username)`` de la consulta; las señales de
+  ``Task`` cambian esa versión cuando se escribe una tarea que podría aparecer
+  en el listado (ver ``list_cache``). Un acierto no consulta la base de datos.
+  Con ``TASK_LIST_CACHE`` desactivado se lista directamente.
+  """
+
+  def list(self, request, *args, **kwargs):
+    if not settings.TASK_LIST_CACHE:
+      return super().list(request, *args, **kwargs)
+
+    cache = list_cache.get_cache()
+    key = list_cache.entry_key(request, request.user.pk)
+    entry = cache.get(key)
+    if entry is not None:
+      list_cache.record(hit=True)
+      etag, data = entry
+      response = self.get_not_modified(request, etag)
+      if response is None:
+        response = self.set_validators(Response(data), etag)
+      response["X-Cache"] = "HIT"
+      return response
+
+    list_cache.record(hit=False)
+    response = super().list(request, *args, **kwargs)
+    if response.status_code == 200:
+      cache.set(
+        key,
+        (response["ETag"], response.data),
+        routers.cache_timeout(cache.default_timeout),
+      )
+    response["X-Cache"] = "MISS"
+    return response
+
+
+class SparseFieldsViewMixin:
+  """
+  ``?fields=a,b`` y ``?omit=c`` en las lecturas: reducen tanto los campos que
+  se serializan como las columnas que se leen (``QuerySet.only``).
+
+  ``sparse_fields`` da, por acción, los campos que se devuelven si no se pide
+  otra cosa (``None``: todos); las acciones que no aparecen ignoran los
+  parámetros. ``?fields=__all__`` pide todos los campos. ``id`` se devuelve
+  siempre y ``sparse_columns`` son columnas que se leen siempre (las del
+  orden y el cursor de la paginación).
+  """
+
+  sparse_fields = {}
+  sparse_columns = ("id",)
+  fields_param = "fields"
+  omit_param = "omit"
+  all_fields = "__all__"
+
+  def get_sparse_fields(self):
+    """
+    Campos que se devuelven en esta petición, o ``None`` si son todos.
+    """
+    if not hasattr(self, "_sparse_fields"):
+      self._sparse_fields = self.resolve_sparse_fields()
+    return self._sparse_fields
+
+  def resolve_sparse_fields(self):
+    request = getattr(self, "request", None)
+    if (
+      request is None
+      or request.method not in ("GET", "HEAD")
+      or self.action not in self.sparse_fields
+    ):
+      return None
+    available = list(self.get_serializer_class()().fields)
+    requested = self.parse_field_list(self.fields_param, available)
+    omitted = self.parse_field_list(self.omit_param, available) or []
+
+    if requested is None:
+      requested = self.sparse_fields[self.action]
+    if requested == [self.all_fields] or requested is None:
+      requested = available
+    selected = [
+      name for name in available
+      if name == "id" or (name in requested and name not in omitted)
+    ]
+    return None if selected == available else selected
+
+  def parse_field_list(self, param, available):
+    value = self.request.query_params.get(param)
+    if value is None:
+      return None
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    if param == self.fields_param and names == [self.all_fields]:
+      return names
+    unknown = [name for name in names if name not in available]
+    if unknown:
+      raise serializers.ValidationError(
+        {param: [f'"{name}" no es un campo válido.' for name in unknown]}
+      )
+    return names
+
+  def get_sparse_columns(self):
+    """
+    Columnas a leer para los campos pedidos, o ``None`` si hay que leerlas
+    todas (algún campo no corresponde a una columna del modelo).
+    """
+    fields = self.get_sparse_fields()
+    if fields is None:
+      return None
+    serializer = self.get_serializer_class()()
+    model_fields = {field.name for field in serializer.Meta.model._meta.concrete_fields}
+    columns = list(self.sparse_columns)
+    for name in fields:
+      source = serializer.fields[name].source
+      if source not in model_fields:
+        return None
+      if source not in columns:
+        columns.append(source)
+    return columns
+
+  def get_queryset(self):
+    queryset = super().get_queryset()
+    columns = self.get_sparse_columns()
+    if columns is not None:
+      queryset = queryset.only(*columns)
+    return queryset
+
+  def get_serializer(self, *args, **kwargs):
+    fields = self.get_sparse_fields()
+    if fields is not None:
+      kwargs.setdefault("fields", fields)
+    return super().get_serializer(*args, **kwargs)
+
+
+class RowEncoderMixin:
+  """
+  Lecturas sin serializador en las acciones de ``fast_read_actions``: las
+  filas se leen con ``values_list`` y se convierten con un
+  ``encoders.RowEncoder``, con la misma salida que el serializador. Si el
+  serializador tiene algún campo que no sale de una columna se usa él.
+  """
+
+  fast_read_actions = ()
+
+  def get_row_encoder(self):
+    if self.action not in self.fast_read_actions:
+      return None
+    fields = self.get_sparse_fields() if hasattr(self, "get_sparse_fields") else None
+    return encoders.get_encoder(self.get_serializer_class(), fields)
+
+  def list_response(self, queryset):
+    encoder = self.get_row_encoder()
+    if encoder is None or self.paginator is None:
+      return super().list_response(queryset)
+    page_queryset = self.paginator.get_page_queryset(queryset, self.request, self)
+    rows = list(self.get_encoded_page_queryset(page_queryset, encoder))
+    page = self.paginator.paginate_rows(rows, self.request)
+    return self.get_paginated_response(encoder.encode_many(page))
+
+  def get_encoded_page_queryset(self, page_queryset, encoder):
+    # Las filas llevan también las columnas del cursor de la paginación.
+    return encoder.values(page_queryset, *(name for name, _ in self.paginator.fields))
@@ -1,6 +1,7 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
-from django.db.models import TextChoices
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models import Case, Q, TextChoices, Value, When
 
 
 # Create your models here.
@@ -12,15 +13,49 @@ class Task(models.Model):
     TEST = "TEST", "Test"
     DONE = "DONE", "Done"
 
+    @classmethod
+    def get_workflow(cls):
+      """
+      Estados del flujo Kanban, en orden.
+      """
+      return [cls.BACKLOG, cls.TO_DO, cls.DOING, cls.TEST, cls.DONE]
+
+    @classmethod
+    def allowed_sources(cls, target):
+      """
+      Estados desde los que se puede pasar a ``target``: el anterior del flujo
+      (avance) y el siguiente (retroceso, p. ej. de TEST a DOING si falla la
+      verificación).
+      """
+      workflow = cls.get_workflow()
+      index = workflow.index(target)
+      return [
+        workflow[i] for i in (index - 1, index + 1) if 0 <= i < len(workflow)
+      ]
+
   class PriorityChoices(TextChoices):
     HIGH = "ALTA", "Alta"
     MEDIUM = "MEDIA", "Media"
     LOW = "BAJA", "Baja"
 
-  @classmethod
-  def get_ordering(cls):
+    @classmethod
+    def get_ordering(cls):
+      """
+      Prioridades de la más urgente a la menos urgente.
+      """
       return [cls.HIGH, cls.MEDIUM, cls.LOW]
 
+    @classmethod
+    def rank(cls, value):
+      """
+      Rango numérico de una prioridad (1 = más urgente), el mismo que
+      calcula la base de datos para ``Task.priority_rank``.
+      """
+      ordering = cls.get_ordering()
+      if value not in ordering:
+        return len(ordering) + 1
+      return ordering.index(value) + 1
+
   name = models.CharField(max_length=200, verbose_name="Nombre de la tarea")
   description = models.TextField(verbose_name="Descripción de la tarea")
   state = models.CharField(
@@ -35,6 +70,20 @@ class Task(models.Model):
     default=PriorityChoices.MEDIUM,
     verbose_name="Prioridad",
   )
+  # Rango numérico de la prioridad, calculado por la base de datos al escribir
+  # la fila; permite ordenar por urgencia real usando un índice.
+  priority_rank = models.GeneratedField(
+    expression=Case(
+      *[
+        When(priority=value, then=Value(rank))
+        for rank, value in enumerate(PriorityChoices.get_ordering(), start=1)
+      ],
+      default=Value(len(PriorityChoices.get_ordering()) + 1),
+    ),
+    output_field=models.PositiveSmallIntegerField(),
+    db_persist=True,
+    verbose_name="Rango de prioridad",
+  )
   due_date = models.DateField(verbose_name="Fecha de entrega")
   comment = models.TextField(blank=True, null=True, verbose_name="Comentario")
   assigned_user = models.ForeignKey(
@@ -44,8 +93,15 @@ class Task(models.Model):
     blank=True,
     related_name="assigned_tasks",
     verbose_name="Usuario asignado",
+    # ``task_user_state_due_idx`` empieza por esta columna y ya sirve las
+    # búsquedas por usuario (incluido el SET_NULL al borrarlo).
+    db_index=False,
   )
 
+  # Documento de búsqueda (nombre + descripción). En PostgreSQL lo mantiene
+  # un trigger en cada escritura; en otros motores queda vacío.
+  search_vector = SearchVectorField(null=True, editable=False)
+
   created_at = models.DateTimeField(
     auto_now_add=True, verbose_name="Fecha de creación"
   )
@@ -54,9 +110,109 @@ class Task(models.Model):
   )
 
   class Meta:
-    ordering = ["due_date", "priority"]
+    ordering = ["due_date", "priority_rank"]
+    # Índices alineados con los filtros y el orden que sirve TaskViewSet;
+    # ``manage.py explain_task_queries`` muestra el plan de cada combinación.
+    indexes = [
+      models.Index(
+        fields=["due_date", "priority_rank", "id"],
+        name="task_due_priority_idx",
+      ),
+      models.Index(
+        fields=["state", "due_date", "priority_rank"],
+        name="task_state_due_idx",
+      ),
+      models.Index(
+        fields=["assigned_user", "state", "due_date"],
+        name="task_user_state_due_idx",
+      ),
+      # Sincronización incremental (``/tasks/changes/``): cambios posteriores
+      # a un cursor ``(updated_at, id)``.
+      models.Index(fields=["updated_at", "id"], name="task_updated_idx"),
+    ]
     verbose_name = "Tarea"
     verbose_name_plural = "Tareas"
 
+  # Campos cuyo valor previo necesitan las señales al guardar o borrar una
+  # tarea (ver ``signals.snapshot_task``).
+  tracked_fields = ("state", "assigned_user_id")
+
   def __str__(self):
     return self.name
+
+  def save(self, *args, **kwargs):
+    # Los receptores de ``post_save`` actualizan ``TaskCounter``: la fila y
+    # los contadores se confirman juntos.
+    with transaction.atomic(using=kwargs.get("using"), savepoint=False):
+      super().save(*args, **kwargs)
+    # La base de datos recalcula el rango al escribir; se refleja en la
+    # instancia para no tener que releer la fila.
+    self.priority_rank = self.PriorityChoices.rank(self.priority)
+
+
+class TaskTombstone(models.Model):
+  """
+  Registro de una tarea eliminada, para que los clientes que sincronizan de
+  forma incremental sepan qué tareas borrar. Se crea desde la señal
+  ``post_delete`` de ``Task`` y se purga con ``prune_task_tombstones``.
+  """
+
+  task_id = models.BigIntegerField(verbose_name="Id de la tarea")
+  deleted_at = models.DateTimeField(
+    auto_now_add=True, db_index=True, verbose_name="Fecha de eliminación"
+  )
+
+  class Meta:
+    ordering = ["id"]
+    verbose_name = "Tarea eliminada"
+    verbose_name_plural = "Tareas eliminadas"
+
+  def __str__(self):
+    return f"{self.task_id} ({self.deleted_at:%Y-%m-%d %H:%M})"
+
+
+class TaskCounter(models.Model):
+  """
+  Número de tareas de cada usuario (``user`` nulo: sin asignar) en cada
+  estado, para que los paneles no tengan que contar tareas.
+
+  Se actualiza en la misma transacción que cada escritura de ``Task`` (ver
+  ``counters``) y ``reconcile_task_counters`` lo recalcula desde las tareas.
+  """
+
+  user = models.ForeignKey(
+    User,
+    on_delete=models.CASCADE,
+    null=True,
+    blank=True,
+    related_name="task_counters",
+    verbose_name="Usuario",
+  )
+  state = models.CharField(
+    max_length=10, choices=Task.StateChoices.choices, verbose_name="Estado"
+  )
+  # Sin restricción de positivo: un contador desajustado no debe hacer fallar
+  # la escritura de la tarea, se corrige al reconciliar.
+  count = models.IntegerField(default=0, verbose_name="Número de tareas")
+
+  class Meta:
+    ordering = ["user_id", "state"]
+    # Un contador por par; los NULL no chocan entre sí en un índice único,
+    # así que los de "sin asignar" tienen el suyo.
+    constraints = [
+      models.UniqueConstraint(
+        fields=["user", "state"],
+        condition=Q(user__isnull=False),
+        name="taskcounter_user_state_uniq",
+      ),
+      models.UniqueConstraint(
+        fields=["state"],
+        condition=Q(user__isnull=True),
+        name="taskcounter_unassigned_state_uniq",
+      ),
+    ]
+    verbose_name = "Contador de tareas"
+    verbose_name_plural = "Contadores de tareas"
+
+  def __str__(self):
+    return f"{self.user_id or '-'} / {self.state}: {self.count}"
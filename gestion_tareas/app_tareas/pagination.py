@@ -0,0 +1,221 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework import filters
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class TaskCursorPagination(BasePagination):
+  """
+  Paginación por cursor (keyset) sobre un orden total de las tareas.
+
+  A diferencia de ``CursorPagination`` de DRF, que solo posiciona por el
+  primer campo y desempata con un offset, el cursor guarda el valor de todos
+  los campos del orden, de modo que cada página es un ``WHERE`` sobre el
+  índice seguido de un ``LIMIT``. Nunca se ejecuta ``COUNT(*)``.
+  """
+
+  cursor_query_param = "cursor"
+  page_size_query_param = "page_size"
+  # Orden por defecto; también actúa como desempate del orden solicitado.
+  ordering = ("due_date", "priority_rank", "id")
+  invalid_cursor_message = "Cursor inválido."
+
+  def __init__(self):
+    self.page_size = getattr(settings, "API_PAGE_SIZE", 50)
+    self.max_page_size = getattr(settings, "API_MAX_PAGE_SIZE", 500)
+
+  def paginate_queryset(self, queryset, request, view=None):
+    rows = list(self.get_page_queryset(queryset, request, view))
+    return self.paginate_rows(rows, request)
+
+  def paginate_rows(self, rows, request):
+    """
+    Pagina las filas ya leídas de ``get_page_queryset`` (la vista asíncrona
+    las lee con el ORM asíncrono).
+    """
+    self.request = request
+    self.base_url = request.build_absolute_uri()
+    has_more = len(rows) > self.limit
+    rows = rows[: self.limit]
+
+    if self.reverse:
+      rows.reverse()
+      self.has_next = self.cursor is not None
+      self.has_previous = has_more
+    else:
+      self.has_next = has_more
+      self.has_previous = self.cursor is not None
+
+    self.page = rows
+    return rows
+
+  def get_page_queryset(self, queryset, request, view=None):
+    """
+    Devuelve la consulta (sin ejecutar) de la página pedida: el filtro
+    keyset del cursor, el orden total y ``LIMIT page_size + 1``.
+    """
+    self.limit = self.get_page_size(request)
+    self.fields = self.get_ordering(request, queryset, view)
+    self.signature = ",".join(self._order_by(reverse=False))
+
+    self.cursor = self.decode_cursor(request, queryset.model)
+    self.reverse = False
+    if self.cursor is not None:
+      position, self.reverse = self.cursor
+      queryset = queryset.filter(self._keyset_filter(position, self.reverse))
+    return queryset.order_by(*self._order_by(self.reverse))[: self.limit + 1]
+
+  def get_paginated_response(self, data):
+    return Response(
+      {
+        "next": self.get_next_link(),
+        "previous": self.get_previous_link(),
+        "results": data,
+      }
+    )
+
+  def get_paginated_response_schema(self, schema):
+    return {
+      "type": "object",
+      "required": ["results"],
+      "properties": {
+        "next": {"type": "string", "nullable": True, "format": "uri"},
+        "previous": {"type": "string", "nullable": True, "format": "uri"},
+        "results": schema,
+      },
+    }
+
+  def get_page_size(self, request):
+    try:
+      size = int(request.query_params[self.page_size_query_param])
+    except (KeyError, ValueError):
+      return self.page_size
+    if size <= 0:
+      return self.page_size
+    return min(size, self.max_page_size)
+
+  def get_ordering(self, request, queryset, view):
+    """
+    Devuelve la lista ``[(campo, descendente), ...]`` que define el orden.
+
+    Se respeta el orden pedido con ``?ordering=`` (vía ``OrderingFilter``) y
+    se completa con ``self.ordering`` para que el orden sea total.
+    """
+    requested = []
+    for backend in getattr(view, "filter_backends", []):
+      if issubclass(backend, filters.OrderingFilter):
+        requested = backend().get_ordering(request, queryset, view) or []
+        break
+
+    fields = []
+    for item in list(requested) + list(self.ordering):
+      name = item.lstrip("-")
+      if name == "pk":
+        name = "id"
+      if name not in [field for field, _ in fields]:
+        fields.append((name, item.startswith("-")))
+    return fields
+
+  def _order_by(self, reverse):
+    return [
+      f"-{name}" if descending != reverse else name
+      for name, descending in self.fields
+    ]
+
+  def _keyset_filter(self, position, reverse):
+    """
+    Construye ``(a, b, c) > (x, y, z)`` como una cadena de ``OR``.
+
+    La primera condición acota el primer campo por sí sola para que el
+    planificador pueda usar el índice aunque no expanda la disyunción.
+    """
+    first, descending = self.fields[0]
+    bound = "lte" if descending != reverse else "gte"
+    keyset = Q()
+    equal = {}
+    for (name, descending), value in zip(self.fields, position):
+      lookup = "lt" if descending != reverse else "gt"
+      keyset |= Q(**equal, **{f"{name}__{lookup}": value})
+      equal[name] = value
+    return Q(**{f"{first}__{bound}": position[0]}) & keyset
+
+  def decode_cursor(self, request, model):
+    """
+    Devuelve ``(posición, reverse)`` del cursor de la petición, con cada valor
+    de la posición convertido al tipo de su campo, o lanza ``NotFound`` si el
+    cursor no es válido para el orden pedido.
+    """
+    encoded = request.query_params.get(self.cursor_query_param)
+    if encoded is None:
+      return None
+    try:
+      payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+      position = payload["p"]
+      reverse = bool(payload.get("r", False))
+      signature = payload["o"]
+      if (
+        signature != self.signature
+        or not isinstance(position, list)
+        or len(position) != len(self.fields)
+      ):
+        raise ValueError
+      position = [
+        self.parse_value(model, name, value)
+        for (name, _), value in zip(self.fields, position)
+      ]
+    except (
+      TypeError,
+      ValueError,
+      KeyError,
+      binascii.Error,
+      UnicodeError,
+      ValidationError,
+      FieldDoesNotExist,
+    ):
+      raise NotFound(self.invalid_cursor_message)
+    return position, reverse
+
+  def parse_value(self, model, name, value):
+    # El cursor llega del cliente: cada valor debe ser un escalar JSON válido
+    # para su campo (fecha, entero...) antes de llegar al filtro. Los campos
+    # del orden no admiten nulos.
+    if value is None or isinstance(value, (list, dict)):
+      raise ValueError(value)
+    field = model._meta.get_field(name)
+    # ``priority_rank`` es un GeneratedField: el tipo es el de su output_field.
+    return getattr(field, "output_field", field).to_python(value)
+
+  def encode_cursor(self, row, reverse):
+    position = []
+    for name, _ in self.fields:
+      value = getattr(row, name)
+      if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+      position.append(value)
+    payload = json.dumps(
+      {"p": position, "r": reverse, "o": self.signature},
+      separators=(",", ":"),
+    )
+    encoded = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+    return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+  def get_next_link(self):
+    if not self.has_next or not self.page:
+      return None
+    return self.encode_cursor(self.page[-1], reverse=False)
+
+  def get_previous_link(self):
+    if not self.has_previous:
+      return None
+    if not self.page:
+      return remove_query_param(self.base_url, self.cursor_query_param)
+    return self.encode_cursor(self.page[0], reverse=True)
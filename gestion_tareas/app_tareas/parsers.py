@@ -0,0 +1,47 @@
+import codecs
+
+import orjson
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from .renderers import FastJSONRenderer, MessagePackRenderer, msgpack
+
+
+class FastJSONParser(parsers.JSONParser):
+  """
+  ``JSONParser`` con orjson. Igual que el de DRF, rechaza ``NaN`` e
+  ``Infinity`` y responde 400 si el cuerpo no es JSON válido.
+  """
+
+  renderer_class = FastJSONRenderer
+
+  def parse(self, stream, media_type=None, parser_context=None):
+    parser_context = parser_context or {}
+    encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+    try:
+      body = stream.read()
+      if codecs.lookup(encoding).name != "utf-8":
+        body = body.decode(encoding)
+      return orjson.loads(body)
+    except (ValueError, UnicodeError) as exc:
+      raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackParser(parsers.BaseParser):
+  """
+  Cuerpos MessagePack (``Content-Type: application/msgpack``). Requiere el
+  paquete ``msgpack`` y se activa con ``API_MSGPACK``.
+  """
+
+  media_type = "application/msgpack"
+  renderer_class = MessagePackRenderer
+
+  def parse(self, stream, media_type=None, parser_context=None):
+    if msgpack is None:
+      raise ImproperlyConfigured("MessagePackParser requiere el paquete msgpack.")
+    try:
+      return msgpack.unpackb(stream.read(), raw=False)
+    except (ValueError, TypeError) as exc:
+      raise ParseError(f"MessagePack parse error - {exc}")
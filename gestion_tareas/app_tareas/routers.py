@@ -0,0 +1,94 @@
+import contextvars
+import hashlib
+import random
+from contextlib import contextmanager
+
+from django.conf import settings
+
+_use_primary = contextvars.ContextVar("use_primary", default=False)
+
+
+def get_replicas():
+  return settings.DATABASE_REPLICAS
+
+
+@contextmanager
+def use_primary():
+  """
+  Envía las lecturas del bloque a la base de datos principal.
+  """
+  token = _use_primary.set(True)
+  try:
+    yield
+  finally:
+    _use_primary.reset(token)
+
+
+def reading_from_replica():
+  return bool(get_replicas()) and not _use_primary.get()
+
+
+def cache_timeout(timeout):
+  """
+  Caducidad para cachear algo leído ahora: si viene de una réplica, como
+  mucho ``REPLICA_STICKY_SECONDS``, porque una invalidación hecha en el
+  primario puede llegar antes que el dato nuevo a la réplica y la entrada
+  guardaría el dato antiguo.
+  """
+  if reading_from_replica():
+    if timeout is None:
+      return settings.REPLICA_STICKY_SECONDS
+    return min(timeout, settings.REPLICA_STICKY_SECONDS)
+  return timeout
+
+
+def sticky_key(request):
+  """
+  Clave de caché de la "adherencia" al primario de un cliente: el hash de su
+  cabecera ``Authorization`` (se conoce antes de autenticar), o ``None``.
+  """
+  header = request.META.get("HTTP_AUTHORIZATION")
+  if not header:
+    return None
+  digest = hashlib.sha256(header.encode("utf-8")).hexdigest()
+  return f"replica-sticky:{digest}"
+
+
+class ReplicaRouter:
+  """
+  Lecturas de tareas (y sus contadores) y tokens en las réplicas de ``DATABASE_REPLICAS``;
+  escrituras, migraciones y el resto de modelos en ``default``.
+
+  Las lecturas vuelven al primario dentro de ``use_primary()``, que
+  ``ReplicaStickinessMiddleware`` activa en las peticiones de escritura y en
+  las de un cliente que ha escrito hace menos de ``REPLICA_STICKY_SECONDS``,
+  para que nadie deje de ver su propio cambio por el retraso de replicación.
+  """
+
+  replica_models = {
+    "app_tareas.task",
+    "app_tareas.tasktombstone",
+    "app_tareas.taskcounter",
+    "authtoken.token",
+  }
+
+  def db_for_read(self, model, **hints):
+    if model._meta.label_lower not in self.replica_models:
+      return None
+    if not reading_from_replica():
+      return "default"
+    return random.choice(get_replicas())
+
+  def db_for_write(self, model, **hints):
+    return "default"
+
+  def allow_relation(self, obj1, obj2, **hints):
+    databases = {"default", *get_replicas()}
+    if obj1._state.db in databases and obj2._state.db in databases:
+      return True
+    return None
+
+  def allow_migrate(self, db, app_label, model_name=None, **hints):
+    if db in get_replicas():
+      return False
+    return None
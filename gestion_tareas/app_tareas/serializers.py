@@ -1,6 +1,10 @@
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Task
-from django.contrib.auth.models import User
+from .models import Task, TaskCounter
+from .counters import diff
+from .events import task_event
+from .signals import previous_values, tasks_changed
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
 from rest_framework.validators import UniqueValidator
@@ -12,25 +16,195 @@ class UserSerializer(serializers.ModelSerializer):
     fields = ["id", "username"]
 
 
-class TaskSerializer(serializers.ModelSerializer):
-  assigned_user = serializers.PrimaryKeyRelatedField(
+class AssignedUserField(serializers.PrimaryKeyRelatedField):
+  """
+  PrimaryKeyRelatedField que toma el usuario de ``context["assigned_users"]``
+  cuando el serializador de lista lo ha precargado para todo el lote.
+
+  La búsqueda del usuario ya valida que exista (``does_not_exist``), así que
+  cada petición resuelve el usuario asignado con una consulta como mucho, y
+  cada lote con una sola consulta ``IN``.
+  """
+
+  def to_internal_value(self, data):
+    users = self.context.get("assigned_users")
+    if users is None:
+      return super().to_internal_value(data)
+    if isinstance(data, bool):
+      self.fail("incorrect_type", data_type=type(data).__name__)
+    try:
+      pk = int(data)
+    except (TypeError, ValueError):
+      self.fail("incorrect_type", data_type=type(data).__name__)
+    if pk not in users:
+      self.fail("does_not_exist", pk_value=data)
+    return users[pk]
+
+
+class TaskListSerializer(serializers.ListSerializer):
+  """
+  Serializador de lotes de tareas.
+
+  Valida todo el lote en una pasada: los usuarios asignados se resuelven con
+  una sola consulta ``IN`` y las escrituras se hacen con ``bulk_create`` /
+  ``bulk_update``. Los errores se devuelven por elemento, en el mismo orden
+  que la entrada.
+  """
+
+  def to_internal_value(self, data):
+    # Un lote demasiado grande lo rechaza ``super()`` sin llegar a consultar.
+    if isinstance(data, list) and not self.too_long(data):
+      self._context["assigned_users"] = self.prefetch_assigned_users(data)
+    if self.instance is not None:
+      self.instances_by_id = {task.pk: task for task in self.instance}
+      self.matched_instances = []
+      self.seen_ids = set()
+    return super().to_internal_value(data)
+
+  def too_long(self, data):
+    return self.max_length is not None and len(data) > self.max_length
+
+  def prefetch_assigned_users(self, data):
+    ids = set()
+    for item in data:
+      value = item.get("assigned_user") if isinstance(item, dict) else None
+      if isinstance(value, bool):
+        continue
+      try:
+        ids.add(int(value))
+      except (TypeError, ValueError):
+        continue
+    return User.objects.in_bulk(ids) if ids else {}
+
+  def run_child_validation(self, data):
+    if self.instance is None:
+      return super().run_child_validation(data)
+
+    try:
+      pk = int(data["id"])
+    except (TypeError, KeyError, ValueError):
+      raise serializers.ValidationError({"id": ["Este campo es requerido."]})
+    if pk not in self.instances_by_id:
+      raise serializers.ValidationError({"id": ["No existe una tarea con este id."]})
+    if pk in self.seen_ids:
+      raise serializers.ValidationError({"id": ["Tarea repetida en el lote."]})
+
+    self.child.instance = self.instances_by_id[pk]
+    self.child.initial_data = data
+    validated = super().run_child_validation(data)
+    self.seen_ids.add(pk)
+    self.matched_instances.append(self.child.instance)
+    return validated
+
+  def create(self, validated_data):
+    tasks = [Task(**attrs) for attrs in validated_data]
+    tasks = Task.objects.bulk_create(tasks, batch_size=settings.API_BULK_BATCH_SIZE)
+    pairs = [(task.state, task.assigned_user_id) for task in tasks]
+    tasks_changed.send(
+      sender=Task,
+      changes=set(pairs),
+      events=[task_event("created", task) for task in tasks],
+      deltas=diff(after=pairs),
+    )
+    return tasks
+
+  def update(self, instances, validated_data):
+    now = timezone.now()
+    fields = {"updated_at"}
+    before, after = [], []
+    events = []
+    for task, attrs in zip(self.matched_instances, validated_data):
+      previous = {name: getattr(task, name) for name in Task.tracked_fields}
+      before.append((task.state, task.assigned_user_id))
+      for attr, value in attrs.items():
+        setattr(task, attr, value)
+        fields.add(attr)
+      task.updated_at = now
+      after.append((task.state, task.assigned_user_id))
+      events.append(task_event("updated", task, previous_values(previous)))
+    Task.objects.bulk_update(
+      self.matched_instances, sorted(fields), batch_size=settings.API_BULK_BATCH_SIZE
+    )
+    tasks_changed.send(
+      sender=Task,
+      changes=set(before) | set(after),
+      events=events,
+      deltas=diff(before, after),
+    )
+    return self.matched_instances
+
+
+class SparseFieldsMixin:
+  """
+  Serializador que acepta ``fields=[...]``: solo se conservan esos campos
+  (en el orden en que se declaran). Lo usa ``mixins.SparseFieldsViewMixin``
+  para ``?fields=`` / ``?omit=``.
+  """
+
+  def __init__(self, *args, fields=None, **kwargs):
+    super().__init__(*args, **kwargs)
+    if fields is not None:
+      for name in set(self.fields) - set(fields):
+        self.fields.pop(name)
+
+
+class TaskSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+  assigned_user = AssignedUserField(
     queryset=User.objects.all(), required=False, allow_null=True
   )
 
   class Meta:
     model = Task
-    fields = "__all__"
-
-  def validate_assigned_user(self, value):
-    """
-    Valida que el usuario asignado sea válido.
-    Si no se proporciona, se asigna None.
-    """
-    if value is None:
-      return None
-    if not User.objects.filter(id=value.id).exists():
-      raise serializers.ValidationError("El usuario asignado no existe.")
-    return value
+    exclude = ["priority_rank", "search_vector"]
+    list_serializer_class = TaskListSerializer
+
+
+class TaskIdsSerializer(serializers.Serializer):
+  """
+  Lista de ids de tareas para las operaciones por lote.
+  """
+
+  ids = serializers.ListField(
+    child=serializers.IntegerField(min_value=1),
+    allow_empty=False,
+    max_length=settings.API_MAX_BULK_SIZE,
+  )
+
+
+class TaskTransitionSerializer(serializers.Serializer):
+  """
+  Cambio de estado por lote: estado destino y, opcionalmente, los ids de las
+  tareas (si no se indican se usan los filtros de la petición).
+  """
+
+  state = serializers.ChoiceField(choices=Task.StateChoices.choices)
+  ids = serializers.ListField(
+    child=serializers.IntegerField(min_value=1),
+    allow_empty=False,
+    max_length=settings.API_MAX_BULK_SIZE,
+    required=False,
+  )
+
+
+class TaskBoardSerializer(serializers.Serializer):
+  """
+  Parámetros del tablero: tarjetas por columna.
+  """
+
+  limit = serializers.IntegerField(
+    min_value=1,
+    max_value=settings.API_MAX_PAGE_SIZE,
+    default=settings.API_BOARD_CARDS,
+  )
+
+
+class TaskCounterSerializer(serializers.ModelSerializer):
+  assigned_user = serializers.IntegerField(source="user_id", read_only=True)
+  username = serializers.CharField(source="user.username", read_only=True, default=None)
+
+  class Meta:
+    model = TaskCounter
+    fields = ["assigned_user", "username", "state", "count"]
 
 
 class RegisterSerializer(serializers.ModelSerializer):
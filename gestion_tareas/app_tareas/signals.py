@@ -1,13 +1,169 @@
 from django.conf import settings
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import Signal, receiver
+from django.utils import timezone
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import get_user_model
 
+from . import counters, db_stats, events, list_cache
+from .authentication import invalidate_tokens
+from .models import Task, TaskTombstone
+
 User = get_user_model()
 
+# Se envía después de escribir tareas sin pasar por save()/delete()
+# (bulk_create, bulk_update, update()), y también desde los receptores de
+# post_save/post_delete de Task. ``changes`` son los pares
+# ``(state, assigned_user_id)`` afectados, antes y después de la escritura;
+# ``events`` (opcional), los eventos que se envían a los suscriptores SSE;
+# ``deltas`` (opcional), la variación de ``TaskCounter`` por par (ver
+# ``counters.diff``). Se envía dentro de la transacción de la escritura.
+tasks_changed = Signal()
+
 
 @receiver(post_save, sender=User)
 def create_auth_token(sender, instance=None, created=False, **kwargs):
   if created:
     Token.objects.create(user=instance)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_token_cache(sender, instance=None, created=False, **kwargs):
+  """
+  Cualquier cambio en el usuario (desactivarlo, cambiar permisos...) invalida
+  la copia cacheada que guarda CachedTokenAuthentication.
+  """
+  if not created:
+    invalidate_tokens(*Token.objects.filter(user=instance).values_list("key", flat=True))
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token_cache(sender, instance=None, **kwargs):
+  invalidate_tokens(instance.key)
+
+
+@receiver(pre_save, sender=Task)
+def snapshot_task(sender, instance, using=None, **kwargs):
+  """
+  Lee con ``SELECT ... FOR UPDATE`` el estado y el usuario previos de la
+  tarea. Se ejecuta en la transacción de ``Task.save``: hasta el ``COMMIT``
+  nadie más puede cambiarlos, así que la variación de los contadores parte
+  del valor real y no de lo que se leyó al cargar la instancia.
+  """
+  if instance._state.adding:
+    return
+  instance._loaded_values = lock_tracked_values(instance, using)
+
+
+@receiver(pre_delete, sender=Task)
+def snapshot_deleted_task(sender, instance, using=None, **kwargs):
+  # Igual que ``snapshot_task``: el borrado resta del contador en el que está
+  # la fila, no del que tenía la instancia al cargarla.
+  instance._loaded_values = lock_tracked_values(instance, using)
+
+
+def lock_tracked_values(instance, using):
+  return (
+    Task.objects.db_manager(using)
+    .select_for_update()
+    .filter(pk=instance.pk)
+    .values(*Task.tracked_fields)
+    .first()
+    or {}
+  )
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, created=False, **kwargs):
+  current = (instance.state, instance.assigned_user_id)
+  changes = {current}
+  deltas = counters.diff(after=[current])
+  previous = getattr(instance, "_loaded_values", {})
+  if not created:
+    if previous:
+      changes.add((previous["state"], previous["assigned_user_id"]))
+      deltas = counters.diff([(previous["state"], previous["assigned_user_id"])], [current])
+    else:
+      # Sin valores previos (la fila no existía al bloquearla): no se sabe
+      # qué contador restar; lo corrige ``reconcile_task_counters``.
+      deltas = {}
+  instance._loaded_values = {
+    name: getattr(instance, name) for name in Task.tracked_fields
+  }
+  event = events.task_event(
+    "created" if created else "updated", instance, previous_values(previous)
+  )
+  tasks_changed.send(sender=Task, changes=changes, events=[event], deltas=deltas)
+
+
+def previous_values(loaded):
+  """
+  Estado y usuario anteriores de una tarea (en el formato de los eventos).
+  """
+  if not loaded:
+    return None
+  return {"state": loaded["state"], "assigned_user": loaded["assigned_user_id"]}
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+  # Dentro de la transacción del borrado: si se deshace, también el registro.
+  TaskTombstone.objects.create(task_id=instance.pk)
+  loaded = getattr(instance, "_loaded_values", {})
+  if not loaded:
+    # Otro ya la había borrado: no hay contador que restar.
+    return
+  pair = (loaded["state"], loaded["assigned_user_id"])
+  tasks_changed.send(
+    sender=Task,
+    changes={pair},
+    events=[events.task_event("deleted", instance)],
+    deltas=counters.diff(before=[pair]),
+  )
+
+
+@receiver(tasks_changed)
+def invalidate_task_lists(sender, changes, **kwargs):
+  list_cache.invalidate(changes)
+
+
+@receiver(tasks_changed)
+def publish_task_events(sender, **kwargs):
+  events.publish(kwargs.get("events", ()))
+
+
+@receiver(tasks_changed)
+def update_task_counters(sender, **kwargs):
+  counters.apply(kwargs.get("deltas", {}))
+
+
+@receiver(pre_delete, sender=User)
+def unassign_user_counters(sender, instance, **kwargs):
+  """
+  Al borrar un usuario sus tareas pasan a sin asignar con un ``UPDATE`` de
+  ``SET_NULL`` que no envía señales de Task: se suman a los contadores de
+  "sin asignar" (los del usuario se borran en cascada) y se actualiza su
+  ``updated_at`` para que ``/tasks/changes/`` y los ETag las vean cambiar. Se
+  ejecuta en la transacción del borrado, antes de ese ``UPDATE``.
+  """
+  tasks = Task.objects.filter(assigned_user=instance)
+  tasks.update(updated_at=timezone.now())
+  moved = counters.count_tasks(tasks)
+  counters.apply({(state, None): total for (state, _), total in moved.items()})
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_task_lists(sender, instance=None, **kwargs):
+  """
+  Al borrar un usuario sus tareas pasan a no tener asignado (``SET_NULL``,
+  sin señales de Task); al renombrarlo cambian los listados por ``username``.
+  """
+  list_cache.invalidate_user(instance)
+
+
+@receiver(connection_created)
+def count_connect(sender, connection, **kwargs):
+  db_stats.record_connect(connection.alias)
@@ -0,0 +1,109 @@
+import json
+from urllib.parse import parse_qs, urlparse
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import AsyncRequestFactory, RequestFactory, TestCase
+from rest_framework.authtoken.models import Token
+
+from ..async_views import AsyncTaskView
+from ..models import Task
+from ..views import TaskViewSet
+
+
+class AsyncTaskViewParityTests(TestCase):
+    """Las vistas asíncronas responden lo mismo que TaskViewSet."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='asyncuser', password='testpass123')
+        self.token = Token.objects.get(user=self.user)
+        self.tasks = [
+            Task.objects.create(
+                name=f'Tarea {i}', description='Descripción',
+                state='DOING' if i % 2 else 'TO DO',
+                priority=['ALTA', 'MEDIA', 'BAJA'][i % 3],
+                due_date=f'2024-01-0{i % 3 + 1}', assigned_user=self.user
+            )
+            for i in range(7)
+        ]
+        self.headers = {'Authorization': f'Token {self.token.key}'}
+
+    def sync_get(self, path, params=None, detail=False, **headers):
+        request = RequestFactory().get(
+            path, params or {}, headers={**self.headers, **headers}
+        )
+        actions = {'get': 'retrieve'} if detail else {'get': 'list'}
+        kwargs = {'pk': path.rstrip('/').rsplit('/', 1)[1]} if detail else {}
+        return TaskViewSet.as_view(actions)(request, **kwargs).render()
+
+    async def async_get(self, path, params=None, detail=False, **headers):
+        request = AsyncRequestFactory().get(
+            path, params or {}, headers={**self.headers, **headers}
+        )
+        kwargs = {'pk': path.rstrip('/').rsplit('/', 1)[1]} if detail else {}
+        return await AsyncTaskView.as_view(detail=detail)(request, **kwargs)
+
+    async def assertSameResponse(self, path, params=None, detail=False):
+        expected = await sync_to_async(self.sync_get)(path, params, detail)
+        response = await self.async_get(path, params, detail)
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response.get('ETag'), expected.get('ETag'))
+        return response
+
+    async def test_list_parity(self):
+        for params in [
+            {},
+            {'page_size': 3},
+            {'state': 'DOING'},
+            {'ordering': '-due_date'},
+            {'ordering': 'priority', 'assigned_user__username': 'asyncuser'},
+            {'search': 'Tarea 3'},
+            {'state': 'NOPE'},
+        ]:
+            with self.subTest(params=params):
+                await self.assertSameResponse('/api/tasks/', params)
+
+    async def test_list_cursor_parity(self):
+        response = await self.assertSameResponse('/api/tasks/', {'page_size': 3})
+        cursor = parse_qs(urlparse(json.loads(response.content)['next']).query)['cursor'][0]
+        await self.assertSameResponse('/api/tasks/', {'page_size': 3, 'cursor': cursor})
+        await self.assertSameResponse('/api/tasks/', {'cursor': 'no-es-un-cursor'})
+
+    async def test_conditional_list(self):
+        response = await self.async_get('/api/tasks/')
+        not_modified = await self.async_get(
+            '/api/tasks/', **{'If-None-Match': response['ETag']}
+        )
+        self.assertEqual(not_modified.status_code, 304)
+
+    async def test_retrieve_parity(self):
+        path = f'/api/tasks/{self.tasks[0].pk}/'
+        response = await self.assertSameResponse(path, detail=True)
+        self.assertIn('Last-Modified', response)
+        not_modified = await self.async_get(
+            path, detail=True, **{'If-None-Match': response['ETag']}
+        )
+        self.assertEqual(not_modified.status_code, 304)
+        await self.assertSameResponse('/api/tasks/999999/', detail=True)
+        await self.assertSameResponse('/api/tasks/abc/', detail=True)
+
+    async def test_requires_authentication(self):
+        request = AsyncRequestFactory().get('/api/tasks/')
+        response = await AsyncTaskView.as_view()(request)
+        self.assertEqual(response.status_code, 401)
+
+    async def test_writes_are_delegated(self):
+        request = AsyncRequestFactory().post(
+            '/api/tasks/',
+            data=json.dumps({
+                'name': 'Nueva', 'description': 'Descripción',
+                'state': 'BACKLOG', 'priority': 'BAJA', 'due_date': '2024-02-01',
+            }),
+            content_type='application/json', headers=self.headers
+        )
+        view = AsyncTaskView.as_view()
+        self.assertTrue(view.csrf_exempt)
+        response = await view(request)
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(await Task.objects.filter(name='Nueva').aexists())
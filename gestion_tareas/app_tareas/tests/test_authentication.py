@@ -0,0 +1,120 @@
+import os
+import runpy
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from ..authentication import token_cache_key
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='cacheuser',
+            password='testpass123',
+            email='cache@example.com'
+        )
+        self.token = Token.objects.get(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.url = reverse('task-list')
+
+    def test_token_lookup_is_cached(self):
+        with self.assertNumQueries(3):  # token + usuario, y el listado (ETag + página)
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(2):  # solo el listado
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    @override_settings(AUTH_TOKEN_CACHE=False)
+    def test_cache_can_be_disabled(self):
+        for _ in range(2):
+            with self.assertNumQueries(3):
+                self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    def test_invalid_token_is_rejected(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + 'x' * 40)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_token_is_invalidated(self):
+        self.client.get(self.url)
+        self.token.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_regenerated_token_is_invalidated(self):
+        self.client.get(self.url)
+        old_key = self.token.key
+        self.token.delete()
+        new_token = Token.objects.create(user=self.user)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + new_token.key)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(old_key, new_token.key)
+
+    def test_deactivated_user_is_invalidated(self):
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_entry_cached_before_commit_is_invalidated(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+            # Otra petición resuelve el token antes del COMMIT y lo vuelve a
+            # cachear con el usuario todavía activo.
+            key = token_cache_key(self.token.key)
+            cache.set(key, (self.user.pk, self.token.key))
+        self.assertIsNone(cache.get(key))
+
+    def test_deleted_user_is_invalidated(self):
+        self.client.get(self.url)
+        self.user.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_login_token_authenticates(self):
+        response = self.client.post(reverse('login'), {
+            'username': 'cacheuser',
+            'password': 'testpass123'
+        }, format='json')
+        self.assertEqual(response.data['token'], self.token.key)
+        self.client.get(self.url)
+        with self.assertNumQueries(2):  # solo el listado
+            self.client.get(self.url)
+
+
+class TokenCacheSettingsTests(SimpleTestCase):
+    def load(self, **env):
+        base = {
+            name: value for name, value in os.environ.items()
+            if name not in ('SERVER_WORKERS', 'CACHE_BACKEND', 'AUTH_TOKEN_CACHE')
+        }
+        with mock.patch.dict(os.environ, {**base, **env}, clear=True):
+            return runpy.run_path(str(Path(settings.BASE_DIR) / 'gestion_tareas' / 'settings.py'))
+
+    def test_local_memory_cache_is_only_used_by_a_single_process(self):
+        self.assertTrue(self.load()['AUTH_TOKEN_CACHE'])
+        self.assertFalse(self.load(SERVER_WORKERS='4')['AUTH_TOKEN_CACHE'])
+        shared = self.load(
+            SERVER_WORKERS='4',
+            CACHE_BACKEND='django.core.cache.backends.redis.RedisCache',
+        )
+        self.assertTrue(shared['AUTH_TOKEN_CACHE'])
+        self.assertTrue(self.load(SERVER_WORKERS='4', AUTH_TOKEN_CACHE='true')['AUTH_TOKEN_CACHE'])
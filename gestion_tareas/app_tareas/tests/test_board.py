@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from ..models import Task
+
+
+class TaskBoardTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='boarduser', password='testpass123')
+        self.other = User.objects.create_user(username='otherboard', password='testpass123')
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        start = date(2024, 1, 1)
+        for i in range(5):
+            Task.objects.create(
+                name=f'Doing {i}', description='Descripción', state='DOING',
+                priority=['BAJA', 'ALTA'][i % 2], due_date=start + timedelta(days=i // 2),
+                assigned_user=self.user if i < 3 else self.other
+            )
+        Task.objects.create(
+            name='Test', description='Descripción', state='TEST',
+            due_date=start, assigned_user=self.other
+        )
+        self.url = reverse('task-board')
+
+    def columns(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {column['state']: column for column in response.data['columns']}
+
+    def test_columns_follow_workflow_with_counts(self):
+        response = self.client.get(self.url)
+        self.assertEqual(
+            [column['state'] for column in response.data['columns']],
+            ['BACKLOG', 'TO DO', 'DOING', 'TEST', 'DONE'],
+        )
+        columns = self.columns()
+        self.assertEqual(columns['DOING']['count'], 5)
+        self.assertEqual(columns['TEST']['count'], 1)
+        self.assertEqual(columns['BACKLOG']['count'], 0)
+        self.assertEqual(columns['BACKLOG']['cards'], [])
+
+    def test_cards_are_top_n_in_list_order(self):
+        cards = self.columns(limit=3)['DOING']['cards']
+        expected = list(
+            Task.objects.filter(state='DOING')
+            .order_by('due_date', 'priority_rank', 'id')
+            .values_list('name', flat=True)[:3]
+        )
+        self.assertEqual([card['name'] for card in cards], expected)
+        self.assertEqual(expected[:2], ['Doing 1', 'Doing 0'])
+
+    def test_scoped_to_assignee(self):
+        columns = self.columns(assigned_user__username='boarduser')
+        self.assertEqual(columns['DOING']['count'], 3)
+        self.assertEqual(columns['TEST']['count'], 0)
+        self.assertEqual(len(columns['DOING']['cards']), 3)
+
+    def test_two_queries_regardless_of_size(self):
+        self.client.get(self.url)  # el token queda en caché
+        with self.assertNumQueries(2):
+            self.client.get(self.url, {'limit': 2})
+
+    def test_invalid_limit(self):
+        response = self.client.get(self.url, {'limit': 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
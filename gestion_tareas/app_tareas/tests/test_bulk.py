@@ -0,0 +1,171 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase, force_authenticate
+
+from ..models import Task
+from ..views import TaskViewSet
+
+
+class TaskBulkTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bulkuser',
+            password='testpass123',
+            email='bulk@example.com'
+        )
+        self.other = User.objects.create_user(
+            username='otheruser',
+            password='testpass123',
+            email='other@example.com'
+        )
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.url = reverse('task-bulk')
+
+    def task_data(self, i, **extra):
+        data = {
+            'name': f'Tarea {i}',
+            'description': 'Descripción',
+            'state': 'BACKLOG',
+            'priority': 'MEDIA',
+            'due_date': '2024-01-01',
+            'assigned_user': self.user.pk if i % 2 else self.other.pk,
+        }
+        data.update(extra)
+        return data
+
+    def create_task(self, i):
+        data = self.task_data(i)
+        data['assigned_user_id'] = data.pop('assigned_user')
+        return Task.objects.create(**data)
+
+    def test_bulk_create(self):
+        payload = [self.task_data(i) for i in range(20)]
+        # Autenticación + una consulta IN de usuarios + el INSERT (y su transacción)
+        # + dos contadores nuevos (2 UPDATE sin filas, un INSERT y 2 UPDATE)
+        with self.assertNumQueries(5 + 5):
+            response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 20)
+        self.assertEqual(Task.objects.count(), 20)
+        self.assertEqual(Task.objects.filter(assigned_user=self.other).count(), 10)
+        self.assertTrue(all(item['id'] for item in response.data))
+
+    def test_bulk_create_reports_errors_per_item(self):
+        payload = [
+            self.task_data(0),
+            self.task_data(1, assigned_user=9999),
+            self.task_data(2, state='NOPE'),
+        ]
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('assigned_user', response.data[1])
+        self.assertIn('state', response.data[2])
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_bulk_create_rejects_non_list_and_empty(self):
+        response = self.client.post(self.url, self.task_data(0), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(self.url, [], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_create_limit(self):
+        with self.settings(API_MAX_BULK_SIZE=2):
+            payload = [self.task_data(i) for i in range(3)]
+            # Solo la autenticación: el lote se rechaza antes de buscar usuarios.
+            with self.assertNumQueries(1):
+                response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update_limit(self):
+        tasks = [self.create_task(i) for i in range(3)]
+        with self.settings(API_MAX_BULK_SIZE=2):
+            payload = [{'id': task.pk, 'assigned_user': self.other.pk} for task in tasks]
+            with self.assertNumQueries(1):
+                response = self.client.patch(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update(self):
+        tasks = [self.create_task(i) for i in range(3)]
+        before = {task.pk: task.updated_at for task in tasks}
+        payload = [
+            {'id': tasks[0].pk, 'state': 'DOING', 'assigned_user': self.other.pk},
+            {'id': tasks[1].pk, 'priority': 'ALTA'},
+        ]
+        response = self.client.patch(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+        tasks[0].refresh_from_db()
+        tasks[1].refresh_from_db()
+        tasks[2].refresh_from_db()
+        self.assertEqual(tasks[0].state, 'DOING')
+        self.assertEqual(tasks[0].assigned_user, self.other)
+        self.assertEqual(tasks[1].priority, 'ALTA')
+        self.assertEqual(tasks[1].priority_rank, 1)
+        self.assertEqual(tasks[1].state, 'BACKLOG')
+        self.assertGreater(tasks[0].updated_at, before[tasks[0].pk])
+        self.assertEqual(tasks[2].updated_at, before[tasks[2].pk])
+
+    def test_bulk_update_locks_tasks(self):
+        task = self.create_task(1)
+        select_for_update = QuerySet.select_for_update
+        with mock.patch.object(
+            QuerySet, 'select_for_update', autospec=True, side_effect=select_for_update
+        ) as lock:
+            response = self.client.patch(
+                self.url, [{'id': task.pk, 'state': 'DOING'}], format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lock.assert_called_once_with(mock.ANY, of=('self',))
+
+    def test_bulk_update_reports_errors_per_item(self):
+        task = self.create_task(0)
+        payload = [
+            {'id': task.pk, 'state': 'DONE'},
+            {'id': 9999, 'state': 'DONE'},
+            {'state': 'DONE'},
+            {'id': task.pk, 'priority': 'ALTA'},
+        ]
+        response = self.client.patch(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('id', response.data[1])
+        self.assertIn('id', response.data[2])
+        self.assertIn('id', response.data[3])
+        task.refresh_from_db()
+        self.assertEqual(task.state, 'BACKLOG')
+
+    def test_bulk_destroy(self):
+        tasks = [self.create_task(i) for i in range(3)]
+        response = self.client.delete(
+            self.url, {'ids': [tasks[0].pk, tasks[1].pk, 9999]}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'deleted': 2, 'not_found': [9999]})
+        self.assertEqual(list(Task.objects.values_list('pk', flat=True)), [tasks[2].pk])
+
+    def test_bulk_destroy_writes_to_primary_without_middleware(self):
+        tasks = [self.create_task(i) for i in range(2)]
+        request = APIRequestFactory().delete(
+            self.url, {'ids': [task.pk for task in tasks]}, format='json'
+        )
+        force_authenticate(request, user=self.user)
+        view = TaskViewSet.as_view({'delete': 'bulk_destroy'})
+        # Sin ReplicaStickinessMiddleware: una lectura enviada a la réplica
+        # (que no existe en los tests) fallaría.
+        with self.settings(DATABASE_REPLICAS=['replica_1']):
+            response = view(request)
+        self.assertEqual(response.data, {'deleted': 2, 'not_found': []})
+        self.assertFalse(Task.objects.exists())
+
+    def test_bulk_destroy_requires_ids(self):
+        response = self.client.delete(self.url, {'ids': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
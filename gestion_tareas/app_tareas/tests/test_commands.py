@@ -0,0 +1,68 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class ExplainTaskQueriesCommandTests(TestCase):
+    def test_prints_a_plan_per_combination(self):
+        out = StringIO()
+        call_command('explain_task_queries', '--state', 'DOING', stdout=out)
+        output = out.getvalue()
+        self.assertIn('GET /api/tasks/?state=DOING', output)
+        self.assertIn('GET /api/tasks/?ordering=-due_date', output)
+
+
+class BenchmarkHelpersTests(TestCase):
+    def test_percentile_and_summary(self):
+        from ..benchmark import percentile, summarize
+
+        latencies = [i / 1000 for i in range(1, 101)]
+        self.assertEqual(percentile(latencies, 50), 0.05)
+        self.assertEqual(percentile(latencies, 99), 0.099)
+        summary = summarize('list', latencies, elapsed=2.0)
+        self.assertEqual(summary['requests'], 100)
+        self.assertEqual(summary['rps'], 50.0)
+        self.assertAlmostEqual(summary['p99_ms'], 99.0)
+
+    def test_benchmark_requires_data(self):
+        from django.core.management.base import CommandError
+
+        with self.assertRaises(CommandError):
+            call_command('benchmark_task_reads', '--requests', '1', stdout=StringIO())
+
+    def test_serialization_benchmark_rolls_back_its_tasks(self):
+        from ..models import Task
+
+        out = StringIO()
+        call_command(
+            'benchmark_task_serialization', '--tasks', '30', '--repeat', '1',
+            '--create', '--fields', 'name,state', stdout=out
+        )
+        self.assertIn('mejora (solo conversión)', out.getvalue())
+        self.assertFalse(Task.objects.exists())
+
+    def test_renderer_benchmark(self):
+        out = StringIO()
+        call_command(
+            'benchmark_task_renderers', '--tasks', '30', '--repeat', '1', '--create', stdout=out
+        )
+        self.assertIn('json (orjson)', out.getvalue())
+        self.assertIn('MB/s', out.getvalue())
+
+    def test_compression_benchmark(self):
+        out = StringIO()
+        call_command(
+            'benchmark_compression', '--tasks', '30', '--repeat', '1', '--create', stdout=out
+        )
+        self.assertIn('ndjson  gzip-6*', out.getvalue())
+        self.assertIn('ratio', out.getvalue())
+
+    def test_middleware_benchmark(self):
+        from django.contrib.auth.models import User
+
+        User.objects.create_user(username='benchuser', password='testpass123')
+        out = StringIO()
+        call_command('benchmark_middleware', '--requests', '5', '--repeat', '1', stdout=out)
+        self.assertIn('solo middleware /api/', out.getvalue())
+        self.assertIn('ahorro', out.getvalue())
@@ -0,0 +1,207 @@
+import gzip
+import json
+import os
+import runpy
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from .. import compression
+from ..middleware import CompressionMiddleware
+from ..models import Task
+
+
+def decompress(data, encoding):
+    if encoding == 'gzip':
+        return gzip.decompress(data)
+    if encoding == 'br':
+        return compression.brotli.decompress(data)
+    # Los marcos en streaming no llevan el tamaño: se descomprime por flujo.
+    return compression.zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def available(encoding):
+    return compression.COMPRESSORS[encoding] is not None
+
+
+class CompressionHelpersTests(SimpleTestCase):
+    def test_choose_encoding_by_quality_then_server_order(self):
+        encodings = ['zstd', 'br', 'gzip']
+        choose = compression.choose_encoding
+        self.assertEqual(choose('gzip, deflate, br, zstd', encodings), 'zstd')
+        self.assertEqual(choose('gzip;q=1.0, br;q=0.5', encodings), 'gzip')
+        self.assertEqual(choose('*', encodings), 'zstd')
+        self.assertEqual(choose('br;q=0, *;q=0.1', encodings), 'zstd')
+        self.assertIsNone(choose('gzip;q=0', encodings))
+        self.assertIsNone(choose('identity', encodings))
+        self.assertIsNone(choose('', encodings))
+        self.assertIsNone(choose(None, encodings))
+
+    @override_settings(COMPRESSION_ENCODINGS=['zstd', 'deflate', 'gzip'])
+    def test_available_encodings_skip_missing_libraries(self):
+        expected = ['gzip'] if not available('zstd') else ['zstd', 'gzip']
+        self.assertEqual(compression.available_encodings(), expected)
+
+    def test_round_trip(self):
+        data = b'{"name":"Tarea"}\n' * 1000
+        for encoding in ['gzip', 'br', 'zstd']:
+            if not available(encoding):
+                continue
+            with self.subTest(encoding=encoding):
+                compressed = compression.compress(data, encoding)
+                self.assertLess(len(compressed), len(data) // 10)
+                self.assertEqual(decompress(compressed, encoding), data)
+                streamed = b''.join(compression.compress_stream([data[:500], b'', data[500:]], encoding))
+                self.assertEqual(decompress(streamed, encoding), data)
+
+    def test_stream_groups_small_chunks(self):
+        lines = [f'{{"id":{i},"name":"Tarea {i * 7919 % 10007}"}}\n'.encode() for i in range(5000)]
+        for encoding in ['gzip', 'br', 'zstd']:
+            if not available(encoding):
+                continue
+            with self.subTest(encoding=encoding):
+                whole = compression.compress(b''.join(lines), encoding, level=1)
+                streamed = b''.join(compression.compress_stream(lines, encoding, level=1))
+                per_line = b''.join(compression.compress_stream(lines, encoding, level=1, buffer_size=1))
+                self.assertLess(len(streamed), len(whole) * 1.5)
+                self.assertLessEqual(len(streamed), len(per_line))
+
+    @unittest.skipUnless(available('br') and available('zstd'), 'brotli o zstandard no instalados')
+    def test_levels_from_settings(self):
+        data = json.dumps([
+            {'id': i, 'name': f'Tarea {i * 7919 % 10007}', 'due_date': f'2024-{i % 12 + 1:02}-{i % 28 + 1:02}'}
+            for i in range(2000)
+        ]).encode()
+        with override_settings(COMPRESSION_LEVELS={'gzip': 1, 'br': 1, 'zstd': 1}):
+            fast = {name: len(compression.compress(data, name)) for name in ['gzip', 'br', 'zstd']}
+        with override_settings(COMPRESSION_LEVELS={'gzip': 9, 'br': 11, 'zstd': 19}):
+            best = {name: len(compression.compress(data, name)) for name in ['gzip', 'br', 'zstd']}
+        for name in fast:
+            self.assertLess(best[name], fast[name])
+
+
+@override_settings(COMPRESSION_ENCODINGS=['gzip'], COMPRESSION_MIN_SIZE=100)
+class CompressionMiddlewareTests(SimpleTestCase):
+    def process(self, response, accept='gzip'):
+        middleware = CompressionMiddleware(lambda request: response)
+        headers = {'Accept-Encoding': accept} if accept else {}
+        return middleware.process_response(RequestFactory().get('/', headers=headers), response)
+
+    def test_compresses_large_json(self):
+        body = b'[' + b'{"id":1},' * 100 + b'{"id":2}]'
+        response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = '"abc"'
+        response = self.process(response)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertEqual(gzip.decompress(response.content), body)
+
+    def test_skips_small_unlisted_or_encoded_responses(self):
+        responses = [
+            HttpResponse(b'{"id":1}', content_type='application/json'),
+            HttpResponse(b'x' * 1000, content_type='image/png'),
+            # HTML no, por BREACH (páginas con el token CSRF).
+            HttpResponse(b'<p>x</p>' * 500, content_type='text/html; charset=utf-8'),
+            StreamingHttpResponse(iter([b'data: {}\n\n'] * 50), content_type='text/event-stream'),
+        ]
+        encoded = HttpResponse(b'x' * 1000, content_type='text/plain')
+        encoded['Content-Encoding'] = 'br'
+        for response in responses + [encoded]:
+            with self.subTest(content_type=response['Content-Type']):
+                processed = self.process(response)
+                self.assertFalse(processed.has_header('Vary'))
+                self.assertEqual(processed.get('Content-Encoding'), response.get('Content-Encoding'))
+
+    def test_client_without_accept_encoding_gets_vary(self):
+        body = b'a,b\n' * 100
+        response = self.process(HttpResponse(body, content_type='text/csv'), accept=None)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.content, body)
+
+    def test_incompressible_content_is_left_alone(self):
+        body = os.urandom(1000)
+        response = self.process(HttpResponse(body, content_type='application/msgpack'))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, body)
+
+    def test_streaming_response(self):
+        lines = [f'{{"id":{i}}}\n'.encode() for i in range(1000)]
+        response = self.process(StreamingHttpResponse(iter(lines), content_type='application/x-ndjson'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), b''.join(lines))
+
+    async def test_async_streaming_response(self):
+        async def lines():
+            for i in range(1000):
+                yield f'{{"id":{i}}}\n'
+
+        response = self.process(StreamingHttpResponse(lines(), content_type='application/x-ndjson'))
+        self.assertTrue(response.is_async)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        body = b''.join([chunk async for chunk in response.streaming_content])
+        expected = ''.join(f'{{"id":{i}}}\n' for i in range(1000)).encode()
+        self.assertEqual(gzip.decompress(body), expected)
+
+
+class CompressedTaskResponsesTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='gzipuser', password='testpass123')
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        Task.objects.bulk_create([
+            Task(name=f'Tarea {i}', description='Descripción', due_date='2024-01-01', assigned_user=self.user)
+            for i in range(50)
+        ])
+
+    def test_list_is_compressed_with_preferred_encoding(self):
+        plain = self.client.get(reverse('task-list'))
+        encoding = compression.available_encodings()[0]
+        response = self.client.get(reverse('task-list'), HTTP_ACCEPT_ENCODING='gzip, br, zstd')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Encoding'], encoding)
+        self.assertLess(len(response.content), len(plain.content))
+        self.assertEqual(decompress(response.content, encoding), plain.content)
+
+        # La ETag débil sigue validando la caché del cliente.
+        self.assertEqual(response['ETag'], 'W/' + plain['ETag'])
+        not_modified = self.client.get(
+            reverse('task-list'), HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_streaming_export_is_compressed(self):
+        plain = b''.join(self.client.get(reverse('task-export')).streaming_content)
+        response = self.client.get(reverse('task-export'), HTTP_ACCEPT_ENCODING='gzip')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), plain)
+        self.assertEqual(len(plain.splitlines()), 50)
+
+
+class CompressionSettingsTests(SimpleTestCase):
+    def load(self, **env):
+        with mock.patch.dict(os.environ, env):
+            return runpy.run_path(str(Path(settings.BASE_DIR) / 'gestion_tareas' / 'settings.py'))
+
+    def test_environment(self):
+        config = self.load(
+            COMPRESSION_ENCODINGS='gzip', COMPRESSION_GZIP_LEVEL='9', COMPRESSION_MIN_SIZE='10'
+        )
+        self.assertEqual(config['COMPRESSION_ENCODINGS'], ['gzip'])
+        self.assertEqual(config['COMPRESSION_LEVELS']['gzip'], 9)
+        self.assertEqual(config['COMPRESSION_MIN_SIZE'], 10)
+        self.assertEqual(self.load(COMPRESSION_ENCODINGS='')['COMPRESSION_ENCODINGS'], [])
@@ -0,0 +1,95 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from ..models import Task
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='polluser',
+            password='testpass123',
+            email='poll@example.com'
+        )
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.tasks = [
+            Task.objects.create(
+                name=f'Tarea {i}',
+                description='Descripción',
+                state='DOING',
+                due_date='2024-01-01'
+            )
+            for i in range(3)
+        ]
+        self.list_url = reverse('task-list')
+        self.detail_url = reverse('task-detail', kwargs={'pk': self.tasks[0].pk})
+
+    def test_list_returns_etag_and_304(self):
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.assertNotIn('Last-Modified', response)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        # Solo los validadores (el token ya está en caché); no se lee ninguna fila
+        with self.assertNumQueries(1):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_list_etag_changes_on_update_create_and_delete(self):
+        etag = self.client.get(self.list_url)['ETag']
+
+        self.tasks[1].state = 'TEST'
+        self.tasks[1].save()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+
+        self.tasks[2].delete()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_list_etag_depends_on_query(self):
+        etag = self.client.get(self.list_url)['ETag']
+        response = self.client.get(
+            self.list_url, {'state': 'DOING'}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_detail_etag_and_last_modified(self):
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.tasks[0].name = 'Renombrada'
+        self.tasks[0].save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['name'], 'Renombrada')
+
+    def test_detail_missing_and_invalid_ids(self):
+        response = self.client.get(reverse('task-detail', kwargs={'pk': 9999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get('/api/tasks/abc/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_requires_authentication_before_304(self):
+        etag = self.client.get(self.list_url)['ETag']
+        self.client.credentials()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,177 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import transaction
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from .. import counters, routers
+from ..models import Task, TaskCounter, TaskTombstone
+
+
+class TaskCounterTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='countuser', password='testpass123')
+        self.other = User.objects.create_user(username='othercount', password='testpass123')
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+    def create_task(self, state='BACKLOG', user=None, name='Tarea'):
+        return Task.objects.create(
+            name=name, description='Descripción', state=state,
+            due_date='2024-01-01', assigned_user=user
+        )
+
+    def stored(self):
+        return {
+            (counter.state, counter.user_id): counter.count
+            for counter in TaskCounter.objects.exclude(count=0)
+        }
+
+    def assertCountersMatch(self, expected=None):
+        self.assertEqual(self.stored(), counters.count_tasks())
+        if expected is not None:
+            self.assertEqual(self.stored(), expected)
+
+    def test_save_and_delete(self):
+        task = self.create_task(user=self.user)
+        self.create_task(user=self.user)
+        self.assertCountersMatch({('BACKLOG', self.user.pk): 2})
+
+        task.state = 'TO DO'
+        task.assigned_user = self.other
+        task.save()
+        self.assertCountersMatch({
+            ('BACKLOG', self.user.pk): 1, ('TO DO', self.other.pk): 1,
+        })
+
+        task.delete()
+        self.assertCountersMatch({('BACKLOG', self.user.pk): 1})
+
+    def test_unchanged_save_touches_no_counter(self):
+        task = self.create_task(user=self.user)
+        task.name = 'Renombrada'
+        # Estado y usuario previos (bloqueados) + UPDATE
+        with self.assertNumQueries(2):
+            task.save()
+
+    def test_rolled_back_write_leaves_counters(self):
+        self.create_task(user=self.user)
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.create_task(user=self.user)
+                raise RuntimeError
+        self.assertCountersMatch({('BACKLOG', self.user.pk): 1})
+
+    def test_bulk_endpoints_and_transition(self):
+        url = reverse('task-bulk')
+        payload = [
+            {'name': f'T{i}', 'description': 'D', 'state': 'TO DO',
+             'due_date': '2024-01-01', 'assigned_user': self.user.pk}
+            for i in range(4)
+        ]
+        response = self.client.post(url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        ids = [task['id'] for task in response.data]
+
+        self.client.patch(url, [{'id': ids[0], 'assigned_user': None}], format='json')
+        self.client.post(reverse('task-transition'), {'state': 'DOING', 'ids': ids[1:3]}, format='json')
+        self.client.delete(url, {'ids': [ids[3]]}, format='json')
+        self.assertCountersMatch({
+            ('TO DO', None): 1, ('DOING', self.user.pk): 2,
+        })
+
+    def test_stale_instances_use_current_values(self):
+        task = self.create_task(user=self.user)
+        first, second = Task.objects.get(pk=task.pk), Task.objects.get(pk=task.pk)
+        first.state = 'DOING'
+        first.save()
+        # ``second`` se cargó cuando la tarea estaba en BACKLOG.
+        second.state = 'TEST'
+        second.save()
+        self.assertCountersMatch({('TEST', self.user.pk): 1})
+
+        first.delete()
+        self.assertCountersMatch({})
+
+    def test_bulk_destroy_is_aggregated(self):
+        tasks = [self.create_task(state=state, user=self.user) for state in ['TO DO', 'TO DO', 'DOING']]
+        # autenticación + tareas bloqueadas + DELETE + registros de borrado
+        # (transacción incluida) + un UPDATE por contador afectado
+        with self.assertNumQueries(1 + 2 + 3 + 2):
+            response = self.client.delete(
+                reverse('task-bulk'), {'ids': [task.pk for task in tasks]}, format='json'
+            )
+        self.assertEqual(response.data['deleted'], 3)
+        self.assertCountersMatch({})
+        self.assertEqual(
+            sorted(TaskTombstone.objects.values_list('task_id', flat=True)),
+            [task.pk for task in tasks],
+        )
+
+    def test_user_deletion_moves_counts_to_unassigned(self):
+        self.create_task(user=self.other)
+        self.create_task(state='DONE', user=self.other)
+        self.create_task()
+        self.other.delete()
+        self.assertCountersMatch({('BACKLOG', None): 2, ('DONE', None): 1})
+
+    def test_endpoint(self):
+        self.create_task(user=self.user)
+        self.create_task(state='DOING', user=self.other)
+        self.create_task(state='DOING')
+        url = reverse('task-counts')
+        self.client.get(url)  # el token queda en caché
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {(row['username'], row['state']): row['count'] for row in response.data},
+            {('countuser', 'BACKLOG'): 1, ('othercount', 'DOING'): 1, (None, 'DOING'): 1},
+        )
+
+        response = self.client.get(url, {'assigned_user__username': 'othercount'})
+        self.assertEqual(
+            response.data,
+            [{'assigned_user': self.other.pk, 'username': 'othercount', 'state': 'DOING', 'count': 1}],
+        )
+        response = self.client.get(url, {'state': 'DOING'})
+        self.assertEqual(len(response.data), 2)
+        response = self.client.get(url, {'state': 'NOPE'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reconcile_command(self):
+        self.create_task(user=self.user)
+        self.create_task(state='DOING', user=self.user)
+        # Escritura que no pasa por las señales: el contador se desajusta.
+        Task.objects.filter(state='DOING').update(state='TEST')
+        TaskCounter.objects.filter(state='BACKLOG').update(count=5)
+
+        out = StringIO()
+        call_command('reconcile_task_counters', '--dry-run', stdout=out)
+        self.assertIn('3 contadores encontrados', out.getvalue())
+        self.assertNotEqual(self.stored(), counters.count_tasks())
+
+        out = StringIO()
+        call_command('reconcile_task_counters', stdout=out)
+        self.assertIn(f'{self.user.pk} / BACKLOG: 5 -> 1', out.getvalue())
+        self.assertIn('3 contadores corregidos', out.getvalue())
+        self.assertCountersMatch({('BACKLOG', self.user.pk): 1, ('TEST', self.user.pk): 1})
+
+    def test_reconcile_reads_from_primary(self):
+        self.create_task(user=self.user)
+        replica_reads = []
+
+        def db_for_read(router, model, **hints):
+            replica_reads.append(routers.reading_from_replica())
+
+        with self.settings(DATABASE_REPLICAS=['replica_1']), \
+                mock.patch.object(routers.ReplicaRouter, 'db_for_read', db_for_read):
+            counters.reconcile(dry_run=True)
+        self.assertTrue(replica_reads)
+        self.assertFalse(any(replica_reads))
@@ -0,0 +1,41 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+
+class DatabaseStatsTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('db-stats')
+
+    def authenticate(self, **fields):
+        user = User.objects.create_user(username='statsuser', password='testpass123', **fields)
+        token = Token.objects.get(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+    def test_requires_admin(self):
+        self.authenticate()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_reports_connection_settings_and_health(self):
+        self.authenticate(is_staff=True)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = response.data['default']
+        self.assertEqual(stats['vendor'], connection.vendor)
+        self.assertTrue(stats['healthy'])
+        self.assertIsNone(stats['pool'])
+        self.assertIn('conn_max_age', stats)
+        self.assertIn('health_checks', stats)
+
+    def test_counts_new_connections(self):
+        self.authenticate(is_staff=True)
+        before = self.client.get(self.url).data['default']['connects']
+        connection_created.send(sender=connection.__class__, connection=connection)
+        after = self.client.get(self.url).data['default']['connects']
+        self.assertEqual(after, before + 1)
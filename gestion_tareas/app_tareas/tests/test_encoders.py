@@ -0,0 +1,149 @@
+from itertools import combinations
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth.models import User
+from django.test import AsyncRequestFactory, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from ..async_views import AsyncTaskView
+from ..encoders import get_encoder
+from ..models import Task
+from ..serializers import TaskSerializer
+from ..views import TaskViewSet
+
+FIELDS = list(TaskSerializer().fields)
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+class EncoderFixtureMixin:
+    def setUp(self):
+        self.user = User.objects.create_user(username='encuser', password='testpass123')
+        self.token = Token.objects.get(user=self.user)
+        names = ['Plain', 'Ünïcödé — ñ', 'Emoji 🚀', 'Comillas "y" \\barras\\', 'Línea\nnueva']
+        comments = [None, '', 'Comentario', '<b>html</b>', '\t']
+        self.tasks = [
+            Task.objects.create(
+                name=names[i % 5], description=f'Descripción {i} ' * (i % 4),
+                comment=comments[i % 5],
+                state=Task.StateChoices.get_workflow()[i % 5],
+                priority=Task.PriorityChoices.get_ordering()[i % 3],
+                due_date=f'2024-0{i % 9 + 1}-{i % 28 + 1:02d}',
+                assigned_user=self.user if i % 3 else None,
+            )
+            for i in range(15)
+        ]
+
+
+class RowEncoderParityTests(EncoderFixtureMixin, TestCase):
+    """El codificador da exactamente el JSON del serializador."""
+
+    def assertParity(self, fields=None):
+        queryset = Task.objects.order_by('id')
+        kwargs = {} if fields is None else {'fields': fields}
+        expected = render(TaskSerializer(queryset, many=True, **kwargs).data)
+        encoder = get_encoder(TaskSerializer, fields)
+        self.assertIsNotNone(encoder)
+        self.assertEqual(render(encoder.encode_many(encoder.values(queryset))), expected)
+
+    def test_all_fields(self):
+        self.assertParity()
+
+    def test_every_pair_of_fields(self):
+        for pair in combinations(FIELDS, 2):
+            with self.subTest(fields=pair):
+                self.assertParity(['id', *pair])
+
+    def test_other_timezones(self):
+        for name in ['Europe/Madrid', 'America/Bogota', 'Asia/Kolkata']:
+            with self.subTest(timezone=name), timezone.override(name):
+                self.assertParity()
+
+    def test_unsupported_field_falls_back(self):
+        class WithMethod(TaskSerializer):
+            label = serializers.SerializerMethodField()
+
+            def get_label(self, task):
+                return task.name.upper()
+
+        self.assertIsNone(get_encoder(WithMethod))
+
+
+class FastReadEndpointParityTests(EncoderFixtureMixin, TestCase):
+    """Cada acción responde los mismos bytes con y sin codificador."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def assertSameContent(self, url, params=None, **extra):
+        response = self.client.get(url, params or {}, **extra)
+        with mock.patch.object(TaskViewSet, 'fast_read_actions', ()):
+            expected = self.client.get(url, params or {}, **extra)
+        self.assertEqual(response.status_code, expected.status_code)
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+        expected_content = (
+            b''.join(expected.streaming_content) if expected.streaming else expected.content
+        )
+        self.assertEqual(content, expected_content)
+        return response
+
+    def test_list(self):
+        url = reverse('task-list')
+        for params in [
+            {},
+            {'fields': '__all__'},
+            {'fields': 'name,comment', 'ordering': '-priority'},
+            {'omit': 'assigned_user', 'state': 'DOING'},
+            {'assigned_user__username': 'encuser', 'ordering': '-due_date'},
+            {'search': 'Emoji'},
+        ]:
+            with self.subTest(params=params):
+                self.assertSameContent(url, params)
+
+    def test_list_pages(self):
+        url = reverse('task-list')
+        params = {'page_size': 4, 'fields': '__all__', 'ordering': 'priority'}
+        response = self.assertSameContent(url, params)
+        while response.data['next']:
+            query = parse_qs(urlparse(response.data['next']).query)
+            response = self.assertSameContent(url, {k: v[0] for k, v in query.items()})
+
+    def test_board_changes_and_export(self):
+        self.assertSameContent(reverse('task-board'), {'limit': 2})
+        self.assertSameContent(reverse('task-board'), {'fields': '__all__'})
+        # El cursor lleva la hora de la petición: se fija para comparar bytes.
+        with mock.patch('app_tareas.sync.timezone.now', return_value=timezone.now()):
+            self.assertSameContent(reverse('task-changes'))
+        self.assertSameContent(reverse('task-export'))
+        self.assertSameContent(reverse('task-export'), {'format': 'csv'})
+
+    def test_list_queries(self):
+        url = reverse('task-list')
+        self.client.get(url)  # el token queda en caché
+        with self.assertNumQueries(2):  # ETag + página
+            self.client.get(url)
+
+
+class AsyncFastReadParityTests(EncoderFixtureMixin, TestCase):
+    async def test_async_list(self):
+        view = AsyncTaskView.as_view()
+        headers = {'Authorization': f'Token {self.token.key}'}
+
+        async def get():
+            request = AsyncRequestFactory().get('/api/tasks/', {'fields': '__all__'}, headers=headers)
+            return await view(request)
+
+        response = await get()
+        with mock.patch.object(TaskViewSet, 'fast_read_actions', ()):
+            expected = await get()
+        self.assertEqual(response.content, expected.content)
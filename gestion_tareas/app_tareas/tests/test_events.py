@@ -0,0 +1,151 @@
+import asyncio
+import json
+import threading
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from .. import events
+from ..models import Task
+
+
+def event(state='DOING', user=None, previous=None):
+    data = {'event': 'task.updated', 'id': 1, 'state': state, 'assigned_user': user}
+    if previous:
+        data['previous'] = previous
+    return data
+
+
+class TaskEventBrokerTests(TestCase):
+    async def test_publish_from_other_thread_reaches_subscriber(self):
+        broker = events.TaskEventBroker()
+        subscription = broker.subscribe()
+        thread = threading.Thread(target=broker.publish, args=([event()],))
+        thread.start()
+        thread.join()
+        self.assertEqual(await subscription.get(timeout=1), event())
+
+    async def test_filters_by_state_and_user_before_or_after(self):
+        broker = events.TaskEventBroker()
+        subscription = broker.subscribe(states=['DOING'], user_id=7)
+        broker.publish([
+            event('TEST', 7),
+            event('DOING', 8),
+            event('TEST', 7, previous={'state': 'DOING', 'assigned_user': 7}),
+            event('DOING', 7),
+        ])
+        received = [await subscription.get(timeout=1) for _ in range(2)]
+        self.assertEqual([e['state'] for e in received], ['TEST', 'DOING'])
+        self.assertIsNone(await subscription.get(timeout=0.01))
+
+    async def test_slow_subscriber_gets_overflow_without_blocking_others(self):
+        broker = events.TaskEventBroker()
+        slow = broker.subscribe(maxsize=2)
+        fast = broker.subscribe(maxsize=10)
+        broker.publish([event() for _ in range(5)])
+        await asyncio.sleep(0)
+        self.assertIs(await slow.get(timeout=1), events.OVERFLOW)
+        self.assertIsNone(await slow.get(timeout=0.01))
+        self.assertEqual(fast.queue.qsize(), 5)
+
+    def test_postgres_payloads_fit_in_notify(self):
+        bridge = events.PostgresBridge('task_events')
+        bridge.max_payload = 200
+        batch = [event() for _ in range(10)]
+        payloads = list(bridge.payloads(batch))
+        self.assertGreater(len(payloads), 1)
+        self.assertTrue(all(len(payload) <= 200 for payload in payloads))
+        self.assertEqual(sum((json.loads(p) for p in payloads), []), batch)
+
+
+class TaskEventPublishingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='eventuser', password='testpass123')
+
+    def published(self, write):
+        with mock.patch.object(events.broker, 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+        return [e for call in publish.call_args_list for e in call.args[0]]
+
+    def test_bulk_destroy_publishes_one_event_per_column(self):
+        tasks = [
+            Task.objects.create(
+                name=f'Tarea {i}', description='Descripción', state='DOING',
+                due_date='2024-01-01', assigned_user=self.user
+            )
+            for i in range(3)
+        ]
+        client = APIClient()
+        client.force_authenticate(self.user)
+        published = self.published(lambda: client.delete(
+            reverse('task-bulk'), {'ids': [task.pk for task in tasks]}, format='json'
+        ))
+        self.assertEqual(published, [
+            {'event': 'tasks.deleted', 'state': 'DOING', 'assigned_user': self.user.pk},
+        ])
+
+    def test_save_and_delete_publish_after_commit(self):
+        with mock.patch.object(events.broker, 'publish') as publish:
+            task = Task.objects.create(
+                name='Tarea', description='Descripción', state='DOING',
+                due_date='2024-01-01', assigned_user=self.user
+            )
+            publish.assert_not_called()
+
+        task = Task.objects.get(pk=task.pk)
+        task.state = 'TEST'
+        self.assertEqual(self.published(task.save), [{
+            'event': 'task.updated', 'id': task.pk, 'state': 'TEST',
+            'assigned_user': self.user.pk,
+            'previous': {'state': 'DOING', 'assigned_user': self.user.pk},
+        }])
+        pk = task.pk
+        self.assertEqual(self.published(task.delete), [{
+            'event': 'task.deleted', 'id': pk, 'state': 'TEST',
+            'assigned_user': self.user.pk,
+        }])
+
+
+class TaskEventStreamTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='streamuser', password='testpass123')
+        self.token = Token.objects.get(user=self.user)
+        self.url = reverse('task-events')
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+    def test_not_served_under_wsgi(self):
+        response = self.client.get(self.url, headers={'Authorization': f'Token {self.token.key}'})
+        self.assertEqual(response.status_code, 501)
+        self.assertIn('/api/tasks/changes/', response.json()['detail'])
+        self.assertEqual(len(events.broker.subscriptions), 0)
+
+    async def test_rejects_unknown_state(self):
+        response = await self.async_client.get(
+            self.url, {'state': 'NOPE'}, headers={'Authorization': f'Token {self.token.key}'}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    async def test_streams_matching_events(self):
+        response = await self.async_client.get(
+            self.url, {'state': 'DOING'},
+            headers={'Authorization': f'Token {self.token.key}'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        content = aiter(response.streaming_content)
+        self.assertEqual(await anext(content), b'retry: 5000\n\n')
+
+        events.broker.publish([event('TEST'), event('DOING')])
+        chunk = await asyncio.wait_for(anext(content), 1)
+        self.assertTrue(chunk.startswith(b'event: task.updated\ndata: '))
+        self.assertEqual(json.loads(chunk.split(b'data: ')[1])['state'], 'DOING')
+        response.close()
+        self.assertEqual(len(events.broker.subscriptions), 0)
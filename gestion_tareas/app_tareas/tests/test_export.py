@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from ..models import Task
+from ..serializers import TaskSerializer
+
+
+class TaskExportTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='exportuser',
+            password='testpass123',
+            email='export@example.com'
+        )
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.headers = {'Authorization': 'Token ' + token.key}
+        for i in range(5):
+            Task.objects.create(
+                name=f'Tarea, "{i}"',
+                description='Línea 1\nLínea 2',
+                state='DONE' if i % 2 else 'DOING',
+                due_date=f'2024-01-0{i + 1}',
+                assigned_user=self.user if i % 2 else None,
+                comment=None
+            )
+        self.url = reverse('task-export')
+
+    def content(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_ndjson_export_matches_serializer(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        rows = [json.loads(line) for line in self.content(response).splitlines()]
+        expected = TaskSerializer(Task.objects.order_by('due_date'), many=True).data
+        self.assertEqual(rows, json.loads(json.dumps(expected)))
+
+    def test_csv_export(self):
+        response = self.client.get(self.url, {'format': 'csv'})
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn('tasks.csv', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(self.content(response))))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['name'], 'Tarea, "0"')
+        self.assertEqual(rows[0]['description'], 'Línea 1\nLínea 2')
+        self.assertEqual(rows[0]['assigned_user'], '')
+        self.assertEqual(rows[1]['assigned_user'], str(self.user.pk))
+
+    def test_csv_by_accept_header(self):
+        response = self.client.get(self.url, HTTP_ACCEPT='text/csv')
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+
+    def test_export_honours_filters(self):
+        response = self.client.get(self.url, {'state': 'DONE', 'ordering': '-due_date'})
+        rows = [json.loads(line) for line in self.content(response).splitlines()]
+        self.assertEqual([row['due_date'] for row in rows], ['2024-01-04', '2024-01-02'])
+
+    @override_settings(API_EXPORT_CHUNK_SIZE=2)
+    async def test_asgi_export_streams_asynchronously(self):
+        response = await self.async_client.get(self.url, headers=self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        # Cinco filas en bloques de dos líneas.
+        self.assertEqual(len(chunks), 3)
+        rows = [json.loads(line) for line in b''.join(chunks).decode('utf-8').splitlines()]
+        self.assertEqual([row['name'] for row in rows], [f'Tarea, "{i}"' for i in range(5)])
+
+    def test_export_requires_authentication(self):
+        self.client.credentials()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
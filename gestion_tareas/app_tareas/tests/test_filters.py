@@ -0,0 +1,67 @@
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from ..models import Task
+
+
+class TaskSearchFilterTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='searchuser',
+            password='testpass123',
+            email='search@example.com'
+        )
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+        self.in_name = Task.objects.create(
+            name='Migrar base de datos',
+            description='Mover las tablas al nuevo servidor',
+            due_date='2024-01-10'
+        )
+        self.in_description = Task.objects.create(
+            name='Revisar backups',
+            description='Comprobar la base de datos restaurada',
+            due_date='2024-01-01'
+        )
+        Task.objects.create(
+            name='Diseñar logo',
+            description='Nueva identidad visual',
+            due_date='2024-01-05'
+        )
+        self.url = reverse('task-list')
+
+    def search(self, term, **params):
+        response = self.client.get(self.url, {'search': term, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in response.data['results']]
+
+    def test_search_matches_name_and_description(self):
+        ids = self.search('datos')
+        self.assertEqual(set(ids), {self.in_name.id, self.in_description.id})
+
+    def test_search_vector_not_exposed(self):
+        response = self.client.get(self.url)
+        self.assertNotIn('search_vector', response.data['results'][0])
+        self.assertNotIn('priority_rank', response.data['results'][0])
+
+    def test_explicit_ordering_wins(self):
+        ids = self.search('datos', ordering='-due_date')
+        self.assertEqual(ids, [self.in_name.id, self.in_description.id])
+
+    @skipUnless(connection.vendor == 'postgresql', 'Búsqueda de texto completo solo en PostgreSQL')
+    def test_full_text_search_ranks_by_relevance(self):
+        # El nombre pesa más que la descripción
+        self.assertEqual(
+            self.search('base datos'),
+            [self.in_name.id, self.in_description.id]
+        )
+        # Las palabras se normalizan (plurales, acentos de la configuración)
+        self.assertEqual(set(self.search('tabla')), {self.in_name.id})
@@ -0,0 +1,208 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from ..importer import TaskImporter, read_rows
+from ..models import Task
+
+CSV_CONTENT = (
+    'name,description,state,priority,due_date,assigned_user,comment\n'
+    'Tarea 1,Desc 1,TO DO,ALTA,2024-01-01,importuser,\n'
+    'Tarea 2,"Desc, con coma",DOING,BAJA,2024-01-02,,Un comentario\n'
+    'Tarea 3,Desc 3,NOPE,MEDIA,2024-01-03,,\n'
+    'Tarea 4,Desc 4,TO DO,MEDIA,2024-01-04,fantasma,\n'
+)
+
+NDJSON_CONTENT = '\n'.join([
+    json.dumps({'name': 'Tarea A', 'description': 'D', 'due_date': '2024-02-01',
+                'assigned_user': 'importuser'}),
+    '{no es json',
+    '',
+    json.dumps({'name': 'Tarea B', 'description': 'D', 'due_date': 'mañana'}),
+    json.dumps({'name': 'Tarea C', 'description': 'D', 'due_date': '2024-02-03'}),
+]) + '\n'
+
+
+class TaskImporterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='importuser',
+            password='testpass123',
+            email='import@example.com'
+        )
+
+    def run_import(self, content, file_format, **kwargs):
+        stream = SimpleUploadedFile('tasks', content.encode('utf-8'))
+        return TaskImporter(**kwargs).run(read_rows(stream, file_format))
+
+    def test_csv_import(self):
+        report = self.run_import(CSV_CONTENT, 'csv')
+        self.assertEqual(report['processed'], 4)
+        self.assertEqual(report['created'], 2)
+        self.assertEqual(report['failed'], 2)
+        self.assertEqual([error['row'] for error in report['errors']], [3, 4])
+        self.assertIn('state', report['errors'][0]['errors'])
+        self.assertIn('assigned_user', report['errors'][1]['errors'])
+
+        task = Task.objects.get(name='Tarea 1')
+        self.assertEqual(task.assigned_user, self.user)
+        self.assertEqual(Task.objects.get(name='Tarea 2').description, 'Desc, con coma')
+
+    def test_ndjson_import(self):
+        report = self.run_import(NDJSON_CONTENT, 'ndjson')
+        self.assertEqual(report['processed'], 4)
+        self.assertEqual(report['created'], 2)
+        self.assertEqual([error['row'] for error in report['errors']], [2, 3])
+        self.assertEqual(
+            set(Task.objects.values_list('name', flat=True)), {'Tarea A', 'Tarea C'}
+        )
+
+    def test_one_user_query_per_chunk(self):
+        rows = ''.join(
+            json.dumps({'name': f'T{i}', 'description': 'D', 'due_date': '2024-01-01',
+                        'assigned_user': 'importuser'}) + '\n'
+            for i in range(10)
+        )
+        # Por bloque: usuarios + INSERT (y la transacción) + el UPDATE del
+        # contador, que el primer bloque crea (UPDATE sin filas e INSERT)
+        with self.assertNumQueries(2 * 5 + 2):
+            report = self.run_import(rows, 'ndjson', chunk_size=5)
+        self.assertEqual(report['created'], 10)
+
+    def test_progress_and_error_limit(self):
+        progress = []
+        report = self.run_import(
+            CSV_CONTENT, 'csv', chunk_size=1, max_errors=1,
+            on_progress=lambda report: progress.append(report['processed'])
+        )
+        self.assertEqual(progress, [1, 2, 3, 4])
+        self.assertEqual(len(report['errors']), 1)
+        self.assertTrue(report['errors_truncated'])
+
+    def test_unreadable_rows_are_reported(self):
+        content = (
+            'name,description,due_date\n'.encode('utf-8')
+            + 'Café,Desc,2024-01-01\n'.encode('latin-1')
+            + 'Té,Desc,2024-01-02\n'.encode('utf-8')
+        )
+        stream = SimpleUploadedFile('tasks.csv', '\ufeff'.encode('utf-8') + content)
+        with self.settings(API_IMPORT_CHUNK_SIZE=1):
+            report = TaskImporter().run(read_rows(stream, 'csv'))
+        self.assertEqual(report['created'], 1)
+        self.assertEqual(report['errors'][0], {
+            'row': 1,
+            'errors': {'non_field_errors': ['La fila no está codificada en UTF-8.']},
+        })
+        self.assertEqual(list(Task.objects.values_list('name', flat=True)), ['Té'])
+
+    def test_malformed_csv_row(self):
+        # Un campo mayor que csv.field_size_limit() no detiene la importación.
+        content = b'name,description\nA,"' + b'x' * 200000 + b'"\nB,C\n'
+        rows = list(read_rows(SimpleUploadedFile('tasks.csv', content), 'csv'))
+        self.assertIn('CSV mal formado', rows[0][1].message)
+        self.assertEqual(rows[-1], (len(rows), {'name': 'B', 'description': 'C'}))
+
+    def test_ndjson_not_utf8(self):
+        line = json.dumps({'name': 'Café', 'description': 'D', 'due_date': '2024-01-01'},
+                          ensure_ascii=False)
+        stream = SimpleUploadedFile('tasks.ndjson', line.encode('latin-1') + b'\n')
+        report = TaskImporter().run(read_rows(stream, 'ndjson'))
+        self.assertEqual(report['failed'], 1)
+        self.assertEqual(Task.objects.count(), 0)
+
+
+class TaskImportEndpointTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='importuser',
+            password='testpass123',
+            email='import@example.com'
+        )
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.url = reverse('task-import')
+
+    def test_import_csv_upload(self):
+        upload = SimpleUploadedFile('tareas.csv', CSV_CONTENT.encode('utf-8'))
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['failed'], 2)
+
+    def test_import_explicit_format(self):
+        upload = SimpleUploadedFile('tareas.txt', NDJSON_CONTENT.encode('utf-8'))
+        response = self.client.post(
+            self.url, {'file': upload, 'file_format': 'ndjson'}, format='multipart'
+        )
+        self.assertEqual(response.data['created'], 2)
+
+    def test_import_latin1_upload(self):
+        content = 'name,description,due_date\nCafé,Desc,2024-01-01\n'.encode('latin-1')
+        upload = SimpleUploadedFile('tareas.csv', content)
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['failed'], 1)
+        self.assertEqual(response.data['errors'][0]['row'], 1)
+
+    def test_import_rejects_unreadable_header(self):
+        upload = SimpleUploadedFile('tareas.csv', 'nombre,descripción\n'.encode('latin-1'))
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('file', response.data)
+
+    def test_import_requires_file(self):
+        response = self.client.post(self.url, {}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_rejects_unknown_format(self):
+        upload = SimpleUploadedFile('tareas.csv', b'x')
+        response = self.client.post(
+            self.url, {'file': upload, 'file_format': 'xml'}, format='multipart'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ImportTasksCommandTests(TestCase):
+    def setUp(self):
+        User.objects.create_user(
+            username='importuser',
+            password='testpass123',
+            email='import@example.com'
+        )
+
+    def write_file(self, suffix, content):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_command_reports_progress_and_errors(self):
+        path = self.write_file('.csv', CSV_CONTENT)
+        out, err = StringIO(), StringIO()
+        with self.assertRaises(CommandError):
+            call_command('import_tasks', path, '--chunk-size', '2', stdout=out, stderr=err)
+        self.assertIn('2 filas procesadas', out.getvalue())
+        self.assertIn('4 filas procesadas: 2 creadas, 2 con errores.', out.getvalue())
+        self.assertIn('Fila 3: state', err.getvalue())
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_command_success(self):
+        content = json.dumps({'name': 'T', 'description': 'D', 'due_date': '2024-01-01'}) + '\n'
+        path = self.write_file('.ndjson', content)
+        out = StringIO()
+        call_command('import_tasks', path, stdout=out)
+        self.assertIn('1 creadas', out.getvalue())
+        self.assertEqual(Task.objects.count(), 1)
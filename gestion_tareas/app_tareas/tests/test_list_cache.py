@@ -0,0 +1,172 @@
+import os
+import runpy
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from .. import list_cache
+from ..models import Task
+
+LIST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-default',
+    },
+    'task_lists': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-task-lists',
+    },
+}
+
+
+@override_settings(CACHES=LIST_CACHES)
+class TaskListCacheTests(APITestCase):
+    def setUp(self):
+        caches['task_lists'].clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='cacheuser', password='testpass123')
+        self.other = User.objects.create_user(username='otheruser', password='testpass123')
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.task = Task.objects.create(
+            name='Tarea', description='Descripción', state='DOING',
+            due_date='2024-01-01', assigned_user=self.user
+        )
+        Task.objects.create(
+            name='Otra', description='Descripción', state='TO DO',
+            due_date='2024-01-02', assigned_user=self.other
+        )
+        self.url = reverse('task-list')
+
+    def get(self, params=None, client=None):
+        response = (client or self.client).get(self.url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.get()
+        self.assertEqual(first['X-Cache'], 'MISS')
+
+        with self.assertNumQueries(0):  # token y listado en caché
+            second = self.get()
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_hit_answers_conditional_request(self):
+        etag = self.get()['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_write_invalidates_affected_lists(self):
+        self.get()
+        self.get({'state': 'DOING'})
+        self.task.name = 'Renombrada'
+        self.task.save()
+
+        response = self.get()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['name'], 'Renombrada')
+        self.assertEqual(self.get({'state': 'DOING'})['X-Cache'], 'MISS')
+
+    def test_write_keeps_unrelated_lists(self):
+        self.get({'state': 'DOING'})
+        self.get({'assigned_user__username': 'cacheuser'})
+        Task.objects.create(
+            name='Nueva', description='Descripción', state='TO DO',
+            due_date='2024-01-03', assigned_user=self.other
+        )
+        self.assertEqual(self.get({'state': 'DOING'})['X-Cache'], 'HIT')
+        self.assertEqual(
+            self.get({'assigned_user__username': 'cacheuser'})['X-Cache'], 'HIT'
+        )
+        self.assertEqual(self.get({'state': 'TO DO'})['X-Cache'], 'MISS')
+
+    def test_state_change_invalidates_old_and_new_state(self):
+        self.get({'state': 'DOING'})
+        self.get({'state': 'TEST'})
+        self.task.state = 'TEST'
+        self.task.save()
+        self.assertEqual(self.get({'state': 'DOING'})['X-Cache'], 'MISS')
+        self.assertEqual(len(self.get({'state': 'DOING'}).data['results']), 0)
+        self.assertEqual(len(self.get({'state': 'TEST'}).data['results']), 1)
+
+    def test_bulk_paths_invalidate(self):
+        self.get({'state': 'TEST'})
+        response = self.client.post(
+            reverse('task-transition'), {'state': 'TEST', 'ids': [self.task.pk]},
+            format='json'
+        )
+        self.assertEqual(response.data['moved'], 1)
+        self.assertEqual(len(self.get({'state': 'TEST'}).data['results']), 1)
+
+        self.get({'state': 'BACKLOG'})
+        self.client.post(reverse('task-bulk'), [{
+            'name': 'Lote', 'description': 'Descripción', 'state': 'BACKLOG',
+            'priority': 'BAJA', 'due_date': '2024-02-01',
+        }], format='json')
+        self.assertEqual(len(self.get({'state': 'BACKLOG'}).data['results']), 1)
+
+    def test_delete_invalidates(self):
+        self.get()
+        self.task.delete()
+        self.assertEqual(len(self.get().data['results']), 1)
+
+    def test_entries_are_per_user(self):
+        self.get()
+        other_client = APIClient()
+        token, _ = Token.objects.get_or_create(user=self.other)
+        other_client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.assertEqual(self.get(client=other_client)['X-Cache'], 'MISS')
+
+    def test_username_change_invalidates_user_filter(self):
+        self.get({'assigned_user__username': 'nadie'})
+        self.other.username = 'nadie'
+        self.other.save()
+        response = self.get({'assigned_user__username': 'nadie'})
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_stats(self):
+        list_cache.reset_stats()
+        self.get()
+        self.get()
+        self.get()
+        self.assertEqual(
+            list_cache.stats(), {'hits': 2, 'misses': 1, 'hit_ratio': 2 / 3}
+        )
+
+    @override_settings(TASK_LIST_CACHE=False)
+    def test_cache_can_be_disabled(self):
+        self.assertNotIn('X-Cache', self.get())
+        self.task.state = 'DONE'
+        self.task.save()
+        self.assertNotIn('X-Cache', self.get())
+        self.assertEqual(caches['task_lists'].get_many([list_cache.HITS_KEY]), {})
+
+
+class TaskListCacheSettingsTests(SimpleTestCase):
+    def load(self, **env):
+        base = {
+            name: value for name, value in os.environ.items()
+            if name not in ('SERVER_WORKERS', 'TASK_LIST_CACHE_BACKEND', 'TASK_LIST_CACHE')
+        }
+        with mock.patch.dict(os.environ, {**base, **env}, clear=True):
+            return runpy.run_path(str(Path(settings.BASE_DIR) / 'gestion_tareas' / 'settings.py'))
+
+    def test_local_memory_cache_is_only_used_by_a_single_process(self):
+        self.assertTrue(self.load()['TASK_LIST_CACHE'])
+        self.assertFalse(self.load(SERVER_WORKERS='4')['TASK_LIST_CACHE'])
+        shared = self.load(
+            SERVER_WORKERS='4',
+            TASK_LIST_CACHE_BACKEND='django.core.cache.backends.redis.RedisCache',
+        )
+        self.assertTrue(shared['TASK_LIST_CACHE'])
@@ -0,0 +1,115 @@
+import os
+import runpy
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.admin.checks import check_dependencies
+from django.contrib.auth.models import User
+from django.core.checks.security.csrf import check_csrf_middleware
+from django.http import HttpResponse
+from django.test import AsyncClient, Client, RequestFactory, SimpleTestCase, TestCase
+from django.urls import reverse
+
+from ..middleware import SiteAuthenticationMiddleware, SiteSessionMiddleware
+
+SETTINGS_PATH = str(Path(settings.BASE_DIR) / 'gestion_tareas' / 'settings.py')
+
+
+def load_settings(**env):
+    with mock.patch.dict(os.environ, env):
+        return runpy.run_path(SETTINGS_PATH)
+
+
+def middleware_profiles():
+    return {
+        lean: load_settings(API_LEAN_MIDDLEWARE=lean)['MIDDLEWARE']
+        for lean in ('true', 'false')
+    }
+
+
+class SiteMiddlewareTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username='admin', password='testpass123')
+
+    def handle(self, path):
+        seen = {}
+
+        def view(request):
+            seen['session'] = hasattr(request, 'session')
+            seen['user'] = hasattr(request, 'user')
+            return HttpResponse()
+
+        SiteSessionMiddleware(SiteAuthenticationMiddleware(view))(RequestFactory().get(path))
+        return seen
+
+    def test_api_requests_skip_session_and_auth(self):
+        self.assertEqual(self.handle('/api/tasks/'), {'session': False, 'user': False})
+        self.assertEqual(self.handle('/admin/'), {'session': True, 'user': True})
+
+    def test_api_sets_no_cookies_and_needs_no_csrf(self):
+        client = Client(enforce_csrf_checks=True)
+        response = client.post(
+            reverse('login'), {'username': 'admin', 'password': 'testpass123'},
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('token', response.json())
+        self.assertEqual(response.cookies, {})
+
+    def test_admin_keeps_csrf_and_sessions(self):
+        for lean, middleware in middleware_profiles().items():
+            with self.subTest(API_LEAN_MIDDLEWARE=lean), self.settings(MIDDLEWARE=middleware):
+                client = Client(enforce_csrf_checks=True)
+                login_url = reverse('admin:login')
+                credentials = {'username': 'admin', 'password': 'testpass123', 'next': '/admin/'}
+                self.assertEqual(client.post(login_url, credentials).status_code, 403)
+
+                page = client.get(login_url)
+                self.assertIn('csrftoken', page.cookies)
+                response = client.post(
+                    login_url, {**credentials, 'csrfmiddlewaretoken': page.cookies['csrftoken'].value}
+                )
+                self.assertRedirects(response, '/admin/')
+                self.assertIn('sessionid', response.cookies)
+                self.assertEqual(client.get('/admin/').status_code, 200)
+
+    async def test_admin_under_asgi(self):
+        for lean, middleware in middleware_profiles().items():
+            with self.subTest(API_LEAN_MIDDLEWARE=lean), self.settings(MIDDLEWARE=middleware):
+                client = AsyncClient()
+                await client.aforce_login(self.admin)
+                response = await client.get('/admin/')
+                self.assertEqual(response.status_code, 200)
+
+
+class MiddlewareSettingsTests(SimpleTestCase):
+    def test_lean_profile_by_default(self):
+        config = load_settings()
+        middleware = config['MIDDLEWARE']
+        for path, site in config['SITE_MIDDLEWARE'].items():
+            self.assertNotIn(path, middleware)
+            self.assertIn(site, middleware)
+        # Mismo orden que la cadena clásica: sesiones antes que CommonMiddleware
+        # y CSRF, usuario y mensajes después.
+        original = {site: path for path, site in config['SITE_MIDDLEWARE'].items()}
+        classic = load_settings(API_LEAN_MIDDLEWARE='false')['MIDDLEWARE']
+        self.assertEqual([original.get(path, path) for path in middleware], classic)
+
+    def test_classic_profile(self):
+        config = load_settings(API_LEAN_MIDDLEWARE='false')
+        for path, site in config['SITE_MIDDLEWARE'].items():
+            self.assertIn(path, config['MIDDLEWARE'])
+            self.assertNotIn(site, config['MIDDLEWARE'])
+
+    def test_admin_checks_pass(self):
+        for lean, middleware in middleware_profiles().items():
+            with self.subTest(API_LEAN_MIDDLEWARE=lean), self.settings(MIDDLEWARE=middleware):
+                self.assertEqual(check_dependencies(), [])
+
+    def test_deploy_check_only_silences_csrf_path(self):
+        profiles = middleware_profiles()
+        with self.settings(MIDDLEWARE=profiles['true']):
+            self.assertEqual([w.id for w in check_csrf_middleware(None)], ['security.W003'])
+        self.assertEqual(load_settings()['SILENCED_SYSTEM_CHECKS'], ['security.W003'])
+        self.assertNotIn('SILENCED_SYSTEM_CHECKS', load_settings(API_LEAN_MIDDLEWARE='false'))
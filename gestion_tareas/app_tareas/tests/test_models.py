@@ -46,6 +46,25 @@ class TaskModelTests(TestCase):
         self.assertEqual(choices.MEDIUM, 'MEDIA')
         self.assertEqual(choices.LOW, 'BAJA')
 
+    def test_priority_rank(self):
+        """Verifica que el rango numérico sigue a la prioridad"""
+        self.assertEqual(
+            [Task.PriorityChoices.rank(p) for p in Task.PriorityChoices.get_ordering()],
+            [1, 2, 3]
+        )
+        self.assertEqual(self.task.priority_rank, 1)
+
+        self.task.priority = Task.PriorityChoices.LOW
+        self.task.save()
+        self.assertEqual(self.task.priority_rank, 3)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.priority_rank, 3)
+
+        # También se mantiene con actualizaciones masivas
+        Task.objects.filter(pk=self.task.pk).update(priority=Task.PriorityChoices.MEDIUM)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.priority_rank, 2)
+
     def test_default_values(self):
         """Verifica los valores por defecto"""
         default_task = Task.objects.create(
@@ -80,7 +99,7 @@ class TaskModelTests(TestCase):
 
     def test_meta_options(self):
         """Verifica las opciones Meta del modelo"""
-        self.assertEqual(Task._meta.ordering, ['due_date', 'priority'])
+        self.assertEqual(Task._meta.ordering, ['due_date', 'priority_rank'])
         self.assertEqual(Task._meta.verbose_name, 'Tarea')
         self.assertEqual(Task._meta.verbose_name_plural, 'Tareas')
 
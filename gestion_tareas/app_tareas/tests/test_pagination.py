@@ -0,0 +1,131 @@
+import base64
+import json
+from datetime import date, timedelta
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient, APIRequestFactory
+
+from ..models import Task
+from ..views import TaskViewSet
+
+
+class TaskCursorPaginationTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='pageuser',
+            password='testpass123',
+            email='page@example.com'
+        )
+        self.token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+        # Varias tareas comparten fecha para forzar el desempate por id
+        start = date(2024, 1, 1)
+        priorities = ['ALTA', 'MEDIA', 'BAJA']
+        for i in range(12):
+            Task.objects.create(
+                name=f'Tarea {i}',
+                description='Descripción',
+                state='TO DO' if i % 2 else 'DOING',
+                priority=priorities[i % 3],
+                due_date=start + timedelta(days=i // 4),
+                assigned_user=self.user
+            )
+        self.url = reverse('task-list')
+
+    def collect(self, url):
+        """Recorre todas las páginas siguiendo los enlaces ``next``."""
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+        return ids
+
+    def test_response_shape(self):
+        response = self.client.get(self.url, {'page_size': 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {'next', 'previous', 'results'})
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+
+    def test_walks_every_task_once_in_order(self):
+        ids = self.collect(f'{self.url}?page_size=5')
+        expected = list(
+            Task.objects.order_by('due_date', 'priority_rank', 'id')
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(ids, expected)
+
+    def test_respects_ordering_and_filters(self):
+        ids = self.collect(f'{self.url}?page_size=2&state=TO DO&ordering=-due_date')
+        expected = list(
+            Task.objects.filter(state='TO DO')
+            .order_by('-due_date', 'priority_rank', 'id')
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(ids, expected)
+
+    def test_previous_link_returns_previous_page(self):
+        first = self.client.get(self.url, {'page_size': 4})
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+        self.assertEqual(
+            [item['id'] for item in back.data['results']],
+            [item['id'] for item in first.data['results']],
+        )
+
+    def test_page_size_is_capped(self):
+        with self.settings(API_MAX_PAGE_SIZE=3):
+            response = self.client.get(self.url, {'page_size': 100})
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_single_query_without_count(self):
+        view = TaskViewSet(action_map={'get': 'list'}, format_kwarg=None)
+        request = view.initialize_request(
+            APIRequestFactory().get(self.url, {'page_size': 5})
+        )
+        with CaptureQueriesContext(connection) as queries:
+            page = view.paginator.paginate_queryset(Task.objects.all(), request, view)
+        self.assertEqual(len(page), 5)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('COUNT(', queries[0]['sql'].upper())
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'cursor': 'no-es-un-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_with_invalid_values(self):
+        first = self.client.get(self.url, {'page_size': 2})
+        cursor = parse_qs(urlparse(first.data['next']).query)['cursor'][0]
+        payload = json.loads(base64.urlsafe_b64decode(cursor))
+        for position in [
+            ['garbage', 1, 2],
+            [payload['p'][0], {'a': 1}, 2],
+            [payload['p'][0], 1, 'x'],
+            [payload['p'][0], None, 2],
+            [payload['p'][0], 1, [2]],
+        ]:
+            with self.subTest(position=position):
+                bad = base64.urlsafe_b64encode(
+                    json.dumps({**payload, 'p': position}).encode()
+                ).decode()
+                response = self.client.get(self.url, {'cursor': bad, 'page_size': 2})
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_from_other_ordering_is_rejected(self):
+        first = self.client.get(self.url, {'page_size': 2})
+        cursor = parse_qs(urlparse(first.data['next']).query)['cursor'][0]
+        response = self.client.get(
+            self.url, {'cursor': cursor, 'ordering': '-due_date'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,146 @@
+import io
+import os
+import runpy
+import unittest
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from ..models import Task
+from ..parsers import FastJSONParser, MessagePackParser
+from ..renderers import FastJSONRenderer, MessagePackRenderer, msgpack
+from ..serializers import TaskSerializer
+from ..views import TaskViewSet
+
+
+class FastJSONRendererTests(TestCase):
+    def assertSameAsDRF(self, data, media_type='application/json'):
+        self.assertEqual(
+            FastJSONRenderer().render(data, media_type),
+            JSONRenderer().render(data, media_type),
+        )
+
+    def test_task_representation(self):
+        user = User.objects.create_user(username='renderuser', password='testpass123')
+        for name in ['Plain', 'Ünïcödé 🚀', 'Separador\u2028de línea\u2029', 'Comillas "y" \\']:
+            Task.objects.create(
+                name=name, description='D', due_date='2024-01-01', assigned_user=user
+            )
+        data = TaskSerializer(Task.objects.order_by('id'), many=True).data
+        self.assertSameAsDRF(data)
+        self.assertSameAsDRF({'results': data, 'next': None})
+
+    def test_native_values(self):
+        madrid = dt_timezone(timedelta(hours=2))
+        self.assertSameAsDRF({
+            'due_date': date(2024, 2, 29),
+            'created_at': datetime(2024, 1, 1, 10, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            'whole_second': datetime(2024, 1, 1, 10, 30, tzinfo=dt_timezone.utc),
+            'offset': datetime(2024, 6, 1, 8, 0, 1, 5, tzinfo=madrid),
+            'naive': datetime(2024, 6, 1, 8, 0),
+            'amount': Decimal('1.50'),
+            'lazy': gettext_lazy('Este campo es requerido.'),
+            'error': [ErrorDetail('Inválido', code='invalid')],
+            1: 'clave numérica',
+        })
+
+    def test_indent_falls_back_to_drf(self):
+        self.assertSameAsDRF({'a': [1, 2]}, 'application/json; indent=4')
+
+    def test_none(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+
+class FastJSONParserTests(SimpleTestCase):
+    def parse(self, body, encoding='utf-8'):
+        return FastJSONParser().parse(io.BytesIO(body), parser_context={'encoding': encoding})
+
+    def test_parses(self):
+        self.assertEqual(self.parse('{"name": "Ñandú", "ids": [1, 2]}'.encode()), {'name': 'Ñandú', 'ids': [1, 2]})
+        self.assertEqual(self.parse('{"name": "Ñandú"}'.encode('latin-1'), 'latin-1'), {'name': 'Ñandú'})
+
+    def test_rejects_invalid_json(self):
+        for body in [b'{no', b'', b'{"a": NaN}']:
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self.parse(body)
+
+
+@unittest.skipIf(msgpack is None, 'msgpack no está instalado')
+class MessagePackTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='packuser', password='testpass123')
+        token = Token.objects.get(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        Task.objects.create(name='Empaquetada', description='D', due_date='2024-01-01')
+        patcher = mock.patch.multiple(
+            TaskViewSet,
+            renderer_classes=[FastJSONRenderer, MessagePackRenderer],
+            parser_classes=[FastJSONParser, MessagePackParser],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_selected_through_accept(self):
+        url = reverse('task-list')
+        as_json = self.client.get(url)
+        self.assertEqual(as_json['Content-Type'], 'application/json')
+        response = self.client.get(url, HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(msgpack.unpackb(response.content), as_json.json())
+
+    def test_request_body(self):
+        body = msgpack.packb({'name': 'Nueva', 'description': 'D', 'due_date': '2024-03-01'})
+        response = self.client.post(
+            reverse('task-list'), body, content_type='application/msgpack',
+            HTTP_ACCEPT='application/msgpack',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(msgpack.unpackb(response.content)['name'], 'Nueva')
+
+        response = self.client.post(reverse('task-list'), b'\xc1', content_type='application/msgpack')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_dates_as_iso_strings(self):
+        content = MessagePackRenderer().render({'due_date': date(2024, 1, 2)})
+        self.assertEqual(msgpack.unpackb(content), {'due_date': '2024-01-02'})
+
+
+class RendererSettingsTests(SimpleTestCase):
+    def load(self, **env):
+        base = {
+            name: value for name, value in os.environ.items()
+            if name not in ('DEBUG', 'API_FAST_JSON', 'API_MSGPACK')
+        }
+        with mock.patch.dict(os.environ, {**base, **env}, clear=True):
+            config = runpy.run_path(str(Path(settings.BASE_DIR) / 'gestion_tareas' / 'settings.py'))
+        return config['REST_FRAMEWORK']
+
+    def test_production_defaults(self):
+        config = self.load()
+        self.assertEqual(
+            config['DEFAULT_RENDERER_CLASSES'], ['app_tareas.renderers.FastJSONRenderer']
+        )
+        self.assertEqual(config['DEFAULT_PARSER_CLASSES'][0], 'app_tareas.parsers.FastJSONParser')
+
+    def test_debug_and_msgpack(self):
+        config = self.load(DEBUG='True', API_MSGPACK='true', API_FAST_JSON='false')
+        self.assertEqual(config['DEFAULT_RENDERER_CLASSES'], [
+            'rest_framework.renderers.JSONRenderer',
+            'app_tareas.renderers.MessagePackRenderer',
+            'rest_framework.renderers.BrowsableAPIRenderer',
+        ])
+        self.assertIn('app_tareas.parsers.MessagePackParser', config['DEFAULT_PARSER_CLASSES'])
@@ -0,0 +1,154 @@
+import os
+import runpy
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+from .. import routers
+from ..authentication import CachedTokenAuthentication
+from ..middleware import ReplicaStickinessMiddleware
+from ..models import Task
+
+REPLICAS = override_settings(DATABASE_REPLICAS=['replica_1', 'replica_2'])
+
+
+@REPLICAS
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = routers.ReplicaRouter()
+
+    def test_task_and_token_reads_go_to_replicas(self):
+        self.assertIn(self.router.db_for_read(Task), ['replica_1', 'replica_2'])
+        self.assertIn(self.router.db_for_read(Token), ['replica_1', 'replica_2'])
+        self.assertIsNone(self.router.db_for_read(User))
+        self.assertEqual(self.router.db_for_write(Task), 'default')
+
+    def test_use_primary(self):
+        with routers.use_primary():
+            self.assertEqual(self.router.db_for_read(Task), 'default')
+        self.assertNotEqual(self.router.db_for_read(Task), 'default')
+
+    def test_no_migrations_on_replicas(self):
+        self.assertFalse(self.router.allow_migrate('replica_1', 'app_tareas'))
+        self.assertIsNone(self.router.allow_migrate('default', 'app_tareas'))
+
+    def test_cache_timeout_is_capped_on_replica_reads(self):
+        with self.settings(REPLICA_STICKY_SECONDS=10):
+            self.assertEqual(routers.cache_timeout(300), 10)
+            self.assertEqual(routers.cache_timeout(None), 10)
+            with routers.use_primary():
+                self.assertEqual(routers.cache_timeout(300), 300)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas_reads_stay_on_default(self):
+        self.assertEqual(self.router.db_for_read(Task), 'default')
+        self.assertEqual(routers.cache_timeout(300), 300)
+
+
+@REPLICAS
+class ReplicaStickinessMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.seen = []
+
+        def get_response(request):
+            self.seen.append(routers.reading_from_replica())
+            return HttpResponse(status=201 if request.method == 'POST' else 200)
+
+        self.middleware = ReplicaStickinessMiddleware(get_response)
+        self.factory = RequestFactory()
+
+    def request(self, method, token='abc'):
+        headers = {'Authorization': f'Token {token}'} if token else {}
+        return self.middleware(getattr(self.factory, method)('/api/tasks/', headers=headers))
+
+    def test_writes_read_from_primary_and_pin_the_client(self):
+        self.request('get')
+        self.request('post')
+        self.request('get')
+        self.request('get', token='otro')
+        self.assertEqual(self.seen, [True, False, False, True])
+
+    def test_pin_expires(self):
+        with self.settings(REPLICA_STICKY_SECONDS=0):
+            self.request('post')
+        self.request('get')
+        self.assertEqual(self.seen, [False, True])
+
+    async def test_async_requests(self):
+        async def get_response(request):
+            self.seen.append(routers.reading_from_replica())
+            return HttpResponse(status=201)
+
+        middleware = ReplicaStickinessMiddleware(get_response)
+        factory = AsyncRequestFactory()
+        headers = {'Authorization': 'Token abc'}
+        await middleware(factory.post('/api/tasks/', headers=headers))
+        await middleware(factory.get('/api/tasks/', headers=headers))
+        self.assertEqual(self.seen, [False, False])
+
+    @override_settings(
+        CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+            'sticky': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'test-sticky',
+            },
+        },
+        REPLICA_STICKY_CACHE_ALIAS='sticky',
+    )
+    def test_pin_is_kept_in_configured_cache(self):
+        self.request('post')
+        self.assertEqual(len(caches['sticky']._cache), 1)
+        self.assertEqual(len(caches['default']._cache), 0)
+
+
+class ReplicaSettingsTests(SimpleTestCase):
+    def load(self, **env):
+        base = {
+            name: value for name, value in os.environ.items()
+            if name not in ('SERVER_WORKERS', 'CACHE_BACKEND', 'DB_REPLICA_HOSTS')
+        }
+        with mock.patch.dict(os.environ, {**base, **env}, clear=True):
+            return runpy.run_path(str(Path(settings.BASE_DIR) / 'gestion_tareas' / 'settings.py'))
+
+    def test_several_workers_need_a_shared_sticky_cache(self):
+        self.assertEqual(self.load(DB_REPLICA_HOSTS='r1')['DATABASE_REPLICAS'], ['replica_1'])
+        with self.assertRaises(ImproperlyConfigured):
+            self.load(DB_REPLICA_HOSTS='r1', SERVER_WORKERS='4')
+        shared = self.load(
+            DB_REPLICA_HOSTS='r1', SERVER_WORKERS='4',
+            CACHE_BACKEND='django.core.cache.backends.redis.RedisCache',
+        )
+        self.assertEqual(shared['DATABASE_REPLICAS'], ['replica_1'])
+
+
+class TokenLookupFallbackTests(TestCase):
+    def test_missing_token_on_replica_is_retried_on_primary(self):
+        user = User.objects.create_user(username='replicauser', password='testpass123')
+        token = Token.objects.get(user=user)
+        attempts = []
+
+        def lookup(key):
+            attempts.append(routers.reading_from_replica())
+            if len(attempts) == 1:
+                raise AuthenticationFailed('Token inválido.')
+            return user, token
+
+        patch = mock.patch.object(
+            TokenAuthentication, 'authenticate_credentials', side_effect=lookup
+        )
+        with patch, self.settings(DATABASE_REPLICAS=['replica_1']):
+            self.assertEqual(
+                CachedTokenAuthentication().authenticate_credentials(token.key), (user, token)
+            )
+        self.assertEqual(attempts, [True, False])
@@ -76,6 +76,93 @@ class TaskSerializerTest(TestCase):
         self.assertEqual(updated_task.name, 'Tarea de prueba')
 
 
+class TaskSerializerQueryCountTest(TestCase):
+    """
+    El usuario asignado se resuelve como mucho una vez por escritura
+    (y una vez por lote en las escrituras masivas).
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='countuser',
+            password='testpass123',
+            email='count@example.com'
+        )
+        self.other = User.objects.create_user(
+            username='otheruser',
+            password='testpass123',
+            email='other@example.com'
+        )
+        self.task_data = {
+            'name': 'Tarea contada',
+            'description': 'Descripción',
+            'state': 'TO DO',
+            'priority': 'MEDIA',
+            'due_date': '2023-12-31',
+            'assigned_user': self.user.id
+        }
+        self.task = Task.objects.create(
+            name='Tarea existente',
+            description='Descripción',
+            due_date='2023-12-01',
+            assigned_user=self.user
+        )
+
+    def save(self, *args, **kwargs):
+        serializer = TaskSerializer(*args, **kwargs)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        return serializer.save()
+
+    def test_create_queries(self):
+        # usuario + INSERT + contador nuevo (UPDATE sin filas, INSERT, UPDATE)
+        with self.assertNumQueries(2 + 3):
+            self.save(data=self.task_data)
+
+    def test_create_without_user_queries(self):
+        data = dict(self.task_data, assigned_user=None)
+        with self.assertNumQueries(1 + 3):  # INSERT + contador nuevo
+            self.save(data=data)
+
+    def test_update_queries(self):
+        data = dict(self.task_data, assigned_user=self.other.id)
+        # usuario + valores previos bloqueados + UPDATE + contador anterior
+        # (UPDATE) y nuevo (3)
+        with self.assertNumQueries(3 + 1 + 3):
+            task = self.save(instance=self.task, data=data)
+        self.assertEqual(task.assigned_user, self.other)
+
+    def test_partial_update_queries(self):
+        with self.assertNumQueries(2 + 1 + 3):  # valores previos + UPDATE + contadores
+            self.save(instance=self.task, data={'state': 'DOING'}, partial=True)
+        with self.assertNumQueries(3 + 1 + 3):  # usuario + valores previos + UPDATE + contadores
+            self.save(
+                instance=self.task,
+                data={'assigned_user': self.other.id},
+                partial=True
+            )
+
+    def test_bulk_create_queries(self):
+        data = [
+            dict(self.task_data, assigned_user=user.id)
+            for user in [self.user, self.other] * 10
+        ]
+        # usuarios (IN) + INSERT + dos contadores nuevos (2 UPDATE sin filas,
+        # un INSERT, 2 UPDATE): no depende del tamaño del lote
+        with self.assertNumQueries(2 + 5):
+            tasks = self.save(data=data, many=True)
+        self.assertEqual(len(tasks), 20)
+
+    def test_bulk_update_queries(self):
+        tasks = [
+            Task.objects.create(name=f'Tarea {i}', description='D', due_date='2023-12-01')
+            for i in range(10)
+        ]
+        data = [{'id': task.pk, 'assigned_user': self.other.id} for task in tasks]
+        # usuarios (IN) + UPDATE + contador anterior (UPDATE) y nuevo (3)
+        with self.assertNumQueries(2 + 1 + 3):
+            self.save(tasks, data=data, many=True, partial=True)
+
+
 class RegisterSerializerTest(TestCase):
     def setUp(self):
         self.valid_data = {
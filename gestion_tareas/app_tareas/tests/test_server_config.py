@@ -0,0 +1,60 @@
+import os
+import runpy
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+CONFIG = Path(settings.BASE_DIR) / 'gunicorn.conf.py'
+
+
+class GunicornConfigTests(SimpleTestCase):
+    def load(self, **env):
+        base = {
+            name: value for name, value in os.environ.items()
+            if not name.startswith(('GUNICORN_', 'WEB_CONCURRENCY', 'SERVER_MODE', 'PORT'))
+        }
+        with mock.patch.dict(os.environ, {**base, **env}, clear=True):
+            return runpy.run_path(str(CONFIG))
+
+    def test_defaults_to_preloaded_wsgi(self):
+        config = self.load()
+        self.assertEqual(config['wsgi_app'], 'gestion_tareas.wsgi:application')
+        self.assertEqual(config['worker_class'], 'gthread')
+        self.assertTrue(config['preload_app'])
+        self.assertFalse(config['reload'])
+        self.assertGreaterEqual(config['workers'], 2)
+
+    def test_reads_environment(self):
+        config = self.load(
+            SERVER_MODE='asgi', WEB_CONCURRENCY='3', GUNICORN_THREADS='8',
+            GUNICORN_KEEPALIVE='10', PORT='9000',
+        )
+        self.assertEqual(config['wsgi_app'], 'gestion_tareas.asgi:application')
+        self.assertEqual(config['worker_class'], 'uvicorn.workers.UvicornWorker')
+        self.assertEqual(config['workers'], 3)
+        self.assertEqual(config['threads'], 8)
+        self.assertEqual(config['keepalive'], 10)
+        self.assertEqual(config['bind'], '0.0.0.0:9000')
+
+    def test_empty_values_are_unset(self):
+        # Así llegan las líneas vacías de .env_example a través de env_file.
+        config = self.load(
+            WEB_CONCURRENCY='', GUNICORN_THREADS='', GUNICORN_PRELOAD='', PORT='',
+        )
+        self.assertGreaterEqual(config['workers'], 2)
+        self.assertEqual(config['threads'], 4)
+        self.assertTrue(config['preload_app'])
+        self.assertEqual(config['bind'], '0.0.0.0:8000')
+
+    def test_exports_worker_count_to_settings(self):
+        base = {name: value for name, value in os.environ.items() if name != 'SERVER_WORKERS'}
+        with mock.patch.dict(os.environ, {**base, 'WEB_CONCURRENCY': '3'}, clear=True):
+            runpy.run_path(str(CONFIG))
+            self.assertEqual(os.environ['SERVER_WORKERS'], '3')
+
+    def test_reload_disables_preload(self):
+        config = self.load(GUNICORN_RELOAD='true')
+        self.assertTrue(config['reload'])
+        self.assertFalse(config['preload_app'])
@@ -0,0 +1,103 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from ..models import Task
+
+# En el orden del serializador (los campos declarados van primero).
+COMPACT_FIELDS = ['id', 'assigned_user', 'name', 'state', 'priority', 'due_date']
+
+
+class SparseFieldsTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='sparseuser', password='testpass123')
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        start = date(2024, 1, 1)
+        self.tasks = [
+            Task.objects.create(
+                name=f'Tarea {i}', description='Una descripción larga ' * 20,
+                comment='Comentario', state='DOING', due_date=start + timedelta(days=i % 3),
+                assigned_user=self.user
+            )
+            for i in range(6)
+        ]
+        self.list_url = reverse('task-list')
+        self.detail_url = reverse('task-detail', args=[self.tasks[0].pk])
+
+    def get(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        # La consulta de la página (la otra es el agregado del ETag).
+        task_query = next(
+            query['sql'] for query in queries.captured_queries
+            if 'LIMIT' in query['sql'] and '"app_tareas_task"."name"' in query['sql']
+        )
+        return response, task_query
+
+    def test_list_is_compact_by_default(self):
+        response, sql = self.get(self.list_url)
+        self.assertEqual(list(response.data['results'][0]), COMPACT_FIELDS)
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn('"comment"', sql)
+
+    def test_fields_narrow_output_and_columns(self):
+        response, sql = self.get(self.list_url, fields='name,state')
+        self.assertEqual(list(response.data['results'][0]), ['id', 'name', 'state'])
+        self.assertNotIn('"assigned_user_id"', sql)
+
+    def test_omit_and_all(self):
+        response, _ = self.get(self.list_url, omit='priority,assigned_user')
+        self.assertEqual(list(response.data['results'][0]), ['id', 'name', 'state', 'due_date'])
+
+        response, sql = self.get(self.list_url, fields='__all__', omit='comment')
+        item = response.data['results'][0]
+        self.assertIn('description', item)
+        self.assertNotIn('comment', item)
+        self.assertIn('"description"', sql)
+
+    def test_pagination_reads_no_deferred_columns(self):
+        first = self.client.get(self.list_url, {'fields': 'name', 'page_size': 2, 'ordering': '-priority'})
+        self.client.get(first.data['next'])  # el token queda en caché
+        # ETag + página: las columnas del cursor se leen aunque no se pidan
+        with self.assertNumQueries(2):
+            response = self.client.get(first.data['next'])
+        self.assertEqual(list(response.data['results'][0]), ['id', 'name'])
+
+    def test_retrieve_is_full_by_default(self):
+        response = self.client.get(self.detail_url)
+        self.assertIn('description', response.data)
+        response = self.client.get(self.detail_url, {'fields': 'name'})
+        self.assertEqual(response.data, {'id': self.tasks[0].pk, 'name': 'Tarea 0'})
+
+    def test_retrieve_etag_depends_on_fields(self):
+        full = self.client.get(self.detail_url)['ETag']
+        narrow = self.client.get(self.detail_url, {'fields': 'name'})['ETag']
+        self.assertNotEqual(full, narrow)
+
+    def test_board_cards_are_compact(self):
+        response = self.client.get(reverse('task-board'), {'omit': 'priority'})
+        column = next(c for c in response.data['columns'] if c['state'] == 'DOING')
+        self.assertEqual(
+            list(column['cards'][0]), ['id', 'assigned_user', 'name', 'state', 'due_date']
+        )
+
+    def test_unknown_field(self):
+        response = self.client.get(self.list_url, {'fields': 'name,secret'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'fields': ['"secret" no es un campo válido.']})
+
+    def test_writes_return_full_representation(self):
+        response = self.client.post(self.list_url + '?fields=name', {
+            'name': 'Nueva', 'description': 'D', 'due_date': '2024-01-01',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn('description', response.data)
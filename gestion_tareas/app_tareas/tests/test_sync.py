@@ -0,0 +1,174 @@
+import base64
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from ..models import Task, TaskTombstone
+
+
+@override_settings(API_SYNC_WINDOW_SECONDS=0)
+class TaskChangesTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='syncuser', password='testpass123')
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.tasks = [self.create_task(f'Tarea {i}') for i in range(3)]
+        self.url = reverse('task-changes')
+
+    def create_task(self, name):
+        return Task.objects.create(
+            name=name, description='Descripción', state='TO DO', due_date='2024-01-01'
+        )
+
+    def sync(self, since=None, **params):
+        if since:
+            params['since'] = since
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_full_sync_returns_every_task(self):
+        TaskTombstone.objects.create(task_id=999)
+        data = self.sync()
+        self.assertEqual([task['id'] for task in data['changed']], [t.pk for t in self.tasks])
+        self.assertEqual(data['deleted'], [])
+        self.assertFalse(data['has_more'])
+
+    def test_nothing_new_is_cheap(self):
+        cursor = self.sync()['next']
+        with self.assertNumQueries(2):  # tareas + borrados (el token ya está en caché)
+            data = self.sync(cursor)
+        self.assertEqual(data['changed'], [])
+        self.assertEqual(data['deleted'], [])
+
+    def test_returns_only_changes_and_deletions(self):
+        cursor = self.sync()['next']
+        changed = self.tasks[1]
+        changed.name = 'Cambiada'
+        changed.save()
+        created = self.create_task('Nueva')
+        deleted_pk = self.tasks[0].pk
+        self.tasks[0].delete()
+
+        data = self.sync(cursor)
+        self.assertEqual([task['id'] for task in data['changed']], [changed.pk, created.pk])
+        self.assertEqual(data['changed'][0]['name'], 'Cambiada')
+        self.assertEqual(data['deleted'], [deleted_pk])
+
+        self.assertEqual(self.sync(data['next'])['changed'], [])
+
+    def test_bulk_writes_are_synced(self):
+        cursor = self.sync()['next']
+        self.client.post(
+            reverse('task-transition'),
+            {'state': 'DOING', 'ids': [self.tasks[0].pk]}, format='json'
+        )
+        self.client.delete(
+            reverse('task-bulk'), {'ids': [self.tasks[1].pk]}, format='json'
+        )
+        data = self.sync(cursor)
+        self.assertEqual([task['id'] for task in data['changed']], [self.tasks[0].pk])
+        self.assertEqual(data['deleted'], [self.tasks[1].pk])
+
+    def test_pages_with_has_more(self):
+        ids = []
+        cursor = None
+        while True:
+            data = self.sync(cursor, page_size=2)
+            ids.extend(task['id'] for task in data['changed'])
+            cursor = data['next']
+            if not data['has_more']:
+                break
+        self.assertEqual(ids, [t.pk for t in self.tasks])
+
+    def test_same_timestamp_uses_id_tiebreak(self):
+        stamp = timezone.now()
+        Task.objects.update(updated_at=stamp)
+        first = self.sync(page_size=1)
+        second = self.sync(first['next'], page_size=2)
+        self.assertEqual(
+            [task['id'] for task in first['changed'] + second['changed']],
+            [t.pk for t in self.tasks],
+        )
+
+    @override_settings(API_SYNC_WINDOW_SECONDS=30)
+    def test_recent_changes_are_redelivered(self):
+        deleted_pk = self.tasks[0].pk
+        self.tasks[0].delete()
+        first = self.sync()
+        second = self.sync(first['next'])
+        self.assertEqual(
+            [task['id'] for task in second['changed']], [t.pk for t in self.tasks[1:]]
+        )
+        self.assertEqual(first['deleted'], [deleted_pk])
+        self.assertEqual(second['deleted'], [deleted_pk])
+
+    @override_settings(API_SYNC_WINDOW_SECONDS=30)
+    def test_late_commit_is_not_skipped(self):
+        cursor = self.sync()['next']
+        # Una transacción que empezó antes y confirma después de servir
+        # el cursor: su ``updated_at`` queda por detrás de las demás.
+        late = self.create_task('Tardía')
+        Task.objects.filter(pk=late.pk).update(
+            updated_at=timezone.now() - timedelta(seconds=10)
+        )
+        data = self.sync(cursor)
+        self.assertIn(late.pk, [task['id'] for task in data['changed']])
+
+    @override_settings(API_SYNC_WINDOW_SECONDS=30)
+    def test_old_changes_are_not_redelivered(self):
+        Task.objects.update(updated_at=timezone.now() - timedelta(minutes=5))
+        cursor = self.sync()['next']
+        self.assertEqual(self.sync(cursor)['changed'], [])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'since': 'no-es-un-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_naive_cursor_is_invalid(self):
+        for payload in [
+            {'u': [None, None], 'd': 0, 't': '2024-01-01T00:00:00'},
+            {'u': ['2024-01-01T00:00:00', 1], 'd': 0, 't': timezone.now().isoformat()},
+        ]:
+            with self.subTest(payload=payload):
+                cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+                response = self.client.get(self.url, {'since': cursor})
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_deleting_assigned_user_is_synced(self):
+        assigned = User.objects.create_user(username='assigned', password='testpass123')
+        task = self.tasks[2]
+        task.assigned_user = assigned
+        task.save()
+        cursor = self.sync()['next']
+        assigned.delete()
+        data = self.sync(cursor)
+        self.assertEqual([task['id'] for task in data['changed']], [task.pk])
+        self.assertIsNone(data['changed'][0]['assigned_user'])
+
+    def test_expired_cursor(self):
+        cursor = self.sync()['next']
+        later = timezone.now() + timedelta(days=31)
+        with mock.patch('django.utils.timezone.now', return_value=later):
+            response = self.client.get(self.url, {'since': cursor})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_prune_command(self):
+        old = TaskTombstone.objects.create(task_id=1)
+        TaskTombstone.objects.filter(pk=old.pk).update(
+            deleted_at=timezone.now() - timedelta(days=40)
+        )
+        TaskTombstone.objects.create(task_id=2)
+        call_command('prune_task_tombstones', stdout=StringIO())
+        self.assertEqual(list(TaskTombstone.objects.values_list('task_id', flat=True)), [2])
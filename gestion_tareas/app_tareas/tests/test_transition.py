@@ -0,0 +1,101 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APIClient
+
+from ..models import Task
+
+
+class TaskTransitionTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='flowuser',
+            password='testpass123',
+            email='flow@example.com'
+        )
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.url = reverse('task-transition')
+
+        self.tasks = {}
+        for state in Task.StateChoices.get_workflow():
+            self.tasks[state] = Task.objects.create(
+                name=f'Tarea {state}',
+                description='Descripción',
+                state=state,
+                due_date='2024-01-01',
+                assigned_user=self.user
+            )
+
+    def states(self):
+        return {
+            task.name: task.state
+            for task in Task.objects.all()
+        }
+
+    def test_allowed_sources(self):
+        choices = Task.StateChoices
+        self.assertEqual(choices.allowed_sources(choices.BACKLOG), [choices.TO_DO])
+        self.assertEqual(choices.allowed_sources(choices.DOING), [choices.TO_DO, choices.TEST])
+        self.assertEqual(choices.allowed_sources(choices.DONE), [choices.TEST])
+
+    def test_transition_by_ids_moves_only_allowed(self):
+        ids = [task.pk for task in self.tasks.values()]
+        # autenticación + tareas afectadas (bloqueadas) + UPDATE + los
+        # contadores de origen y destino
+        with self.assertNumQueries(5):
+            response = self.client.post(self.url, {'state': 'DONE', 'ids': ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['moved'], 1)
+        self.assertEqual(response.data['from'], ['TEST'])
+        self.assertEqual(self.states(), {
+            'Tarea BACKLOG': 'BACKLOG',
+            'Tarea TO DO': 'TO DO',
+            'Tarea DOING': 'DOING',
+            'Tarea TEST': 'DONE',
+            'Tarea DONE': 'DONE',
+        })
+
+    def test_transition_by_filter(self):
+        response = self.client.post(
+            f'{self.url}?state=TO DO', {'state': 'DOING'}, format='json'
+        )
+        self.assertEqual(response.data['moved'], 1)
+        self.assertEqual(Task.objects.filter(state='DOING').count(), 2)
+
+    def test_transition_updates_timestamp(self):
+        task = self.tasks['DOING']
+        before = task.updated_at
+        self.client.post(self.url, {'state': 'TEST', 'ids': [task.pk]}, format='json')
+        task.refresh_from_db()
+        self.assertEqual(task.state, 'TEST')
+        self.assertGreater(task.updated_at, before)
+
+    def test_requires_ids_or_filter(self):
+        response = self.client.post(self.url, {'state': 'DONE'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Task.objects.filter(state='DONE').count(), 1)
+
+    def test_parameters_that_do_not_filter_are_not_a_filter(self):
+        for query in ['format=json', 'search=', 'state=', 'ordering=priority', 'page_size=10']:
+            with self.subTest(query=query):
+                response = self.client.post(f'{self.url}?{query}', {'state': 'DONE'}, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('ids', response.data)
+        self.assertEqual(Task.objects.filter(state='DONE').count(), 1)
+
+    def test_transition_by_search(self):
+        response = self.client.post(f'{self.url}?search=TEST', {'state': 'DONE'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['moved'], 1)
+
+    def test_invalid_filter_is_rejected(self):
+        response = self.client.post(f'{self.url}?state=NOPE', {'state': 'DONE'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Task.objects.filter(state='DONE').count(), 1)
+
+    def test_invalid_state(self):
+        response = self.client.post(self.url, {'state': 'ARCHIVED', 'ids': [1]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -30,8 +30,8 @@ class TaskViewSetTests(APITestCase):
         url = reverse('task-list')
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['name'], 'Tarea de prueba')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['name'], 'Tarea de prueba')
 
     def test_retrieve_task(self):
         url = reverse('task-detail', kwargs={'pk': self.task.pk})
@@ -67,7 +67,7 @@ class TaskViewSetTests(APITestCase):
                 url = f"{base_url}?{query}"
                 response = self.client.get(url)
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
-                self.assertEqual(len(response.data), expected_count)
+                self.assertEqual(len(response.data['results']), expected_count)
 
     def test_search_ordering(self):
         # Crear tareas adicionales para pruebas
@@ -103,12 +103,12 @@ class TaskViewSetTests(APITestCase):
                 url = f"{base_url}?{query}"
                 response = self.client.get(url)
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
-                self.assertEqual(len(response.data), expected_count)
+                self.assertEqual(len(response.data['results']), expected_count)
         
         # Pruebas de ordenamiento mejoradas
         ordering_cases = [
-            ('ordering=priority', ['ALTA', 'BAJA', 'MEDIA']),  # Orden alfabético
-            ('ordering=-priority', ['MEDIA', 'BAJA', 'ALTA'])  # Orden inverso
+            ('ordering=priority', ['ALTA', 'MEDIA', 'BAJA']),  # Orden por urgencia
+            ('ordering=-priority', ['BAJA', 'MEDIA', 'ALTA'])  # Orden inverso
         ]
         
         for query, expected_order in ordering_cases:
@@ -118,7 +118,7 @@ class TaskViewSetTests(APITestCase):
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
                 
                 # Verificar el orden de prioridades
-                priorities = [item['priority'] for item in response.data]
+                priorities = [item['priority'] for item in response.data['results']]
                 self.assertEqual(priorities, expected_order)
 
 class AuthTests(APITestCase):
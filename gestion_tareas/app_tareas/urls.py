@@ -1,16 +1,34 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import TaskViewSet
-from .views import RegisterView, CustomAuthToken
+from .views import RegisterView, CustomAuthToken, DatabaseStatsView, TaskCountsView, task_events
 
 router = DefaultRouter()
 router.register(r"tasks", TaskViewSet,basename='task')
 
 
 urlpatterns = [
+    # Antes del router, cuya ruta de detalle también casaría con "events" o
+    # "counts".
+    path('tasks/events/', task_events, name='task-events'),
+    path('tasks/counts/', TaskCountsView.as_view(), name='task-counts'),
+]
+
+if settings.API_ASYNC_READS:
+    # Bajo ASGI, listado y detalle con el ORM asíncrono (mismos nombres de
+    # ruta; las escrituras se delegan en TaskViewSet). El detalle solo casa
+    # con ids numéricos para no tapar las acciones del router (bulk/...).
+    from .async_views import AsyncTaskView
+
+    urlpatterns += [
+        path('tasks/', AsyncTaskView.as_view(), name='task-list'),
+        path('tasks/<int:pk>/', AsyncTaskView.as_view(detail=True), name='task-detail'),
+    ]
+
+urlpatterns += [
     path('', include(router.urls)),
     path('register/', RegisterView.as_view(), name='register'),
     path('login/', CustomAuthToken.as_view(), name='login'),
-
-    
+    path('db-stats/', DatabaseStatsView.as_view(), name='db-stats'),
 ]
\ No newline at end of file
@@ -1,39 +1,388 @@
-from rest_framework import viewsets, filters
+from contextlib import nullcontext
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connections, router, transaction
+from django.http import HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated
+from rest_framework.parsers import MultiPartParser
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework import generics, permissions
+from django.conf import settings
 from django.contrib.auth.models import User
 from .serializers import RegisterSerializer
-from .models import Task
-from .serializers import TaskSerializer
+from .filters import TaskOrderingFilter, TaskSearchFilter
+from .models import Task, TaskCounter, TaskTombstone
+from . import events
+from .authentication import CachedTokenAuthentication
+from .board import build_board
+from .counters import diff
+from .db_stats import database_stats
+from .events import deleted_event, moved_event
+from .export import aiter_chunks, encode_rows, serialize_rows, stream_csv, stream_ndjson
+from .importer import ImportFileError, TaskImporter, detect_format, read_rows
+from .mixins import (
+  CachedListMixin,
+  ConditionalGetMixin,
+  RowEncoderMixin,
+  SparseFieldsViewMixin,
+)
+from .pagination import TaskCursorPagination
+from .renderers import CSVRenderer, NDJSONRenderer
+from .signals import tasks_changed
+from .sync import collect_changes, decode_since
+from .serializers import (
+  TaskBoardSerializer,
+  TaskCounterSerializer,
+  TaskIdsSerializer,
+  TaskSerializer,
+  TaskTransitionSerializer,
+)
 from rest_framework import status
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+def delete_tasks(alias, ids):
+  """
+  ``DELETE`` de las tareas ``ids`` en ``alias``, sin cargarlas ni enviar sus
+  señales (ver ``TaskViewSet.bulk_destroy``).
+  """
+  connection = connections[alias]
+  table = connection.ops.quote_name(Task._meta.db_table)
+  column = connection.ops.quote_name(Task._meta.pk.column)
+  placeholders = ", ".join(["%s"] * len(ids))
+  with connection.cursor() as cursor:
+    cursor.execute(f"DELETE FROM {table} WHERE {column} IN ({placeholders})", ids)
+
+
+class TaskViewSet(
+  CachedListMixin,
+  RowEncoderMixin,
+  ConditionalGetMixin,
+  SparseFieldsViewMixin,
+  viewsets.ModelViewSet,
+):
   queryset = Task.objects.all()
   serializer_class = TaskSerializer
+  pagination_class = TaskCursorPagination
   filter_backends = [
     DjangoFilterBackend,
-    filters.SearchFilter,
-    filters.OrderingFilter,
+    TaskSearchFilter,
+    TaskOrderingFilter,
   ]
   filterset_fields = ["state", "due_date", "assigned_user__username"]
   search_fields = ["name", "description"]
   ordering_fields = ["due_date", "priority"]
   ordering = ['due_date']
+  # Listado y tablero en su forma compacta (sin los textos largos); el
+  # detalle, completo. Se ajustan con ?fields= / ?omit=.
+  sparse_fields = {
+    "list": settings.API_LIST_FIELDS,
+    "board": settings.API_LIST_FIELDS,
+    "retrieve": None,
+  }
+  sparse_columns = TaskCursorPagination.ordering
+  # Lecturas con ``values_list`` y un codificador de filas en lugar del
+  # serializador (misma salida; ver ``encoders``).
+  fast_read_actions = settings.API_FAST_READS
+
+  @action(detail=False, methods=["post"], url_path="bulk")
+  def bulk(self, request):
+    """
+    Crea un lote de tareas. Todo el lote se valida antes de escribir; si algún
+    elemento falla no se crea ninguno y se devuelven los errores por elemento.
+    """
+    serializer = self.get_serializer(
+      data=request.data,
+      many=True,
+      allow_empty=False,
+      max_length=settings.API_MAX_BULK_SIZE,
+    )
+    serializer.is_valid(raise_exception=True)
+    with transaction.atomic():
+      serializer.save()
+    return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+  @bulk.mapping.patch
+  def bulk_update(self, request):
+    """
+    Actualiza parcialmente un lote de tareas; cada elemento lleva su ``id``.
+    """
+    items = request.data if isinstance(request.data, list) else []
+    if len(items) > settings.API_MAX_BULK_SIZE:
+      # El serializador rechaza el lote; no hace falta buscar sus tareas.
+      items = []
+    ids = set()
+    for item in items:
+      try:
+        ids.add(int(item["id"]))
+      except (TypeError, KeyError, ValueError):
+        continue
+    # Las tareas se bloquean hasta el COMMIT: el estado y el usuario previos
+    # con los que se calculan los contadores son los que se sobrescriben. Sin
+    # ids el lote no es válido y no hace falta transacción.
+    with transaction.atomic() if ids else nullcontext():
+      tasks = (
+        list(
+          self.get_queryset()
+          .filter(pk__in=ids)
+          .select_for_update(of=("self",))
+          .order_by("pk")
+        )
+        if ids
+        else []
+      )
+      serializer = self.get_serializer(
+        tasks,
+        data=request.data,
+        many=True,
+        partial=True,
+        allow_empty=False,
+        max_length=settings.API_MAX_BULK_SIZE,
+      )
+      serializer.is_valid(raise_exception=True)
+      serializer.save()
+    return Response(serializer.data)
+
+  @bulk.mapping.delete
+  def bulk_destroy(self, request):
+    """
+    Elimina las tareas de ``{"ids": [...]}`` e informa de las que no existían.
+    """
+    serializer = TaskIdsSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    ids = set(serializer.validated_data["ids"])
+
+    # Bloqueo, borrado y registros en la base de datos de escritura, sin
+    # depender de que el middleware haya fijado el primario.
+    alias = router.db_for_write(Task)
+    with transaction.atomic(using=alias):
+      rows = list(
+        self.get_queryset()
+        .using(alias)
+        .filter(pk__in=ids)
+        .select_for_update(of=("self",))
+        .order_by("pk")
+        .values_list("pk", "state", "assigned_user_id")
+      )
+      found = {pk for pk, _, _ in rows}
+      if rows:
+        # Como en ``transition``: un solo DELETE y los registros de borrado,
+        # los contadores, la caché y los eventos agregados. ``delete()`` del
+        # QuerySet pasaría por el Collector, que con receptores de
+        # ``pre_delete``/``post_delete`` carga y señala cada fila; Task no
+        # tiene relaciones inversas que borrar en cascada, así que basta con
+        # el DELETE explícito.
+        delete_tasks(alias, sorted(found))
+        TaskTombstone.objects.using(alias).bulk_create(
+          [TaskTombstone(task_id=pk) for pk in sorted(found)]
+        )
+        before = [(state, user_id) for _, state, user_id in rows]
+        tasks_changed.send(
+          sender=Task,
+          changes=set(before),
+          events=[deleted_event(state, user_id) for state, user_id in set(before)],
+          deltas=diff(before=before),
+        )
+    return Response(
+      {"deleted": len(found), "not_found": sorted(ids - found)}
+    )
+
+  @action(detail=False, methods=["post"])
+  def transition(self, request):
+    """
+    Mueve un lote de tareas a otro estado con un único ``UPDATE`` condicional.
+
+    Solo se mueven las tareas cuyo estado actual permite pasar al destino
+    (``Task.StateChoices.allowed_sources``); el resto se deja como está. Las
+    tareas se eligen por ``ids`` o, si no se indican, con los mismos filtros
+    del listado (``?state=``, ``?assigned_user__username=``...).
+    """
+    serializer = TaskTransitionSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    target = serializer.validated_data["state"]
+    ids = serializer.validated_data.get("ids")
+
+    if ids is not None:
+      queryset = self.get_queryset().filter(pk__in=ids)
+    elif self.has_list_filters(request):
+      queryset = self.filter_queryset(self.get_queryset())
+    else:
+      raise serializers.ValidationError(
+        {"ids": ["Indique los ids de las tareas o algún filtro."]}
+      )
+
+    sources = Task.StateChoices.allowed_sources(target)
+    queryset = queryset.filter(state__in=sources)
+    with transaction.atomic(savepoint=False):
+      # Se bloquean las tareas a mover y se actualizan por id: así los
+      # contadores (y los listados que se invalidan) cuadran exactamente con
+      # las filas que cambian, aunque otros escriban a la vez.
+      rows = list(
+        queryset.select_for_update(of=("self",))
+        .order_by()
+        .values_list("pk", "state", "assigned_user_id")
+      )
+      moved = 0
+      if rows:
+        moved = Task.objects.filter(pk__in=[pk for pk, _, _ in rows]).update(
+          state=target, updated_at=timezone.now()
+        )
+      before = [(state, user_id) for _, state, user_id in rows]
+      previous = set(before)
+      tasks_changed.send(
+        sender=Task,
+        changes=previous | {(target, user_id) for _, user_id in previous},
+        events=[moved_event(target, user_id, state) for state, user_id in previous],
+        deltas=diff(before, [(target, user_id) for _, user_id in before]),
+      )
+    return Response({"state": target, "from": sources, "moved": moved})
+
+  def has_list_filters(self, request):
+    """
+    Si la petición filtra de verdad las tareas: algún filtro del listado o
+    ``?search=`` con valor. ``?format=``, ``?ordering=``, ``?page_size=``
+    o un filtro vacío no cuentan (un filtro inválido sí, para que
+    ``filter_queryset`` lo rechace).
+    """
+    filterset = DjangoFilterBackend().get_filterset(request, self.get_queryset(), self)
+    if filterset is not None:
+      if not filterset.is_valid():
+        return True
+      if any(value not in (None, "", [], ()) for value in filterset.form.cleaned_data.values()):
+        return True
+    return bool(TaskSearchFilter().get_search_terms(request))
+
+  @action(detail=False, methods=["get"])
+  def board(self, request):
+    """
+    Tablero Kanban en una sola petición: por cada estado del flujo, el total
+    de tareas y las primeras ``?limit=`` tarjetas (por fecha de entrega y
+    prioridad).
+
+    Admite los filtros del listado (p. ej. ``?assigned_user__username=``).
+    Son dos consultas (un ``GROUP BY`` y un ``ROW_NUMBER()`` por estado), y
+    se serializan como mucho ``limit`` tarjetas por columna.
+    """
+    params = TaskBoardSerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    queryset = self.filter_queryset(self.get_queryset()).defer("search_vector")
+    encoder = self.get_row_encoder()
+    columns = build_board(queryset, params.validated_data["limit"], encoder)
+    for column in columns:
+      cards = column["cards"]
+      if encoder is not None:
+        column["cards"] = encoder.encode_many(cards)
+      else:
+        column["cards"] = self.get_serializer(cards, many=True).data
+    return Response({"columns": columns})
+
+  @action(detail=False, methods=["get"])
+  def changes(self, request):
+    """
+    Sincronización incremental: tareas creadas o modificadas y ids de tareas
+    eliminadas desde el cursor ``?since=`` (sin él, todas las tareas).
+
+    La respuesta trae en ``next`` el cursor para la siguiente llamada; si
+    ``has_more`` es verdadero quedan cambios y conviene pedirlos enseguida.
+    Los filtros del listado no se aplican: un cliente filtrado no sabría
+    cuándo una tarea deja de cumplirlos.
+    """
+    since = request.query_params.get("since")
+    queryset = self.get_queryset().defer("search_vector")
+    encoder = self.get_row_encoder()
+    if encoder is not None:
+      queryset = encoder.values(queryset, "updated_at", "id")
+    tasks, deleted, cursor, has_more = collect_changes(
+      queryset,
+      decode_since(since) if since else None,
+      self.paginator.get_page_size(request),
+    )
+    if encoder is not None:
+      changed = encoder.encode_many(tasks)
+    else:
+      changed = self.get_serializer(tasks, many=True).data
+    return Response(
+      {
+        "changed": changed,
+        "deleted": deleted,
+        "next": cursor,
+        "has_more": has_more,
+      }
+    )
+
+  @action(detail=False, methods=["get"], renderer_classes=[NDJSONRenderer, CSVRenderer])
+  def export(self, request):
+    """
+    Exporta las tareas filtradas como NDJSON (por defecto) o CSV
+    (``?format=csv`` o ``Accept: text/csv``).
+
+    La consulta se recorre con un cursor del servidor en bloques de
+    ``API_EXPORT_CHUNK_SIZE`` filas y cada fila se envía en cuanto se
+    serializa, así que la memoria no crece con el número de tareas. Bajo
+    ASGI el contenido es un iterador asíncrono (ver ``aiter_chunks``).
+    """
+    queryset = self.filter_queryset(self.get_queryset()).defer("search_vector")
+    serializer = self.get_serializer()
+    encoder = self.get_row_encoder()
+    if encoder is not None:
+      rows = encode_rows(encoder, queryset, settings.API_EXPORT_CHUNK_SIZE)
+    else:
+      rows = serialize_rows(serializer, queryset, settings.API_EXPORT_CHUNK_SIZE)
+
+    renderer = request.accepted_renderer
+    if renderer.format == CSVRenderer.format:
+      content = stream_csv(rows, list(serializer.fields))
+    else:
+      content = stream_ndjson(rows)
+    if isinstance(request._request, ASGIRequest):
+      content = aiter_chunks(content, settings.API_EXPORT_CHUNK_SIZE)
+
+    response = StreamingHttpResponse(
+      content, content_type=f"{renderer.media_type}; charset={renderer.charset}"
+    )
+    response["Content-Disposition"] = (
+      f'attachment; filename="tasks.{renderer.format}"'
+    )
+    return response
+
+  @action(
+    detail=False,
+    methods=["post"],
+    url_path="import",
+    url_name="import",
+    parser_classes=[MultiPartParser],
+  )
+  def import_tasks(self, request):
+    """
+    Importa tareas desde un fichero CSV o NDJSON subido en el campo ``file``.
+
+    ``assigned_user`` se indica por ``username``. El fichero se lee fila a
+    fila (ver ``importer.TaskImporter``): las filas válidas se insertan y las
+    inválidas se devuelven en ``errors`` con su número de fila.
+    """
+    upload = request.FILES.get("file")
+    if upload is None:
+      raise serializers.ValidationError({"file": ["Este campo es requerido."]})
+
+    file_format = request.data.get("file_format") or detect_format(upload.name)
+    if file_format not in ("csv", "ndjson"):
+      raise serializers.ValidationError(
+        {"file_format": ["Formato no soportado; use csv o ndjson."]}
+      )
+
+    try:
+      report = TaskImporter().run(read_rows(upload, file_format))
+    except ImportFileError as exc:
+      raise serializers.ValidationError({"file": [str(exc)]})
+    return Response(report)
 
-def get_queryset(self):
-        queryset = super().get_queryset()
-        ordering = self.request.query_params.get('ordering', '')
-        
-        if ordering == 'priority':
-            return queryset.order_by('priority')  # Orden alfabético ascendente
-        elif ordering == '-priority':
-            return queryset.order_by('-priority')  # Orden alfabético descendente
-        
-        return queryset
 
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
@@ -57,6 +406,7 @@ class RegisterView(generics.CreateAPIView):
             headers=headers
         )
 
+
 class CustomAuthToken(ObtainAuthToken):
   def post(self, request, *args, **kwargs):
     serializer = self.serializer_class(
@@ -70,3 +420,99 @@ class CustomAuthToken(ObtainAuthToken):
     )
 
   ordering_fields = ["due_date", "priority"]
+
+
+class DatabaseStatsView(APIView):
+  """
+  Conexiones y pool de cada base de datos en el proceso que atiende la
+  petición (ver ``db_stats.database_stats``). Solo para administradores.
+  """
+
+  permission_classes = [permissions.IsAdminUser]
+
+  def get(self, request):
+    return Response(database_stats())
+
+
+class TaskCountsView(generics.ListAPIView):
+  """
+  Número de tareas de cada usuario en cada estado, leído de ``TaskCounter``
+  (una fila por par, sin contar tareas). ``assigned_user`` nulo son las
+  tareas sin asignar; los pares sin tareas no aparecen.
+
+  Admite ``?assigned_user__username=`` y ``?state=`` (repetible).
+  """
+
+  serializer_class = TaskCounterSerializer
+  pagination_class = None
+
+  def get_queryset(self):
+    queryset = TaskCounter.objects.select_related("user").exclude(count=0)
+    username = self.request.query_params.get("assigned_user__username")
+    if username:
+      queryset = queryset.filter(user__username=username)
+    states = self.request.query_params.getlist("state")
+    if states:
+      invalid = sorted(set(states) - set(Task.StateChoices.values))
+      if invalid:
+        raise serializers.ValidationError(
+          {"state": [f'"{state}" no es un estado válido.' for state in invalid]}
+        )
+      queryset = queryset.filter(state__in=states)
+    return queryset
+
+
+async def task_events(request):
+  """
+  Server-Sent Events con las altas, cambios y bajas de tareas, para que los
+  tableros dejen de consultar el listado periódicamente.
+
+  Admite los filtros ``?state=`` (repetible) y ``?assigned_user__username=``;
+  un evento llega si la tarea cumple el filtro antes o después del cambio.
+  Solo con la aplicación ASGI: bajo WSGI la respuesta no se enviaría hasta
+  cerrar la conexión y ocuparía un hilo del servidor mientras tanto, así que
+  se responde 501 y se remite a ``/tasks/changes/``.
+  """
+  if request.method != "GET":
+    return HttpResponseNotAllowed(["GET"])
+  if not isinstance(request, ASGIRequest):
+    return JsonResponse(
+      {
+        "detail": "Los eventos solo se sirven con SERVER_MODE=asgi; "
+        "sincronice con /api/tasks/changes/."
+      },
+      status=status.HTTP_501_NOT_IMPLEMENTED,
+    )
+  try:
+    credentials = await sync_to_async(CachedTokenAuthentication().authenticate)(
+      request
+    )
+    if credentials is None:
+      raise NotAuthenticated()
+  except (AuthenticationFailed, NotAuthenticated) as exc:
+    return JsonResponse({"detail": exc.detail}, status=exc.status_code)
+
+  states = request.GET.getlist("state")
+  invalid = sorted(set(states) - set(Task.StateChoices.values))
+  if invalid:
+    return JsonResponse(
+      {"state": [f'"{state}" no es un estado válido.' for state in invalid]},
+      status=status.HTTP_400_BAD_REQUEST,
+    )
+  user_id = None
+  username = request.GET.get("assigned_user__username")
+  if username:
+    user_id = await User.objects.filter(username=username).values_list(
+      "pk", flat=True
+    ).afirst()
+    # Un usuario inexistente no tiene tareas: la suscripción no recibe nada.
+    user_id = user_id or 0
+
+  subscription = events.subscribe(states=states or None, user_id=user_id)
+  response = StreamingHttpResponse(
+    events.EventStream(subscription), content_type="text/event-stream"
+  )
+  response["Cache-Control"] = "no-cache"
+  # Que nginx no acumule la respuesta antes de enviarla.
+  response["X-Accel-Buffering"] = "no"
+  return response
@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 import os
 import sys
 from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
 #from dotenv import load_dotenv
 
 
@@ -35,7 +37,10 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 # DEBUG = True
 DEBUG = os.getenv("DEBUG") == "True"
 
-ALLOWED_HOSTS = []
+# Nombres de host servidos, separados por comas (obligatorio con DEBUG=False).
+ALLOWED_HOSTS = [
+  host.strip() for host in os.getenv("ALLOWED_HOSTS", "").split(",") if host.strip()
+]
 
 
 # Application definition
@@ -57,22 +62,205 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
   "DEFAULT_AUTHENTICATION_CLASSES": [
-    "rest_framework.authentication.TokenAuthentication",  # Autenticación por tokens
+    "app_tareas.authentication.CachedTokenAuthentication",  # Autenticación por tokens (cacheada)
   ],
   "DEFAULT_PERMISSION_CLASSES": [
     "rest_framework.permissions.IsAuthenticated",  # Protege todas las vistas por defecto
   ],
 }
 
+# JSON con orjson (API_FAST_JSON=false vuelve al de DRF), MessagePack bajo
+# demanda (``Accept: application/msgpack``, requiere el paquete msgpack) y la
+# API navegable solo con DEBUG.
+API_FAST_JSON = os.getenv("API_FAST_JSON", "true").lower() in ("1", "true", "yes")
+API_MSGPACK = os.getenv("API_MSGPACK", "false").lower() in ("1", "true", "yes")
+if API_FAST_JSON:
+  REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ["app_tareas.renderers.FastJSONRenderer"]
+  REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = ["app_tareas.parsers.FastJSONParser"]
+else:
+  REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ["rest_framework.renderers.JSONRenderer"]
+  REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = ["rest_framework.parsers.JSONParser"]
+REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] += [
+  "rest_framework.parsers.FormParser",
+  "rest_framework.parsers.MultiPartParser",
+]
+if API_MSGPACK:
+  REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append("app_tareas.renderers.MessagePackRenderer")
+  REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].append("app_tareas.parsers.MessagePackParser")
+if DEBUG:
+  REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+    "rest_framework.renderers.BrowsableAPIRenderer"
+  )
+
+# Caché: memoria local por defecto; en despliegues con varios procesos se puede
+# apuntar a un backend compartido (Redis, Memcached) desde el entorno.
+CACHES = {
+  "default": {
+    "BACKEND": os.getenv(
+      "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+    ),
+    "LOCATION": os.getenv("CACHE_LOCATION", ""),
+  }
+}
+
+# Procesos que sirven la aplicación (gunicorn.conf.py exporta su número de
+# workers). Con más de uno, LocMemCache no es compartida: lo que un worker
+# invalida sigue vigente en los demás, así que las cachés que deben verse
+# igual en todos se desactivan salvo que apunten a un backend compartido.
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "1"))
+
+
+def process_local_cache(alias):
+  return SERVER_WORKERS > 1 and CACHES[alias]["BACKEND"].endswith("LocMemCache")
+
+
+# Caché de los listados de tareas (por usuario y filtros), invalidada desde
+# las señales de Task. Con LocMemCache se acota con MAX_ENTRIES; con un
+# backend compartido, con la política de desalojo del propio servidor.
+TASK_LIST_CACHE_ALIAS = "task_lists"
+CACHES[TASK_LIST_CACHE_ALIAS] = {
+  "BACKEND": os.getenv(
+    "TASK_LIST_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+  ),
+  "LOCATION": os.getenv("TASK_LIST_CACHE_LOCATION", "task-lists"),
+  "TIMEOUT": int(os.getenv("TASK_LIST_CACHE_TIMEOUT", "60")),
+}
+if CACHES[TASK_LIST_CACHE_ALIAS]["BACKEND"].endswith("LocMemCache"):
+  CACHES[TASK_LIST_CACHE_ALIAS]["OPTIONS"] = {
+    "MAX_ENTRIES": int(os.getenv("TASK_LIST_CACHE_MAX_ENTRIES", "1000")),
+  }
+# Como la caché de tokens: con LocMemCache y varios workers, un listado
+# invalidado en un worker se seguiría sirviendo desde los demás.
+TASK_LIST_CACHE = os.getenv(
+  "TASK_LIST_CACHE", str(not process_local_cache(TASK_LIST_CACHE_ALIAS))
+).lower() in ("1", "true", "yes")
+
+# Resolución token→usuario cacheada por CachedTokenAuthentication. Por defecto
+# solo con una caché compartida o un único proceso: con LocMemCache y varios
+# workers, un token revocado seguiría autenticando en los otros workers hasta
+# AUTH_TOKEN_CACHE_TIMEOUT.
+AUTH_TOKEN_CACHE_ALIAS = os.getenv("AUTH_TOKEN_CACHE_ALIAS", "default")
+AUTH_TOKEN_CACHE_TIMEOUT = int(os.getenv("AUTH_TOKEN_CACHE_TIMEOUT", "300"))
+AUTH_TOKEN_CACHE = os.getenv(
+  "AUTH_TOKEN_CACHE", str(not process_local_cache(AUTH_TOKEN_CACHE_ALIAS))
+).lower() in ("1", "true", "yes")
+
+# Paginación por cursor de los listados: tamaño por defecto y límite de ?page_size=
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "50"))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "500"))
+
+# Campos de cada tarea en el listado y el tablero si no se pide ?fields=
+# (``__all__``: todos, como en el detalle).
+API_LIST_FIELDS = os.getenv(
+  "API_LIST_FIELDS", "id,name,state,priority,due_date,assigned_user"
+).split(",")
+
+# Acciones de TaskViewSet que leen con ``values_list`` y un codificador de
+# filas en lugar del serializador (misma salida). Vacío: ninguna.
+API_FAST_READS = [
+  action
+  for action in os.getenv("API_FAST_READS", "list,board,changes,export").split(",")
+  if action
+]
+
+# Tablero: tarjetas por columna si no se indica ?limit=
+API_BOARD_CARDS = int(os.getenv("API_BOARD_CARDS", "10"))
+
+# Operaciones por lote: elementos máximos por petición y filas por INSERT/UPDATE
+API_MAX_BULK_SIZE = int(os.getenv("API_MAX_BULK_SIZE", "1000"))
+API_BULK_BATCH_SIZE = int(os.getenv("API_BULK_BATCH_SIZE", "500"))
+
+# Exportación en streaming: filas leídas por vuelta del cursor del servidor
+API_EXPORT_CHUNK_SIZE = int(os.getenv("API_EXPORT_CHUNK_SIZE", "2000"))
+
+# Importación: filas validadas por bloque y errores máximos en el informe
+API_IMPORT_CHUNK_SIZE = int(os.getenv("API_IMPORT_CHUNK_SIZE", "1000"))
+API_IMPORT_MAX_ERRORS = int(os.getenv("API_IMPORT_MAX_ERRORS", "1000"))
+
+# Sincronización incremental: días que se conservan los registros de tareas
+# eliminadas (un cursor más antiguo obliga a sincronizar desde cero).
+API_SYNC_TOMBSTONE_DAYS = int(os.getenv("API_SYNC_TOMBSTONE_DAYS", "30"))
+# Segundos que el cursor se queda por detrás del momento actual para no saltarse
+# las escrituras que confirman tarde (ver ``sync.collect_changes``); debe
+# superar la transacción más larga (las peticiones no pasan de GUNICORN_TIMEOUT).
+API_SYNC_WINDOW_SECONDS = int(os.getenv("API_SYNC_WINDOW_SECONDS", "30"))
+
+# Eventos de tareas por SSE: eventos pendientes por suscriptor antes de
+# desconectarlo, segundos entre keepalives y, con varios procesos, el puente
+# LISTEN/NOTIFY de PostgreSQL (TASK_EVENTS_BRIDGE=postgres).
+TASK_EVENTS_QUEUE_SIZE = int(os.getenv("TASK_EVENTS_QUEUE_SIZE", "100"))
+TASK_EVENTS_HEARTBEAT = float(os.getenv("TASK_EVENTS_HEARTBEAT", "15"))
+TASK_EVENTS_BRIDGE = os.getenv("TASK_EVENTS_BRIDGE", "")
+TASK_EVENTS_CHANNEL = os.getenv("TASK_EVENTS_CHANNEL", "task_events")
+
+# Listado y detalle de tareas con vistas asíncronas (solo tiene sentido al
+# servir la aplicación ASGI; bajo WSGI cada petición pagaría la conversión).
+API_ASYNC_READS = os.getenv("API_ASYNC_READS", "false").lower() in ("1", "true", "yes")
+
+# Compresión de respuestas: codificaciones por orden de preferencia (br y zstd
+# solo si están instalados brotli y zstandard; vacío la desactiva), tipos de
+# contenido que se comprimen, tamaño mínimo en bytes (las respuestas en
+# streaming se comprimen siempre) y nivel de cada algoritmo. Los eventos SSE
+# no se comprimen: el compresor retendría los eventos hasta llenar su búfer.
+# HTML no se comprime por defecto: las páginas del admin reflejan datos de la
+# petición junto al token CSRF, y comprimirlas las expone a BREACH.
+COMPRESSION_ENCODINGS = [
+  name.strip()
+  for name in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")
+  if name.strip()
+]
+COMPRESSION_CONTENT_TYPES = [
+  name.strip()
+  for name in os.getenv(
+    "COMPRESSION_CONTENT_TYPES",
+    "application/json,application/x-ndjson,application/msgpack,text/csv,"
+    "text/plain,text/css,application/javascript",
+  ).split(",")
+  if name.strip()
+]
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_LEVELS = {
+  "gzip": int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+  "br": int(os.getenv("COMPRESSION_BROTLI_LEVEL", "4")),
+  "zstd": int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3")),
+}
+
+# Middleware de sesiones, CSRF, usuario y mensajes: solo lo necesita el admin.
+# Con API_LEAN_MIDDLEWARE (por defecto) se sustituye, en el mismo sitio de la
+# cadena, por las subclases de SITE_MIDDLEWARE, que dejan pasar sin más las
+# peticiones bajo API_PATH_PREFIX (autenticadas con tokens).
+SITE_MIDDLEWARE = {
+  "django.contrib.sessions.middleware.SessionMiddleware": (
+    "app_tareas.middleware.SiteSessionMiddleware"
+  ),
+  "django.middleware.csrf.CsrfViewMiddleware": "app_tareas.middleware.SiteCsrfViewMiddleware",
+  "django.contrib.auth.middleware.AuthenticationMiddleware": (
+    "app_tareas.middleware.SiteAuthenticationMiddleware"
+  ),
+  "django.contrib.messages.middleware.MessageMiddleware": (
+    "app_tareas.middleware.SiteMessageMiddleware"
+  ),
+}
+API_PATH_PREFIX = "/api/"
+API_LEAN_MIDDLEWARE = os.getenv("API_LEAN_MIDDLEWARE", "true").lower() in ("1", "true", "yes")
+
 MIDDLEWARE = [
   "django.middleware.security.SecurityMiddleware",
+  "app_tareas.middleware.CompressionMiddleware",
   "django.contrib.sessions.middleware.SessionMiddleware",
   "django.middleware.common.CommonMiddleware",
   "django.middleware.csrf.CsrfViewMiddleware",
   "django.contrib.auth.middleware.AuthenticationMiddleware",
   "django.contrib.messages.middleware.MessageMiddleware",
   "django.middleware.clickjacking.XFrameOptionsMiddleware",
+  "app_tareas.middleware.ReplicaStickinessMiddleware",
 ]
+if API_LEAN_MIDDLEWARE:
+  MIDDLEWARE = [SITE_MIDDLEWARE.get(path, path) for path in MIDDLEWARE]
+  # ``check --deploy`` busca CsrfViewMiddleware por su ruta (security.W003);
+  # SiteCsrfViewMiddleware es una subclase y sigue exigiendo el token CSRF
+  # fuera de API_PATH_PREFIX.
+  SILENCED_SYSTEM_CHECKS = ["security.W003"]
 
 ROOT_URLCONF = "gestion_tareas.urls"
 
@@ -111,14 +299,81 @@ DATABASES = {
   }
 }
 
+# Reutilización de conexiones. Por defecto son persistentes (DB_CONN_MAX_AGE
+# segundos) y se comprueban antes de reutilizarlas; bajo ASGI no se reutilizan
+# entre peticiones, así que en ese modo el valor por defecto es 0. Con
+# DB_POOL=true se usa el pool de psycopg 3 (requiere "psycopg[pool]" en lugar
+# de psycopg2; Django no admite pool y conexiones persistentes a la vez). El
+# pool es por proceso: DB_POOL_MAX_SIZE debería cubrir los hilos del worker.
+DB_POOL = os.getenv("DB_POOL", "false").lower() in ("1", "true", "yes")
+DATABASES["default"]["CONN_MAX_AGE"] = 0 if DB_POOL else int(
+  os.getenv(
+    "DB_CONN_MAX_AGE", "0" if os.getenv("SERVER_MODE") == "asgi" else "60"
+  )
+)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = os.getenv(
+  "DB_CONN_HEALTH_CHECKS", "true"
+).lower() in ("1", "true", "yes")
+if DB_POOL:
+  DATABASES["default"]["OPTIONS"] = {
+    "pool": {
+      "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+      "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+      "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+      "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+      "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+    }
+  }
+
+# Réplicas de lectura: DB_REPLICA_HOSTS="host[:puerto],..." con las mismas
+# credenciales y ajustes de conexión que el primario (o DB_REPLICA_USER /
+# DB_REPLICA_PASSWORD). ReplicaRouter les envía las lecturas de tareas y
+# tokens; tras escribir, un cliente lee del primario REPLICA_STICKY_SECONDS
+# (debería superar el retraso de replicación habitual).
+DATABASE_REPLICAS = []
+for number, address in enumerate(
+  filter(None, map(str.strip, os.getenv("DB_REPLICA_HOSTS", "").split(","))), start=1
+):
+  host, _, port = address.partition(":")
+  alias = f"replica_{number}"
+  DATABASES[alias] = {
+    **DATABASES["default"],
+    "HOST": host,
+    "PORT": port or DATABASES["default"]["PORT"],
+    "USER": os.getenv("DB_REPLICA_USER") or DATABASES["default"]["USER"],
+    "PASSWORD": os.getenv("DB_REPLICA_PASSWORD") or DATABASES["default"]["PASSWORD"],
+    "TEST": {"MIRROR": "default"},
+  }
+  DATABASE_REPLICAS.append(alias)
+DATABASE_ROUTERS = ["app_tareas.routers.ReplicaRouter"]
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+# La marca de "acaba de escribir" la lee el worker que atienda la siguiente
+# petición del cliente, así que con varios workers tiene que guardarse en una
+# caché compartida.
+REPLICA_STICKY_CACHE_ALIAS = os.getenv("REPLICA_STICKY_CACHE_ALIAS", "default")
+if DATABASE_REPLICAS and process_local_cache(REPLICA_STICKY_CACHE_ALIAS):
+  raise ImproperlyConfigured(
+    "DB_REPLICA_HOSTS con varios workers requiere una caché compartida "
+    "(CACHE_BACKEND) para REPLICA_STICKY_CACHE_ALIAS."
+  )
+
 
 if 'test' in sys.argv:
     SECRET_KEY = 'django-insecure-dummy-key-for-tests'  # Key fija para testing
-    DATABASES['default'] = {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': ':memory:',
-        'TEST': {'NAME': None}
+    # La caché de listados sobreviviría al rollback de cada test; sus tests
+    # la activan explícitamente con override_settings.
+    CACHES[TASK_LIST_CACHE_ALIAS] = {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
     }
+    # SQLite en memoria salvo TEST_DB_BACKEND=postgres, que usa el servidor de
+    # DB_* (p. ej. el servicio "test-db" de docker-compose) para ejecutar
+    # también los tests propios de PostgreSQL.
+    if os.getenv('TEST_DB_BACKEND', 'sqlite') != 'postgres':
+        DATABASES['default'] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+            'TEST': {'NAME': None}
+        }
 else:
     SECRET_KEY = os.getenv('DJANGO_SECRET_KEY')  # Key desde .env en desarrollo/producción
 
@@ -0,0 +1,75 @@
+"""
+Configuración de Gunicorn para producción (``gunicorn -c gunicorn.conf.py``).
+
+Se lee del mismo entorno que ``settings.py`` (``.env``). ``SERVER_MODE``
+elige la aplicación: ``wsgi`` (por defecto, workers ``gthread``) o ``asgi``
+(workers de Uvicorn, necesario para ``/api/tasks/events/`` y las vistas
+asíncronas de ``API_ASYNC_READS``).
+
+Recarga sin cortar conexiones: ``kill -HUP`` arranca workers nuevos con la
+configuración releída y retira los antiguos cuando terminan sus peticiones.
+Con ``preload_app`` el código ya está cargado en el maestro, así que para
+desplegar código nuevo se usa ``kill -USR2`` (nuevo maestro) seguido de
+``kill -TERM`` al antiguo, o se reinicia el contenedor.
+"""
+
+import multiprocessing
+import os
+
+
+# docker-compose pasa las variables vacías de .env como "": se tratan como
+# no definidas.
+def env_int(name, default):
+  return int(os.getenv(name) or default)
+
+
+def env_bool(name, default):
+  return (os.getenv(name) or str(default)).lower() in ("1", "true", "yes")
+
+
+SERVER_MODE = os.getenv("SERVER_MODE", "wsgi")
+
+if SERVER_MODE == "asgi":
+  wsgi_app = "gestion_tareas.asgi:application"
+  worker_class = "uvicorn.workers.UvicornWorker"
+else:
+  wsgi_app = "gestion_tareas.wsgi:application"
+  worker_class = "gthread"
+
+bind = os.getenv("GUNICORN_BIND") or f"0.0.0.0:{os.getenv('PORT') or '8000'}"
+
+# Un worker por núcleo más uno (cada uno con sus hilos) mantiene ocupadas las
+# CPU mientras otros workers esperan a la base de datos.
+workers = env_int("WEB_CONCURRENCY", multiprocessing.cpu_count() + 1)
+# settings.py lo lee para no fiarse de LocMemCache cuando hay varios procesos
+# (se carga después de este fichero, en el maestro o en cada worker).
+os.environ.setdefault("SERVER_WORKERS", str(workers))
+threads = env_int("GUNICORN_THREADS", 4)
+keepalive = env_int("GUNICORN_KEEPALIVE", 5)
+timeout = env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+
+# Reciclar workers de vez en cuando acota la memoria que puedan ir acumulando;
+# el jitter evita que se reinicien todos a la vez.
+max_requests = env_int("GUNICORN_MAX_REQUESTS", 2000)
+max_requests_jitter = env_int("GUNICORN_MAX_REQUESTS_JITTER", 200)
+
+# Django se importa una vez en el maestro y los workers comparten esa memoria
+# (copy-on-write). Incompatible con ``reload``, pensado solo para desarrollo.
+reload = env_bool("GUNICORN_RELOAD", False)
+preload_app = env_bool("GUNICORN_PRELOAD", not reload)
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+
+def pre_fork(server, worker):
+  # Una conexión que el maestro haya abierto al precargar no se puede
+  # compartir con los workers: se cierra en el maestro antes de cada fork y
+  # cada worker abre las suyas.
+  if preload_app:
+    from django.db import connections
+
+    connections.close_all()